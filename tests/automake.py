@@ -0,0 +1,160 @@
+"""Tests for the automake Makefile.am classes."""
+
+import unittest
+
+from vstools import automake
+
+from tests import test_lib
+
+
+class MakefileAmTest(test_lib.BaseTestCase):
+    """Makefile.am tests."""
+
+    # pylint: disable=protected-access
+
+    _MAKEFILE_AM_DATA = "\n".join(
+        [
+            "# Comment",
+            "AM_CPPFLAGS = \\",
+            "\t-I../include -I$(top_srcdir)/include \\",
+            "\t@LIBCERROR_CPPFLAGS@",
+            "",
+            "check_PROGRAMS = \\",
+            "\tfoo_test_error \\",
+            "\tfoo_test_support",
+            "",
+            "if HAVE_FOO",
+            "check_PROGRAMS += foo_test_foo",
+            "else",
+            "check_PROGRAMS += foo_test_bar",
+            "endif",
+            "",
+            "foo_test_common_SOURCES = foo_test_macros.h",
+            "",
+            "foo_test_error_SOURCES = \\",
+            "\tfoo_test_error.c\\",
+            "\t$(foo_test_common_SOURCES)",
+            "",
+            "foo_test_error_LDADD = \\",
+            "\t../libfoo/libfoo.la",
+            "",
+            "check-local:",
+            "\tFOO=bar ./test_runner.sh",
+            "",
+        ]
+    )
+
+    def testReadLogicalLines(self):
+        """Tests the _ReadLogicalLines function."""
+        makefile_am = automake.MakefileAm("Makefile.am")
+
+        lines = ["FOO = \\\n", "\tfoo \\\n", "\tbar # comment\n", "\techo\n"]
+        logical_lines = list(makefile_am._ReadLogicalLines(lines))
+        self.assertEqual(logical_lines, [(1, "FOO = foo bar")])
+
+    def testGetPrograms(self):
+        """Tests the GetPrograms function."""
+        makefile_am = automake.MakefileAm("Makefile.am")
+        makefile_am.ReadData(self._MAKEFILE_AM_DATA.encode("utf8"))
+
+        self.assertEqual(
+            makefile_am.GetPrograms(),
+            ["foo_test_error", "foo_test_support", "foo_test_foo", "foo_test_bar"],
+        )
+
+    def testGetValues(self):
+        """Tests the GetValues function."""
+        makefile_am = automake.MakefileAm("Makefile.am")
+        makefile_am.ReadData(self._MAKEFILE_AM_DATA.encode("utf8"))
+
+        self.assertEqual(
+            makefile_am.GetValues("AM_CPPFLAGS"),
+            ["-I../include", "-I$(top_srcdir)/include", "@LIBCERROR_CPPFLAGS@"],
+        )
+        self.assertEqual(
+            makefile_am.GetValues("foo_test_error_SOURCES"),
+            ["foo_test_error.c", "foo_test_macros.h"],
+        )
+        self.assertEqual(makefile_am.GetValues("bogus"), [])
+
+        self.assertEqual(
+            makefile_am.GetValues("check_PROGRAMS", conditionals=["HAVE_FOO"]),
+            ["foo_test_error", "foo_test_support", "foo_test_foo"],
+        )
+        self.assertEqual(
+            makefile_am.GetValues("check_PROGRAMS", conditionals=[]),
+            ["foo_test_error", "foo_test_support", "foo_test_bar"],
+        )
+
+    def testGetValuesWithAssignmentAfterAssignment(self):
+        """Tests the GetValues function with an assignment after an assignment."""
+        makefile_am = automake.MakefileAm("Makefile.am")
+        makefile_am.ReadData(b"FOO = x\nFOO = y\nFOO += z\nFOO ?= w\n")
+
+        self.assertEqual(makefile_am.GetValues("FOO"), ["y", "z"])
+
+    def testGetValuesWithIfElse(self):
+        """Tests the GetValues function with if and else branches."""
+        makefile_am = automake.MakefileAm("Makefile.am")
+        makefile_am.ReadData(b"if HAVE_B\nSUBDIRS = a b\nelse\nSUBDIRS = a\nendif\n")
+
+        self.assertEqual(makefile_am.GetValues("SUBDIRS"), ["a", "b"])
+        self.assertEqual(
+            makefile_am.GetValues("SUBDIRS", conditionals=["HAVE_B"]), ["a", "b"]
+        )
+        self.assertEqual(makefile_am.GetValues("SUBDIRS", conditionals=[]), ["a"])
+
+    def testGetValuesWithRecursiveReference(self):
+        """Tests the GetValues function with a recursive reference."""
+        makefile_am = automake.MakefileAm("Makefile.am")
+        makefile_am.ReadData(b"FOO = foo $(BAR)\nBAR = bar $(FOO)\n")
+
+        self.assertEqual(makefile_am.GetValues("FOO"), ["foo", "bar", "$(FOO)"])
+        self.assertEqual(makefile_am.GetValues("BAR"), ["bar", "foo", "$(BAR)"])
+
+        # The partial expansions are not kept.
+        self.assertEqual(makefile_am._expanded_values, {})
+
+    def testGetVariableNames(self):
+        """Tests the GetVariableNames function."""
+        makefile_am = automake.MakefileAm("Makefile.am")
+        makefile_am.ReadData(self._MAKEFILE_AM_DATA.encode("utf8"))
+
+        self.assertEqual(
+            makefile_am.GetVariableNames(),
+            [
+                "AM_CPPFLAGS",
+                "check_PROGRAMS",
+                "foo_test_common_SOURCES",
+                "foo_test_error_SOURCES",
+                "foo_test_error_LDADD",
+            ],
+        )
+
+    def testReadData(self):
+        """Tests the ReadData function."""
+        makefile_am = automake.MakefileAm("Makefile.am")
+        makefile_am.ReadData(self._MAKEFILE_AM_DATA.encode("utf8"))
+
+        self.assertEqual(len(makefile_am.assignments), 7)
+
+        assignment = makefile_am.assignments[2]
+        self.assertEqual(assignment.name, "check_PROGRAMS")
+        self.assertEqual(assignment.operator, "+=")
+        self.assertEqual(assignment.value, "foo_test_foo")
+        self.assertEqual(assignment.conditions, ("HAVE_FOO",))
+        self.assertEqual(assignment.line_number, 11)
+
+        assignment = makefile_am.assignments[3]
+        self.assertEqual(assignment.conditions, ("!HAVE_FOO",))
+
+        assignment = makefile_am.assignments[5]
+        self.assertEqual(assignment.name, "foo_test_error_SOURCES")
+        self.assertEqual(
+            assignment.value, "foo_test_error.c $(foo_test_common_SOURCES)"
+        )
+        self.assertEqual(assignment.conditions, ())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,182 @@
+"""Tests for the batch conversion classes."""
+
+import os
+import unittest
+
+from vstools import batch
+
+from tests import test_lib
+
+
+class BatchConverterTest(test_lib.BaseTestCase):
+    """Batch converter tests."""
+
+    # pylint: disable=protected-access
+
+    def testGetWorkingDirectory(self):
+        """Tests the _GetWorkingDirectory function."""
+        batch_converter = batch.BatchConverter(["2022"])
+
+        with test_lib.TempDirectory() as temp_directory:
+            working_directory = batch_converter._GetWorkingDirectory(temp_directory)
+            self.assertEqual(working_directory, temp_directory)
+
+            input_sln_path = os.path.join(temp_directory, "msvscpp", "libfoo.sln")
+            working_directory = batch_converter._GetWorkingDirectory(input_sln_path)
+            self.assertEqual(working_directory, temp_directory)
+
+    def testOpen(self):
+        """Tests the Open function."""
+        conversion_options = batch.ConversionOptions()
+        conversion_options.python_path = "C:\\Python313"
+        conversion_options.with_dokany = True
+
+        batch_converter = batch.BatchConverter(
+            ["2022"], conversion_options=conversion_options
+        )
+        batch_converter.Open()
+
+        try:
+            for solution in (
+                batch_converter._libyal_solution,
+                batch_converter._solution,
+            ):
+                self.assertEqual(solution._python_path, "C:\\Python313")
+                self.assertTrue(solution._with_dokany)
+
+        finally:
+            batch_converter.Close()
+
+    @test_lib.skipUnlessHasTestFile(["2008.sln"])
+    @test_lib.skipUnlessHasTestFile(["2008.vcproj"])
+    def testConvertInputs(self):
+        """Tests the ConvertInputs function."""
+        current_working_directory = os.getcwd()
+
+        batch_converter = batch.BatchConverter(["2022"], jobs=2)
+        batch_converter.Open()
+
+        with test_lib.TempDirectory() as temp_directory:
+            malformed_input_directory = os.path.join(
+                temp_directory, "malformed", "msvscpp"
+            )
+            os.makedirs(malformed_input_directory)
+
+            malformed_input_path = os.path.join(
+                malformed_input_directory, "malformed.slnx"
+            )
+            with open(malformed_input_path, "w", encoding="utf8") as file_object:
+                file_object.write('<Solution>\n  <Project Path="libcerror\n')
+
+            input_paths = [
+                self._CreateTestSolution(
+                    os.path.join(temp_directory, "first", "msvscpp")
+                ),
+                os.path.join(temp_directory, "missing", "msvscpp", "missing.sln"),
+                malformed_input_path,
+                self._CreateTestSolution(
+                    os.path.join(temp_directory, "second", "msvscpp")
+                ),
+            ]
+
+            try:
+                batch_results = list(batch_converter.ConvertInputs(input_paths))
+            finally:
+                batch_converter.Close()
+
+            self.assertEqual(os.getcwd(), current_working_directory)
+
+            self.assertEqual(len(batch_results), 4)
+            self.assertEqual(
+                [batch_result.input_path for batch_result in batch_results],
+                input_paths,
+            )
+            self.assertEqual(
+                [batch_result.result for batch_result in batch_results],
+                [True, False, False, True],
+            )
+            self.assertIsNotNone(batch_results[2].error)
+
+            for name in ("first", "second"):
+                output_path = os.path.join(
+                    temp_directory, name, "vs2022", "libcerror", "libcerror.vcxproj"
+                )
+                self.assertTrue(os.path.isfile(output_path))
+
+            self.assertFalse(
+                os.path.exists(os.path.join(current_working_directory, "vs2022"))
+            )
+
+    @test_lib.skipUnlessHasTestFile(["2008.sln"])
+    @test_lib.skipUnlessHasTestFile(["2008.vcproj"])
+    def testGetWatchedPaths(self):
+        """Tests the _GetWatchedPaths function."""
+        batch_converter = batch.BatchConverter(["2022"])
+
+        with test_lib.TempDirectory() as temp_directory:
+            input_sln_path = self._CreateTestSolution(
+                os.path.join(temp_directory, "first", "msvscpp")
+            )
+
+            watched_paths = batch_converter._GetWatchedPaths(input_sln_path)
+            self.assertEqual(len(watched_paths), 4)
+            self.assertEqual(watched_paths[0], input_sln_path)
+
+            input_directory = os.path.join(temp_directory, "first")
+            os.mkdir(os.path.join(input_directory, "libfoo"))
+            os.mkdir(os.path.join(input_directory, "vs2022"))
+
+            watched_paths = batch_converter._GetWatchedPaths(input_directory)
+            self.assertEqual(
+                watched_paths,
+                [
+                    os.path.join(input_directory, "configure.ac"),
+                    os.path.join(input_directory, "libfoo", "Makefile.am"),
+                    os.path.join(input_directory, "msvscpp", "Makefile.am"),
+                    input_sln_path,
+                ],
+            )
+
+    @test_lib.skipUnlessHasTestFile(["2008.sln"])
+    @test_lib.skipUnlessHasTestFile(["2008.vcproj"])
+    def testWatchInputs(self):
+        """Tests the WatchInputs function."""
+        batch_converter = batch.BatchConverter(["2022"])
+        batch_converter.Open()
+
+        with test_lib.TempDirectory() as temp_directory:
+            input_sln_path = self._CreateTestSolution(
+                os.path.join(temp_directory, "first", "msvscpp")
+            )
+
+            batch_results = batch_converter.WatchInputs([input_sln_path], interval=0.01)
+
+            try:
+                batch_result = next(batch_results)
+                self.assertTrue(batch_result.result)
+
+                output_path = os.path.join(
+                    temp_directory, "first", "vs2022", "libcerror", "libcerror.vcxproj"
+                )
+                os.utime(output_path, ns=(0, 0))
+
+                project_path = os.path.join(
+                    os.path.dirname(input_sln_path), "libcerror", "libcerror.vcproj"
+                )
+                stat_object = os.stat(project_path)
+                os.utime(project_path, ns=(0, stat_object.st_mtime_ns + 1000000000))
+
+                batch_result = next(batch_results)
+                self.assertEqual(batch_result.input_path, input_sln_path)
+                self.assertTrue(batch_result.result)
+
+            finally:
+                batch_results.close()
+                batch_converter.Close()
+
+            # The unchanged project file is not written again.
+            self.assertEqual(os.stat(output_path).st_mtime_ns, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
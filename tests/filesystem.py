@@ -0,0 +1,158 @@
+"""Tests for the file system classes."""
+
+import os
+import unittest
+
+from vstools import filesystem
+
+from tests import test_lib
+
+
+class FileModificationIndexTest(test_lib.BaseTestCase):
+    """File modification index tests."""
+
+    def testUpdate(self):
+        """Tests the Update function."""
+        file_modification_index = filesystem.FileModificationIndex()
+
+        with test_lib.TempDirectory() as temp_directory:
+            path = os.path.join(temp_directory, "Makefile.am")
+            paths = [path, os.path.join(temp_directory, "bogus")]
+
+            self.assertFalse(file_modification_index.Update([]))
+            self.assertTrue(file_modification_index.Update(paths))
+            self.assertFalse(file_modification_index.Update(paths))
+
+            with open(path, "w", encoding="utf8") as file_object:
+                file_object.write("SUBDIRS =\n")
+
+            self.assertTrue(file_modification_index.Update(paths))
+            self.assertFalse(file_modification_index.Update(paths))
+
+            os.remove(path)
+
+            self.assertTrue(file_modification_index.Update(paths))
+
+
+class FileSystemSnapshotTest(test_lib.BaseTestCase):
+    """File system snapshot tests."""
+
+    # pylint: disable=protected-access
+
+    def _CreateTestFiles(self, temp_directory):
+        """Creates test files.
+
+        Args:
+          temp_directory (str): path of the temporary directory.
+        """
+        os.mkdir(os.path.join(temp_directory, "libfoo"))
+        with open(
+            os.path.join(temp_directory, "configure.ac"), "w", encoding="utf8"
+        ) as file_object:
+            file_object.write("AC_INIT(\n")
+
+    def testGetDirectoryEntries(self):
+        """Tests the _GetDirectoryEntries function."""
+        file_system_snapshot = filesystem.FileSystemSnapshot()
+
+        with test_lib.TempDirectory() as temp_directory:
+            self._CreateTestFiles(temp_directory)
+
+            directory_entries = file_system_snapshot._GetDirectoryEntries(
+                temp_directory
+            )
+            self.assertEqual(directory_entries, {"configure.ac": False, "libfoo": True})
+
+            directory_entries = file_system_snapshot._GetDirectoryEntries(
+                os.path.join(temp_directory, "bogus")
+            )
+            self.assertIsNone(directory_entries)
+
+            # Test a directory that cannot be read.
+            directory_entries = file_system_snapshot._GetDirectoryEntries(
+                os.path.join(temp_directory, "x" * 1024)
+            )
+            self.assertIsNone(directory_entries)
+
+        self.assertEqual(file_system_snapshot.number_of_scandir_calls, 3)
+        self.assertEqual(file_system_snapshot.number_of_avoided_calls, 0)
+
+    def testExists(self):
+        """Tests the Exists function."""
+        file_system_snapshot = filesystem.FileSystemSnapshot()
+
+        with test_lib.TempDirectory() as temp_directory:
+            self._CreateTestFiles(temp_directory)
+
+            path = os.path.join(temp_directory, "configure.ac")
+            self.assertTrue(file_system_snapshot.Exists(path))
+
+            os.remove(path)
+
+            # The snapshot is not updated when the file system changes.
+            self.assertTrue(file_system_snapshot.Exists(path))
+
+            path = os.path.join(temp_directory, "bogus")
+            self.assertFalse(file_system_snapshot.Exists(path))
+
+            path = os.path.join(temp_directory, "bogus", "configure.ac")
+            self.assertFalse(file_system_snapshot.Exists(path))
+
+        self.assertEqual(file_system_snapshot.number_of_scandir_calls, 2)
+        self.assertEqual(file_system_snapshot.number_of_avoided_calls, 2)
+
+    def testIsDirectory(self):
+        """Tests the IsDirectory function."""
+        file_system_snapshot = filesystem.FileSystemSnapshot()
+
+        with test_lib.TempDirectory() as temp_directory:
+            self._CreateTestFiles(temp_directory)
+
+            path = os.path.join(temp_directory, "libfoo")
+            self.assertTrue(file_system_snapshot.IsDirectory(path))
+
+            path = os.path.join(temp_directory, "configure.ac")
+            self.assertFalse(file_system_snapshot.IsDirectory(path))
+
+            path = os.path.join(temp_directory, "bogus")
+            self.assertFalse(file_system_snapshot.IsDirectory(path))
+
+        self.assertEqual(file_system_snapshot.number_of_scandir_calls, 1)
+        self.assertEqual(file_system_snapshot.number_of_avoided_calls, 2)
+
+    def testListDirectory(self):
+        """Tests the ListDirectory function."""
+        file_system_snapshot = filesystem.FileSystemSnapshot()
+
+        with test_lib.TempDirectory() as temp_directory:
+            self._CreateTestFiles(temp_directory)
+
+            names = file_system_snapshot.ListDirectory(temp_directory)
+            self.assertEqual(names, os.listdir(temp_directory))
+
+            names = file_system_snapshot.ListDirectory(
+                os.path.join(temp_directory, "bogus")
+            )
+            self.assertEqual(names, [])
+
+
+class FileUpdaterTest(test_lib.BaseTestCase):
+    """File updater tests."""
+
+    def testUpdateFile(self):
+        """Tests the UpdateFile function."""
+        file_updater = filesystem.FileUpdater()
+
+        with test_lib.TempDirectory() as temp_directory:
+            path = os.path.join(temp_directory, "libfoo.vcxproj")
+
+            self.assertTrue(file_updater.UpdateFile(path, b"data1"))
+            self.assertFalse(file_updater.UpdateFile(path, b"data1"))
+            self.assertTrue(file_updater.UpdateFile(path, b"data2"))
+
+            with open(path, "rb") as file_object:
+                self.assertEqual(file_object.read(), b"data2")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,6 +1,9 @@
 """Tests for the libyal sources classes."""
 
+import os
+import pickle
 import unittest
+import uuid
 
 from vstools import libyal
 from vstools import resources
@@ -225,6 +228,128 @@ class VSDebugPythonDllVSProjectConfiguration(test_lib.BaseTestCase):
         self.assertEqual(configuration.library_directories, ["C:\\Python27\\libs"])
 
 
+class MakefileAmCacheTest(test_lib.BaseTestCase):
+    """Makefile.am cache tests."""
+
+    # pylint: disable=protected-access
+
+    _MAKEFILE_AM_DATA = "\n".join(
+        [
+            "check_PROGRAMS = \\",
+            "\tfoo_test_error \\",
+            "\tfoo_test_support",
+            "",
+            "foo_test_error_SOURCES = \\",
+            "\tfoo_test_error.c \\",
+            "\tfoo_test_macros.h",
+            "",
+        ]
+    )
+
+    def testGetMakefileAm(self):
+        """Tests the GetMakefileAm function."""
+        with test_lib.TempDirectory() as temp_directory:
+            makefile_am_path = os.path.join(temp_directory, "Makefile.am")
+            with open(makefile_am_path, "w", encoding="utf8") as file_object:
+                file_object.write(self._MAKEFILE_AM_DATA)
+
+            cache_path = os.path.join(temp_directory, "cache")
+            makefile_am_cache = libyal.MakefileAmCache(cache_path)
+
+            makefile_am = makefile_am_cache.GetMakefileAm(makefile_am_path)
+            self.assertEqual(makefile_am.path, makefile_am_path)
+            self.assertEqual(
+                makefile_am.GetPrograms(), ["foo_test_error", "foo_test_support"]
+            )
+            self.assertEqual(len(os.listdir(cache_path)), 2)
+
+            makefile_am_cache = libyal.MakefileAmCache(cache_path)
+
+            cached_makefile_am = makefile_am_cache.GetMakefileAm(makefile_am_path)
+            self.assertEqual(
+                cached_makefile_am.GetPrograms(), makefile_am.GetPrograms()
+            )
+            self.assertEqual(
+                cached_makefile_am.GetValues("foo_test_error_SOURCES"),
+                ["foo_test_error.c", "foo_test_macros.h"],
+            )
+
+    def testRemoveLeastRecentlyUsedEntries(self):
+        """Tests the _RemoveLeastRecentlyUsedEntries function."""
+        with test_lib.TempDirectory() as temp_directory:
+            makefile_am_cache = libyal.MakefileAmCache(temp_directory)
+
+            for key in ("first", "second", "third"):
+                makefile_am_cache._WriteEntry(key, {"assignments": []})
+
+            os.utime(makefile_am_cache._GetEntryPath("first"), ns=(1, 1))
+            os.utime(makefile_am_cache._GetEntryPath("second"), ns=(2, 2))
+
+            entry_size = os.path.getsize(makefile_am_cache._GetEntryPath("first"))
+            makefile_am_cache._maximum_size = entry_size * 2
+
+            makefile_am_cache._RemoveLeastRecentlyUsedEntries()
+
+            self.assertEqual(
+                sorted(os.listdir(temp_directory)), ["second.json", "third.json"]
+            )
+
+    def testWriteEntry(self):
+        """Tests the _WriteEntry function."""
+        with test_lib.TempDirectory() as temp_directory:
+            makefile_am_cache = libyal.MakefileAmCache(temp_directory)
+
+            makefile_am_cache._WriteEntry("first", {"assignments": []})
+            entry_size = os.path.getsize(makefile_am_cache._GetEntryPath("first"))
+            self.assertEqual(makefile_am_cache._size, entry_size)
+
+            # Test that the size of a replaced entry is not counted twice.
+            makefile_am_cache._WriteEntry("first", {"assignments": []})
+            self.assertEqual(makefile_am_cache._size, entry_size)
+
+            makefile_am_cache._WriteEntry("second", {"assignments": []})
+            self.assertEqual(makefile_am_cache._size, entry_size * 2)
+
+
+class ProjectMemoTest(test_lib.BaseTestCase):
+    """Project memo tests."""
+
+    def testGetProject(self):
+        """Tests the AddProject and GetProject functions."""
+        project_memo = libyal.ProjectMemo()
+
+        project_information = project_memo.GetProject("key")
+        self.assertIsNone(project_information)
+
+        project_information = libyal.ZlibVSProjectInformation()
+        project_memo.AddProject("key", project_information)
+
+        self.assertIs(project_memo.GetProject("key"), project_information)
+        self.assertEqual(project_memo.number_of_hits, 1)
+        self.assertEqual(project_memo.number_of_lookups, 2)
+        self.assertEqual(project_memo.hit_rate, 0.5)
+
+    def testGetProjectData(self):
+        """Tests the AddProjectData and GetProjectData functions."""
+        project_memo = libyal.ProjectMemo()
+        self.assertEqual(project_memo.hit_rate, 0.0)
+
+        project_memo.AddProjectData("key", b"data")
+
+        self.assertEqual(project_memo.GetProjectData("key"), b"data")
+        self.assertIsNone(project_memo.GetProjectData("bogus"))
+        self.assertEqual(project_memo.number_of_hits, 1)
+        self.assertEqual(project_memo.number_of_lookups, 2)
+
+    def testPickle(self):
+        """Tests that the memo is not copied when pickled."""
+        project_memo = libyal.ProjectMemo()
+        project_memo.AddProjectData("key", b"data")
+
+        unpickled_project_memo = pickle.loads(pickle.dumps(project_memo))
+        self.assertIsNone(unpickled_project_memo.GetProjectData("key"))
+
+
 class LibyalSourceVSSolutionTest(test_lib.BaseTestCase):
     """Libyal source Visual Studio solution generator tests."""
 
@@ -301,10 +426,227 @@ class LibyalSourceVSSolutionTest(test_lib.BaseTestCase):
         self.assertIn("rpcrt4.lib", debug_project_configuration.additional_dependencies)
 
     # TODO: add tests for _CreateThirdPartyDependencies
+
+    def testGetMemoKey(self):
+        """Tests the _GetMemoKey function."""
+        solution = libyal.LibyalSourceVSSolution()
+
+        memo_key = solution._GetMemoKey("project", "libfoo", "True")
+        self.assertEqual(len(memo_key), 64)
+        self.assertEqual(memo_key, solution._GetMemoKey("project", "libfoo", "True"))
+        self.assertNotEqual(memo_key, solution._GetMemoKey("project", "libfo", "oTrue"))
+
+    def testGetProjectGUID(self):
+        """Tests the _GetProjectGUID function."""
+        project_guids_by_name = {
+            "libfoo": "c42f5217-137d-4f10-9d6a-3c6d44e43453",
+            "zlib.dll": "d4b7d3b2-7b7b-4b0b-9b7b-2b7b7b7b7b7b",
+        }
+
+        solution = libyal.LibyalSourceVSSolution()
+
+        project_guid = solution._GetProjectGUID(
+            "libfoo", "libfoo", project_guids_by_name
+        )
+        self.assertEqual(project_guid, "c42f5217-137d-4f10-9d6a-3c6d44e43453")
+
+        project_guid = solution._GetProjectGUID("libfoo", "zlib", project_guids_by_name)
+        self.assertEqual(project_guid, "d4b7d3b2-7b7b-4b0b-9b7b-2b7b7b7b7b7b")
+
+        project_guid = solution._GetProjectGUID(
+            "libfoo", "foo_test_error", project_guids_by_name
+        )
+        self.assertNotEqual(
+            project_guid,
+            solution._GetProjectGUID("libfoo", "foo_test_error", project_guids_by_name),
+        )
+
+        solution = libyal.LibyalSourceVSSolution(
+            guid_namespace=libyal.LibyalSourceVSSolution.DEFAULT_GUID_NAMESPACE
+        )
+
+        project_guid = solution._GetProjectGUID(
+            "libfoo", "foo_test_error", project_guids_by_name
+        )
+        self.assertEqual(
+            project_guid,
+            str(
+                uuid.uuid5(
+                    libyal.LibyalSourceVSSolution.DEFAULT_GUID_NAMESPACE,
+                    "libfoo\\foo_test_error",
+                )
+            ),
+        )
+        self.assertNotEqual(
+            project_guid,
+            solution._GetProjectGUID("libbar", "foo_test_error", project_guids_by_name),
+        )
+
+    def testReadConfigureAc(self):
+        """Tests the _ReadConfigureAc function."""
+        solution = libyal.LibyalSourceVSSolution()
+
+        configure_ac_data = "\n".join(
+            [
+                "AC_INIT(",
+                " [libfoo],",
+                " [20240101],",
+                " [joachim.metz@gmail.com])",
+                "",
+                "AC_CONFIG_FILES([Makefile])",
+                "AC_CONFIG_FILES([libfoo/Makefile])",
+                "AC_CONFIG_FILES([",
+                "  include/Makefile",
+                "  tests/Makefile])",
+                "",
+                "AC_OUTPUT",
+                "",
+            ]
+        )
+        with test_lib.TempDirectory() as temp_directory:
+            configure_ac_path = os.path.join(temp_directory, "configure.ac")
+            with open(configure_ac_path, "w", encoding="utf8") as file_object:
+                file_object.write(configure_ac_data)
+
+            solution_name, config_files = solution._ReadConfigureAc(configure_ac_path)
+
+        self.assertEqual(solution_name, "libfoo")
+        self.assertEqual(
+            config_files,
+            ["Makefile", "libfoo/Makefile", "include/Makefile", "tests/Makefile"],
+        )
+
     # TODO: add tests for _ReadMakefile
-    # TODO: add tests for _ReadMakefilePrograms
+
+    @test_lib.skipUnlessHasTestFile(["2008.sln"])
+    def testReadMakefileAm(self):
+        """Tests the _ReadMakefileAm function."""
+        solution = libyal.LibyalSourceVSSolution()
+
+        with test_lib.TempDirectory() as temp_directory:
+            makefile_am_path = os.path.join(temp_directory, "Makefile.am")
+            with open(makefile_am_path, "w", encoding="utf8") as file_object:
+                file_object.write("noinst_LTLIBRARIES = libfoo.la\n")
+
+            makefile_am = solution._ReadMakefileAm(makefile_am_path)
+            self.assertIsNotNone(makefile_am)
+            self.assertEqual(makefile_am.GetValues("noinst_LTLIBRARIES"), ["libfoo.la"])
+
+            makefile_am_path = os.path.join(temp_directory, "bogus", "Makefile.am")
+            makefile_am = solution._ReadMakefileAm(makefile_am_path)
+            self.assertIsNone(makefile_am)
+
+    def testReadProjectGUIDs(self):
+        """Tests the _ReadProjectGUIDs function."""
+        solution = libyal.LibyalSourceVSSolution()
+
+        path = self._GetTestFilePath(["2008.sln"])
+        project_guids_by_name = solution._ReadProjectGUIDs(path)
+        self.assertEqual(
+            project_guids_by_name.get("libcerror"),
+            "c42f5217-137d-4f10-9d6a-3c6d44e43453",
+        )
+        self.assertIn(path, solution._project_guids_cache)
+
+        cached_project_guids_by_name = solution._ReadProjectGUIDs(path)
+        self.assertIs(cached_project_guids_by_name, project_guids_by_name)
+
     # TODO: add tests for Convert
 
+    def _CreateTestSourceDirectory(self, temp_directory, solution_name):
+        """Creates a test source directory with a local library.
+
+        Args:
+          temp_directory (str): path of the temporary directory.
+          solution_name (str): name of the solution.
+
+        Returns:
+          str: path of the test source directory.
+        """
+        input_directory = os.path.join(temp_directory, solution_name)
+        os.makedirs(os.path.join(input_directory, "libcerror"))
+
+        with open(
+            os.path.join(input_directory, "configure.ac"), "w", encoding="utf8"
+        ) as file_object:
+            file_object.write(
+                "\n".join(
+                    [
+                        "AC_INIT(",
+                        f" [{solution_name:s}],",
+                        " [20240101],",
+                        " [joachim.metz@gmail.com])",
+                        "",
+                        "AC_CONFIG_FILES([libcerror/Makefile])",
+                        "",
+                        "AC_OUTPUT",
+                        "",
+                    ]
+                )
+            )
+
+        with open(
+            os.path.join(input_directory, "libcerror", "Makefile.am"),
+            "w",
+            encoding="utf8",
+        ) as file_object:
+            file_object.write(
+                "\n".join(
+                    [
+                        "AM_CPPFLAGS = \\",
+                        "\t-I../include -I$(top_srcdir)/include \\",
+                        "\t@LIBCERROR_CPPFLAGS@",
+                        "",
+                        "noinst_LTLIBRARIES = libcerror.la",
+                        "",
+                        "libcerror_la_SOURCES = \\",
+                        "\tlibcerror_error.c libcerror_error.h",
+                        "",
+                    ]
+                )
+            )
+
+        return input_directory
+
+    def testConvertToVersionsWithProjectMemo(self):
+        """Tests the ConvertToVersions function with a project memo."""
+        project_memo = libyal.ProjectMemo()
+
+        solution = libyal.LibyalSourceVSSolution(
+            guid_namespace=libyal.LibyalSourceVSSolution.DEFAULT_GUID_NAMESPACE,
+            project_memo=project_memo,
+        )
+
+        current_working_directory = os.getcwd()
+        with test_lib.TempDirectory() as temp_directory:
+            for solution_name in ("libfoo", "libbar"):
+                input_directory = self._CreateTestSourceDirectory(
+                    temp_directory, solution_name
+                )
+
+                os.chdir(input_directory)
+                try:
+                    result = solution.ConvertToVersions(input_directory, ["2022"])
+                finally:
+                    os.chdir(current_working_directory)
+
+                self.assertTrue(result)
+
+                # The project information of the local library of the first
+                # source directory is reused by the second source directory.
+                self.assertEqual(
+                    project_memo.number_of_hits, int(solution_name == "libbar")
+                )
+
+                project_guid = solution._GetProjectGUID(solution_name, "libcerror", {})
+                output_path = os.path.join(
+                    input_directory, "vs2022", "libcerror", "libcerror.vcxproj"
+                )
+                with open(output_path, "r", encoding="utf8") as file_object:
+                    self.assertIn(
+                        f"<ProjectGuid>{{{project_guid:s}}}", file_object.read()
+                    )
+
 
 if __name__ == "__main__":
     unittest.main()
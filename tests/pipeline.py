@@ -0,0 +1,83 @@
+"""Tests for the input and output pipeline classes."""
+
+import os
+import unittest
+
+from vstools import pipeline
+
+from tests import test_lib
+
+
+class ReadAheadFileReaderTest(test_lib.BaseTestCase):
+    """Read-ahead file reader tests."""
+
+    def testReadFiles(self):
+        """Tests the ReadFiles function."""
+        read_ahead_file_reader = pipeline.ReadAheadFileReader(maximum_number_of_files=2)
+
+        with test_lib.TempDirectory() as temp_directory:
+            paths = []
+            for index in range(5):
+                path = os.path.join(temp_directory, f"file{index:d}")
+                with open(path, "wb") as file_object:
+                    file_object.write(f"data{index:d}".encode("ascii"))
+
+                paths.append(path)
+
+            paths.insert(2, os.path.join(temp_directory, "bogus"))
+            paths.insert(3, None)
+
+            read_ahead_files = list(read_ahead_file_reader.ReadFiles(paths))
+
+            self.assertEqual(len(read_ahead_files), 7)
+            self.assertEqual(read_ahead_files[0], (b"data0", None))
+            self.assertEqual(read_ahead_files[6], (b"data4", None))
+
+            data, exception = read_ahead_files[2]
+            self.assertIsNone(data)
+            self.assertIsInstance(exception, FileNotFoundError)
+
+            self.assertEqual(read_ahead_files[3], (None, None))
+
+            # Test that stopping early does not block.
+            read_ahead_files = read_ahead_file_reader.ReadFiles(paths)
+            self.assertEqual(next(read_ahead_files), (b"data0", None))
+            read_ahead_files.close()
+
+
+class WriteBehindFileWriterTest(test_lib.BaseTestCase):
+    """Write-behind file writer tests."""
+
+    def testWriteFile(self):
+        """Tests the WriteFile function."""
+        write_behind_file_writer = pipeline.WriteBehindFileWriter(
+            maximum_number_of_files=2
+        )
+
+        with test_lib.TempDirectory() as temp_directory:
+            write_behind_file_writer.Open()
+            for index in range(5):
+                path = os.path.join(temp_directory, f"file{index:d}")
+                write_behind_file_writer.WriteFile(
+                    path, f"data{index:d}".encode("ascii")
+                )
+
+            write_behind_file_writer.Close()
+
+            self.assertEqual(len(os.listdir(temp_directory)), 5)
+
+            path = os.path.join(temp_directory, "file4")
+            with open(path, "rb") as file_object:
+                self.assertEqual(file_object.read(), b"data4")
+
+            write_behind_file_writer.Open()
+
+            path = os.path.join(temp_directory, "bogus", "file")
+            write_behind_file_writer.WriteFile(path, b"data")
+
+            with self.assertRaises(FileNotFoundError):
+                write_behind_file_writer.Close()
+
+
+if __name__ == "__main__":
+    unittest.main()
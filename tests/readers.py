@@ -3,8 +3,12 @@
 import io
 import unittest
 
+from xml.etree import ElementTree
+
 from vstools import readers
 from vstools import resources
+from vstools import solutions
+from vstools import writers
 
 from tests import test_lib
 
@@ -30,6 +34,11 @@ class FileReaderTest(test_lib.BaseTestCase):
         binary_data = file_reader._ReadBinaryData(5)
         self.assertEqual(binary_data, b"\xef\xbb\xbf\r\n")
 
+        line = file_reader._ReadLine()
+        self.assertEqual(
+            line, "Microsoft Visual Studio Solution File, Format Version 10.00"
+        )
+
         file_reader.Close()
 
     @test_lib.skipUnlessHasTestFile(["2008.vcproj"])
@@ -48,6 +57,22 @@ class FileReaderTest(test_lib.BaseTestCase):
 
         file_reader.Close()
 
+        file_reader = readers.FileReader()
+        file_reader._file = io.BytesIO(b"  first\r\n\tsecond\r\nthird")
+
+        line = file_reader._ReadLine(look_ahead=True)
+        self.assertEqual(line, "first")
+        line = file_reader._ReadLine(look_ahead=True)
+        self.assertEqual(line, "first")
+        line = file_reader._ReadLine()
+        self.assertEqual(line, "first")
+        line = file_reader._ReadLine()
+        self.assertEqual(line, "second")
+        line = file_reader._ReadLine()
+        self.assertEqual(line, "third")
+        line = file_reader._ReadLine()
+        self.assertEqual(line, "")
+
     @test_lib.skipUnlessHasTestFile(["2008.vcproj"])
     def testOpenClose(self):
         """Tests the Open and Close functions."""
@@ -64,7 +89,25 @@ class VS2008ProjectFileReaderTest(test_lib.BaseTestCase):
 
     # pylint: disable=protected-access
 
-    # TODO: add tests for _ParseConfigurationOption function.
+    def testParseAttribute(self):
+        """Tests the _ParseAttribute function."""
+        file_reader = readers.VS2008ProjectFileReader()
+
+        name, value = file_reader._ParseAttribute('RelativePath="..\\test.c"')
+        self.assertEqual(name, "RelativePath")
+        self.assertEqual(value, "..\\test.c")
+
+        name, value = file_reader._ParseAttribute('Name="Release|Win32"')
+        self.assertEqual(name, "Name")
+        self.assertEqual(value, "Release|Win32")
+
+        name, value = file_reader._ParseAttribute('AdditionalDependencies=""')
+        self.assertEqual(name, "AdditionalDependencies")
+        self.assertEqual(value, "")
+
+        name, value = file_reader._ParseAttribute("<Tool")
+        self.assertIsNone(name)
+        self.assertIsNone(value)
 
     def testParseConfigurationOption(self):
         """Tests the _ParseConfigurationOption function."""
@@ -154,6 +197,9 @@ class VS2008ProjectFileReaderTest(test_lib.BaseTestCase):
         file_reader._file = io.BytesIO(file_data)
         file_reader._ReadFiles(project_information)
 
+        self.assertEqual(project_information.source_files, ["test.c"])
+        self.assertEqual(project_information.header_files, [])
+
     def testReadProjectInformation(self):
         """Tests the _ReadProjectInformation function."""
         test_data = [
@@ -172,6 +218,12 @@ class VS2008ProjectFileReaderTest(test_lib.BaseTestCase):
         file_reader._file = io.BytesIO(file_data)
         file_reader._ReadProjectInformation(project_information)
 
+        self.assertEqual(project_information.name, "libcerror")
+        self.assertEqual(
+            project_information.guid, "C42F5217-137D-4F10-9D6A-3C6D44E43453"
+        )
+        self.assertEqual(project_information.root_name_space, "libcerror")
+
     def testReadHeader(self):
         """Tests the ReadHeader function."""
         test_data = [
@@ -230,7 +282,243 @@ class VS2008ProjectFileReaderTest(test_lib.BaseTestCase):
         file_reader.Close()
 
 
-# TODO: add tests for VS2010ProjectFileReader
+class VS2010ProjectFileReaderTest(test_lib.BaseTestCase):
+    """Visual Studio 2010 project file reader test."""
+
+    # pylint: disable=protected-access
+
+    def _ReadProjectData(self, file_reader, project_data):
+        """Reads a project from data.
+
+        Args:
+          file_reader (VSProjectFileReader): project file reader.
+          project_data (bytes): data of the project file.
+
+        Returns:
+          VSProjectInformation: project information.
+        """
+        file_reader.OpenFileObject(io.BytesIO(project_data))
+
+        result = file_reader.ReadHeader()
+        self.assertTrue(result)
+
+        project_information = file_reader.ReadProject()
+
+        file_reader.Close()
+
+        return project_information
+
+    def _WriteProjectData(self, file_writer, project_information):
+        """Writes a project to data.
+
+        Args:
+          file_writer (VSProjectFileWriter): project file writer.
+          project_information (VSProjectInformation): project information.
+
+        Returns:
+          bytes: data of the project file.
+        """
+        solution = solutions.VSSolution()
+        solution_project = resources.VSSolutionProject(
+            project_information.name,
+            "libcerror\\libcerror",
+            project_information.guid,
+        )
+
+        file_object = io.BytesIO()
+        file_writer.OpenFileObject(file_object)
+        solution._WriteProjectFile(
+            file_writer, solution_project, project_information, {}
+        )
+
+        return file_object.getvalue()
+
+    def testParseCondition(self):
+        """Tests the _ParseCondition function."""
+        file_reader = readers.VS2010ProjectFileReader()
+
+        element = ElementTree.Element(
+            "PropertyGroup",
+            Condition="'$(Configuration)|$(Platform)'=='Release|Win32'",
+        )
+        configuration_identifier = file_reader._ParseCondition(element)
+        self.assertEqual(configuration_identifier, ("Release", "Win32"))
+
+        element = ElementTree.Element("PropertyGroup")
+        configuration_identifier = file_reader._ParseCondition(element)
+        self.assertIsNone(configuration_identifier)
+
+    def testReadHeader(self):
+        """Tests the ReadHeader function."""
+        test_data = [
+            '<?xml version="1.0" encoding="utf-8"?>',
+            (
+                '<Project DefaultTargets="Build" ToolsVersion="4.0" '
+                'xmlns="http://schemas.microsoft.com/developer/msbuild/2003">'
+            ),
+            "</Project>",
+        ]
+
+        file_reader = readers.VS2010ProjectFileReader()
+
+        file_data = "\n".join(test_data).encode("utf-8")
+        file_reader._file = io.BytesIO(file_data)
+        result = file_reader.ReadHeader()
+        self.assertTrue(result)
+
+        file_reader = readers.VS2022ProjectFileReader()
+
+        file_reader._file = io.BytesIO(file_data)
+        result = file_reader.ReadHeader()
+        self.assertFalse(result)
+
+        test_data[1] = "<VisualStudioProject>"
+        test_data[2] = "</VisualStudioProject>"
+
+        file_reader = readers.VS2010ProjectFileReader()
+
+        file_data = "\n".join(test_data).encode("utf-8")
+        file_reader._file = io.BytesIO(file_data)
+        result = file_reader.ReadHeader()
+        self.assertFalse(result)
+
+        file_reader._file = io.BytesIO(b"")
+        result = file_reader.ReadHeader()
+        self.assertFalse(result)
+
+    @test_lib.skipUnlessHasTestFile(["2010.vcxproj"])
+    def testReadProject(self):
+        """Tests the ReadProject function."""
+        file_reader = readers.VS2010ProjectFileReader()
+
+        path = self._GetTestFilePath(["2010.vcxproj"])
+        file_reader.Open(path)
+
+        result = file_reader.ReadHeader()
+        self.assertTrue(result)
+
+        project_information = file_reader.ReadProject()
+
+        file_reader.Close()
+
+        self.assertIsNotNone(project_information)
+        self.assertEqual(project_information.name, "libcerror")
+        self.assertEqual(
+            project_information.guid, "C42F5217-137D-4F10-9D6A-3C6D44E43453"
+        )
+        self.assertEqual(len(project_information.source_files), 4)
+        self.assertEqual(len(project_information.header_files), 7)
+        self.assertEqual(len(project_information.resource_files), 1)
+
+        configurations = project_information.configurations
+        self.assertEqual(configurations.number_of_configurations, 2)
+
+        project_configuration = configurations.GetByIdentifier("Release", "Win32")
+        self.assertEqual(project_configuration.output_type, "2")
+        self.assertEqual(project_configuration.character_set, "1")
+        self.assertEqual(project_configuration.runtime_library, "2")
+        self.assertEqual(project_configuration.warning_level, "4")
+        self.assertEqual(project_configuration.compile_as, "1")
+        self.assertEqual(
+            project_configuration.linker_output_file,
+            "$(OutDir)\\$(ProjectName).dll",
+        )
+        self.assertTrue(project_configuration.linker_values_set)
+
+        self.assertIn("..\\..\\include", project_configuration.include_directories)
+        self.assertNotIn(
+            "%(AdditionalIncludeDirectories)",
+            project_configuration.include_directories,
+        )
+
+    @test_lib.skipUnlessHasTestFile(["2010.vcxproj"])
+    def testReadProjectRoundTrip(self):
+        """Tests reading back a written project."""
+        path = self._GetTestFilePath(["2010.vcxproj"])
+        with open(path, "rb") as file_object:
+            project_data = file_object.read()
+
+        project_information = self._ReadProjectData(
+            readers.VS2010ProjectFileReader(), project_data
+        )
+
+        # The default import library added by the Visual Studio 2017 project
+        # file writer is not read back.
+        project_data = self._WriteProjectData(
+            writers.VS2017ProjectFileWriter(), project_information
+        )
+        project_information = self._ReadProjectData(
+            readers.VS2017ProjectFileReader(), project_data
+        )
+
+        project_configuration = project_information.configurations.GetByIdentifier(
+            "Release", "Win32"
+        )
+        self.assertEqual(project_configuration.import_library, "")
+        self.assertEqual(project_configuration.library_directories, ["$(OutDir)"])
+
+        project_data = self._WriteProjectData(
+            writers.VS2008ProjectFileWriter(), project_information
+        )
+        self.assertIn(
+            b'\t\t\t\tAdditionalLibraryDirectories="&quot;$(OutDir)&quot;"\r\n',
+            project_data,
+        )
+        self.assertIn(
+            b'\t\t\t\tImportLibrary="$(OutDir)\\$(ProjectName).lib"\r\n',
+            project_data,
+        )
+
+        written_project_information = self._ReadProjectData(
+            readers.VS2008ProjectFileReader(), project_data
+        )
+        written_project_configuration = (
+            written_project_information.configurations.GetByIdentifier(
+                "Release", "Win32"
+            )
+        )
+        for name in (
+            "additional_dependencies",
+            "include_directories",
+            "linker_output_file",
+            "output_type",
+        ):
+            self.assertEqual(
+                getattr(written_project_configuration, name),
+                getattr(project_configuration, name),
+            )
+
+        self.assertEqual(
+            written_project_configuration.library_directories,
+            ["&quot;$(OutDir)&quot;"],
+        )
+
+        # A non-default import library is read back.
+        project_configuration.import_library = "$(OutDir)\\libcerror_custom.lib"
+
+        project_data = self._WriteProjectData(
+            writers.VS2017ProjectFileWriter(), project_information
+        )
+        project_information = self._ReadProjectData(
+            readers.VS2017ProjectFileReader(), project_data
+        )
+
+        project_configuration = project_information.configurations.GetByIdentifier(
+            "Release", "Win32"
+        )
+        self.assertEqual(
+            project_configuration.import_library, "$(OutDir)\\libcerror_custom.lib"
+        )
+
+        project_data = self._WriteProjectData(
+            writers.VS2008ProjectFileWriter(), project_information
+        )
+        self.assertIn(
+            b'\t\t\t\tImportLibrary="$(OutDir)\\libcerror_custom.lib"\r\n',
+            project_data,
+        )
+
+
 # TODO: add tests for VS2012ProjectFileReader
 # TODO: add tests for VS2013ProjectFileReader
 # TODO: add tests for VS2015ProjectFileReader
@@ -247,7 +535,7 @@ class VSSolutionFileReaderTest(test_lib.BaseTestCase):
 
     def testCheckVisualStudioVersion(self):
         """Tests the _CheckVisualStudioVersion function."""
-        file_reader = readers.VS2012SolutionFileReader()
+        file_reader = readers.VS2010SolutionFileReader()
 
         result = file_reader._CheckVisualStudioVersion("")
         self.assertFalse(result)
@@ -288,6 +576,25 @@ class VS2008SolutionFileReaderTest(test_lib.BaseTestCase):
 
         file_reader.Close()
 
+    @test_lib.skipUnlessHasTestFile(["2008.sln"])
+    def testReadProjectGUIDs(self):
+        """Tests the ReadProjectGUIDs function."""
+        file_reader = readers.VS2008SolutionFileReader()
+
+        path = self._GetTestFilePath(["2008.sln"])
+        file_reader.Open(path)
+
+        file_reader.ReadHeader()
+
+        project_guids_by_name = file_reader.ReadProjectGUIDs()
+        self.assertEqual(len(project_guids_by_name), 3)
+        self.assertEqual(
+            project_guids_by_name.get("libcerror"),
+            "c42f5217-137d-4f10-9d6a-3c6d44e43453",
+        )
+
+        file_reader.Close()
+
     @test_lib.skipUnlessHasTestFile(["2008.sln"])
     def testReadProjects(self):
         """Tests the ReadProjects function."""
@@ -303,6 +610,31 @@ class VS2008SolutionFileReaderTest(test_lib.BaseTestCase):
 
         file_reader.Close()
 
+    @test_lib.skipUnlessHasTestFile(["2008.sln"])
+    def testIterProjects(self):
+        """Tests the IterProjects function."""
+        file_reader = readers.VS2008SolutionFileReader()
+
+        path = self._GetTestFilePath(["2008.sln"])
+        file_reader.Open(path)
+
+        file_reader.ReadHeader()
+
+        solution_project = next(file_reader.IterProjects())
+        self.assertIsNotNone(solution_project)
+        self.assertEqual(solution_project.name, "cerror_test_error")
+        self.assertEqual(
+            solution_project.dependencies, ["c42f5217-137d-4f10-9d6a-3c6d44e43453"]
+        )
+
+        solution_projects = list(file_reader.IterProjects())
+        self.assertEqual(len(solution_projects), 2)
+
+        solution_configurations = file_reader.ReadConfigurations()
+        self.assertIsNotNone(solution_configurations)
+
+        file_reader.Close()
+
 
 class VS2010SolutionFileReaderTest(test_lib.BaseTestCase):
     """Visual Studio 2010 solution file reader tests."""
@@ -339,6 +671,14 @@ class VS2012SolutionFileReaderTest(test_lib.BaseTestCase):
         result = file_reader._CheckFormatVersion(line)
         self.assertFalse(result)
 
+    def testCheckVisualStudioVersion(self):
+        """Tests the _CheckVisualStudioVersion function."""
+        file_reader = readers.VS2012SolutionFileReader()
+
+        line = "VisualStudioVersion = 18.0.11018.127"
+        result = file_reader._CheckVisualStudioVersion(line)
+        self.assertTrue(result)
+
 
 class VS2013SolutionFileReaderTest(test_lib.BaseTestCase):
     """Visual Studio 2013 solution file reader tests."""
@@ -430,7 +770,143 @@ class VS2022SolutionFileReaderTest(test_lib.BaseTestCase):
         self.assertFalse(result)
 
 
-# TODO: add tests for VS2026SolutionFileReaderTest
+class VS2026SolutionFileReaderTest(test_lib.BaseTestCase):
+    """Visual Studio 2026 solution file reader tests."""
+
+    # pylint: disable=protected-access
+
+    _TEST_DATA = [
+        "<Solution>",
+        "  <Configurations>",
+        '    <BuildType Name="Release" />',
+        '    <BuildType Name="VSDebug" />',
+        '    <Platform Name="Win32" />',
+        "  </Configurations>",
+        '  <Project Path="libcerror\\libcerror.vcxproj" '
+        'Id="c42f5217-137d-4f10-9d6a-3c6d44e43453" />',
+        '  <Folder Name="/tests/">',
+        '    <Project Path="cerror_test_error/cerror_test_error.vcxproj">',
+        '      <BuildDependency Project="libcerror/libcerror.vcxproj" />',
+        '      <Platform Project="x64" />',
+        "    </Project>",
+        "  </Folder>",
+        "</Solution>",
+    ]
+
+    def testGetProjectFilename(self):
+        """Tests the _GetProjectFilename function."""
+        file_reader = readers.VS2026SolutionFileReader()
+
+        project_filename = file_reader._GetProjectFilename(
+            "libcerror/libcerror.vcxproj"
+        )
+        self.assertEqual(project_filename, "libcerror\\libcerror")
+
+    def testReadHeader(self):
+        """Tests the ReadHeader function."""
+        file_reader = readers.VS2026SolutionFileReader()
+
+        file_data = "\n".join(self._TEST_DATA).encode("utf-8")
+        file_reader._file = io.BytesIO(file_data)
+        result = file_reader.ReadHeader()
+        self.assertTrue(result)
+
+        file_reader._file = io.BytesIO(b"<Project></Project>")
+        result = file_reader.ReadHeader()
+        self.assertFalse(result)
+
+        file_reader._file = io.BytesIO(b"")
+        result = file_reader.ReadHeader()
+        self.assertFalse(result)
+
+    def testReadProjects(self):
+        """Tests the ReadProjects and ReadConfigurations functions."""
+        file_reader = readers.VS2026SolutionFileReader()
+
+        file_data = "\n".join(self._TEST_DATA).encode("utf-8")
+        file_reader._file = io.BytesIO(file_data)
+        file_reader.ReadHeader()
+
+        solution_projects = file_reader.ReadProjects()
+        self.assertEqual(len(solution_projects), 2)
+
+        solution_project = solution_projects[0]
+        self.assertEqual(solution_project.name, "libcerror")
+        self.assertEqual(solution_project.filename, "libcerror\\libcerror")
+        self.assertEqual(solution_project.guid, "c42f5217-137d-4f10-9d6a-3c6d44e43453")
+
+        solution_project = solution_projects[1]
+        self.assertEqual(solution_project.name, "cerror_test_error")
+        self.assertEqual(
+            solution_project.dependencies, ["c42f5217-137d-4f10-9d6a-3c6d44e43453"]
+        )
+
+        solution_configurations = file_reader.ReadConfigurations()
+        self.assertIsNotNone(solution_configurations)
+        self.assertEqual(solution_configurations.number_of_configurations, 2)
+        self.assertEqual(solution_configurations.platforms, ["Win32"])
+
+    def testIterProjects(self):
+        """Tests the IterProjects function."""
+        test_data = [
+            "<Solution>",
+            '  <Project Path="cerror_test_error/cerror_test_error.vcxproj">',
+            '    <BuildDependency Project="libcerror/libcerror.vcxproj" />',
+            "  </Project>",
+            '  <Project Path="libcerror/libcerror.vcxproj" '
+            'Id="c42f5217-137d-4f10-9d6a-3c6d44e43453" />',
+            "</Solution>",
+        ]
+
+        file_reader = readers.VS2026SolutionFileReader()
+
+        file_data = "\n".join(test_data).encode("utf-8")
+        file_reader._file = io.BytesIO(file_data)
+        file_reader.ReadHeader()
+
+        solution_projects = list(file_reader.IterProjects())
+        self.assertEqual(len(solution_projects), 2)
+
+        # Test that the project is yielded with the dependency that is defined
+        # later in the solution file.
+        solution_project = solution_projects[0]
+        self.assertEqual(solution_project.name, "cerror_test_error")
+        self.assertEqual(
+            solution_project.dependencies, ["c42f5217-137d-4f10-9d6a-3c6d44e43453"]
+        )
+
+        test_data = [
+            "<Solution>",
+            '  <Project Path="libcerror/libcerror.vcxproj" '
+            'Id="c42f5217-137d-4f10-9d6a-3c6d44e43453" />',
+            '  <Project Path="cerror_test_error/cerror_test_error.vcxproj">',
+            '    <BuildDependency Project="libcerror/libcerror.vcxproj" />',
+            '    <BuildDependency Project="missing/missing.vcxproj" />',
+            "  </Project>",
+            "</Solution>",
+        ]
+
+        file_reader = readers.VS2026SolutionFileReader()
+
+        file_data = "\n".join(test_data).encode("utf-8")
+        file_reader._file = io.BytesIO(file_data)
+        file_reader.ReadHeader()
+
+        iterator = file_reader.IterProjects()
+
+        solution_project = next(iterator)
+        self.assertEqual(solution_project.name, "libcerror")
+
+        # Test that a project with a dependency that is not defined in the
+        # solution file is yielded at the end of the solution file.
+        solution_project = next(iterator)
+        self.assertEqual(solution_project.name, "cerror_test_error")
+        self.assertEqual(
+            solution_project.dependencies, ["c42f5217-137d-4f10-9d6a-3c6d44e43453"]
+        )
+
+        with self.assertRaises(StopIteration):
+            next(iterator)
 
 
 if __name__ == "__main__":
@@ -36,6 +36,24 @@ class VSConfigurationsTest(test_lib.BaseTestCase):
         configuration = resources.VSSolutionConfiguration(name="test", platform="Win32")
         configurations.Append(configuration)
 
+    def testCopy(self):
+        """Tests the Copy function."""
+        configurations = resources.VSConfigurations()
+
+        configuration = resources.VSSolutionConfiguration(name="test", platform="Win32")
+        configurations.Append(configuration)
+
+        configurations_copy = configurations.Copy()
+        configurations_copy.ExtendWithX64("2010")
+
+        self.assertEqual(configurations.number_of_configurations, 1)
+        self.assertEqual(configurations.platforms, ["Win32"])
+        self.assertEqual(configurations_copy.number_of_configurations, 2)
+        self.assertEqual(configurations_copy.platforms, ["Win32", "x64"])
+
+        configuration_copy = configurations_copy.GetByIdentifier("test", "Win32")
+        self.assertIs(configuration_copy, configuration)
+
     def testExtendWithX64(self):
         """Tests the ExtendWithX64 function."""
         configurations = resources.VSConfigurations()
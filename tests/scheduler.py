@@ -0,0 +1,111 @@
+"""Tests for the work scheduler classes."""
+
+import json
+import os
+import unittest
+
+from vstools import scheduler
+
+from tests import test_lib
+
+
+class CostModelTest(test_lib.BaseTestCase):
+    """Cost model tests."""
+
+    # pylint: disable=protected-access
+
+    def testGetScale(self):
+        """Tests the _GetScale function."""
+        cost_model = scheduler.CostModel()
+
+        self.assertEqual(cost_model._GetScale(), 1.0)
+
+        cost_model.AddDuration("first", 10.0, 2.0)
+        self.assertIsNone(cost_model._scale)
+
+        cost_model.AddDuration("second", 30.0, 2.0)
+        self.assertEqual(cost_model._GetScale(), 0.1)
+        self.assertEqual(cost_model._scale, 0.1)
+
+        # The scale is not recomputed until another duration is recorded.
+        cost_model._tasks["second"] = (6.0, 30.0)
+        self.assertEqual(cost_model._GetScale(), 0.1)
+
+    def testAddDuration(self):
+        """Tests the AddDuration function."""
+        cost_model = scheduler.CostModel(maximum_number_of_tasks=2)
+
+        cost_model.AddDuration("first", 10.0, 1.0)
+        cost_model.AddDuration("first", 10.0, 3.0)
+        self.assertEqual(cost_model._tasks["first"], (2.0, 10.0))
+
+        cost_model.AddDuration("second", 10.0, 1.0)
+        cost_model.AddDuration("third", 10.0, 1.0)
+        self.assertEqual(list(cost_model._tasks.keys()), ["second", "third"])
+
+    def testEstimateCost(self):
+        """Tests the EstimateCost function."""
+        cost_model = scheduler.CostModel()
+
+        self.assertEqual(cost_model.EstimateCost("first", 10.0), 10.0)
+
+        cost_model.AddDuration("first", 10.0, 2.0)
+        cost_model.AddDuration("second", 30.0, 2.0)
+
+        self.assertEqual(cost_model.EstimateCost("first", 10.0), 2.0)
+        self.assertEqual(cost_model.EstimateCost("first", 20.0), 4.0)
+        self.assertEqual(cost_model.EstimateCost("third", 20.0), 2.0)
+
+    def testGetDispatchOrder(self):
+        """Tests the GetDispatchOrder function."""
+        cost_model = scheduler.CostModel()
+
+        dispatch_order = cost_model.GetDispatchOrder([1.0, 5.0, 1.0, 3.0])
+        self.assertEqual(dispatch_order, [1, 3, 0, 2])
+
+    def testGetHeuristicCost(self):
+        """Tests the GetHeuristicCost function."""
+        cost_model = scheduler.CostModel()
+
+        self.assertEqual(cost_model.GetHeuristicCost(), 1.0)
+
+        heuristic_cost = cost_model.GetHeuristicCost(
+            input_size=2048, number_of_files=7, number_of_configurations=2
+        )
+        self.assertEqual(heuristic_cost, 20.0)
+
+    def testReadAndWrite(self):
+        """Tests the Read and Write functions."""
+        with test_lib.TempDirectory() as temp_directory:
+            path = os.path.join(temp_directory, "costs", "tasks.json")
+
+            cost_model = scheduler.CostModel(path=path)
+            cost_model.Read()
+            cost_model.AddDuration("first", 10.0, 2.0)
+            cost_model.Write()
+
+            cost_model = scheduler.CostModel(path=path)
+            cost_model.Read()
+            self.assertEqual(cost_model._tasks, {"first": (2.0, 10.0)})
+
+            with open(path, "w", encoding="utf8") as file_object:
+                file_object.write("bogus")
+
+            cost_model = scheduler.CostModel(path=path)
+            cost_model.Read()
+            self.assertEqual(cost_model._tasks, {})
+
+            for tasks, expected_tasks in (
+                ({"a": "x"}, {}),
+                ([["a", "x"], ["b", 1.0, "x"], 1, ["c", 2.0, 10]], {"c": (2.0, 10)}),
+            ):
+                with open(path, "w", encoding="utf8") as file_object:
+                    json.dump({"format_version": 1, "tasks": tasks}, file_object)
+
+                cost_model = scheduler.CostModel(path=path)
+                cost_model.Read()
+                self.assertEqual(cost_model._tasks, expected_tasks)
+
+
+if __name__ == "__main__":
+    unittest.main()
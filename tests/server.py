@@ -0,0 +1,89 @@
+"""Tests for the conversion server and client classes."""
+
+import json
+import os
+import socket
+import threading
+import time
+import unittest
+
+from vstools import server
+
+from tests import test_lib
+
+
+@unittest.skipUnless(hasattr(socket, "AF_UNIX"), "missing Unix socket support")
+class ConversionServerTest(test_lib.BaseTestCase):
+    """Conversion server tests."""
+
+    def testHandleRequest(self):
+        """Tests the HandleRequest function."""
+        with test_lib.TempDirectory() as temp_directory:
+            socket_path = os.path.join(temp_directory, "vstools.socket")
+            conversion_server = server.ConversionServer(socket_path)
+
+            response_data = conversion_server.HandleRequest(b"bogus\n")
+            response = json.loads(response_data)
+            self.assertIn("error", response)
+
+            request = {"command": "convert", "input_paths": ["relative.sln"]}
+            response_data = conversion_server.HandleRequest(
+                json.dumps(request).encode("utf8")
+            )
+            response = json.loads(response_data)
+            self.assertEqual(response["error"], "Invalid input paths.")
+
+    @test_lib.skipUnlessHasTestFile(["2008.sln"])
+    @test_lib.skipUnlessHasTestFile(["2008.vcproj"])
+    def testServe(self):
+        """Tests the Serve function."""
+        current_working_directory = os.getcwd()
+
+        with test_lib.TempDirectory() as temp_directory:
+            input_sln_path = self._CreateTestSolution(
+                os.path.join(temp_directory, "msvscpp")
+            )
+
+            socket_path = os.path.join(temp_directory, "vstools.socket")
+            conversion_server = server.ConversionServer(socket_path)
+
+            server_thread = threading.Thread(target=conversion_server.Serve)
+            server_thread.start()
+
+            conversion_client = server.ConversionClient(socket_path)
+
+            try:
+                for _ in range(100):
+                    if os.path.exists(socket_path):
+                        break
+                    time.sleep(0.05)
+
+                for output_version in ("2019", "2022"):
+                    batch_results, _ = conversion_client.Convert(
+                        [input_sln_path], [output_version]
+                    )
+
+                    self.assertEqual(len(batch_results), 1)
+                    self.assertEqual(batch_results[0].input_path, input_sln_path)
+                    self.assertTrue(batch_results[0].result)
+
+            finally:
+                conversion_client.Shutdown()
+                server_thread.join()
+
+            self.assertEqual(os.getcwd(), current_working_directory)
+
+            for output_version in ("2019", "2022"):
+                output_path = os.path.join(
+                    temp_directory,
+                    f"vs{output_version:s}",
+                    "libcerror",
+                    "libcerror.vcxproj",
+                )
+                self.assertTrue(os.path.isfile(output_path))
+
+            self.assertFalse(os.path.exists(socket_path))
+
+
+if __name__ == "__main__":
+    unittest.main()
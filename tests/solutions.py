@@ -1,5 +1,8 @@
 """Tests for the solution classes."""
 
+import asyncio
+import os
+import shutil
 import unittest
 
 from vstools import solutions
@@ -14,6 +17,81 @@ class VSSolutionTest(test_lib.BaseTestCase):
 
     # TODO: add tests for _ConvertProject
 
+    @test_lib.skipUnlessHasTestFile(["2008.vcproj"])
+    @test_lib.skipUnlessHasTestFile(["2010.vcxproj"])
+    def testDetectProjectVersion(self):
+        """Tests the _DetectProjectVersion function."""
+        solution = solutions.VSSolution()
+
+        path = self._GetTestFilePath(["2008.vcproj"])
+        with open(path, "rb") as file_object:
+            project_version = solution._DetectProjectVersion(file_object, "2008")
+            self.assertEqual(project_version, "2008")
+
+            # Test that the file data is not consumed.
+            self.assertEqual(file_object.tell(), 0)
+
+        path = self._GetTestFilePath(["2010.vcxproj"])
+        with open(path, "rb") as file_object:
+            project_version = solution._DetectProjectVersion(file_object, "2012")
+            self.assertEqual(project_version, "2012")
+
+            project_version = solution._DetectProjectVersion(file_object, "2022")
+            self.assertEqual(project_version, "2010")
+
+        with test_lib.TempDirectory() as temp_directory:
+            path = os.path.join(temp_directory, "test.vcxproj")
+            with open(path, "wb") as file_object:
+                file_object.write(b'<Project ToolsVersion="99.0">\r\n</Project>\r\n')
+
+            with open(path, "rb") as file_object:
+                with self.assertLogs(level="ERROR"):
+                    project_version = solution._DetectProjectVersion(
+                        file_object, "2022"
+                    )
+
+                self.assertIsNone(project_version)
+
+    @test_lib.skipUnlessHasTestFile(["2008.sln"])
+    def testDetectSolutionVersion(self):
+        """Tests the _DetectSolutionVersion function."""
+        solution = solutions.VSSolution()
+
+        path = self._GetTestFilePath(["2008.sln"])
+        with open(path, "rb") as file_object:
+            input_version = solution._DetectSolutionVersion(file_object)
+            self.assertEqual(input_version, "2008")
+
+            # Test that the file data is not consumed.
+            self.assertEqual(file_object.tell(), 0)
+
+        test_headers = [
+            (b"Format Version 11.00\r\n# Visual C++ Express 2010\r\n", "2010"),
+            (b"Format Version 12.00\r\n# Visual Studio Express 2012\r\n", "2012"),
+            (b"Format Version 12.00\r\nVisualStudioVersion = 14.0.25420.1", "2015"),
+            (b"Format Version 12.00\r\nVisualStudioVersion = 17.5.33516.290", "2022"),
+            (b"Format Version 12.00\r\nVisualStudioVersion = 18.0.11018.127", "2012"),
+            (b"Format Version 12.00\r\nVisualStudioVersion = 99.0.1", "2012"),
+            (b"Format Version 99.00\r\n", None),
+            (b"<Solution>\r\n</Solution>\r\n", "2026"),
+            (b"bogus", None),
+        ]
+        with test_lib.TempDirectory() as temp_directory:
+            path = os.path.join(temp_directory, "test.sln")
+
+            for file_header, expected_input_version in test_headers:
+                with open(path, "wb") as file_object:
+                    file_object.write(file_header)
+
+                with open(path, "rb") as file_object:
+                    if expected_input_version:
+                        input_version = solution._DetectSolutionVersion(file_object)
+                    else:
+                        with self.assertLogs(level="ERROR"):
+                            input_version = solution._DetectSolutionVersion(file_object)
+
+                    self.assertEqual(input_version, expected_input_version)
+
     def testGetProjectFilename(self):
         """Tests the _GetProjectFilename function."""
         solution = solutions.VSSolution()
@@ -49,6 +127,10 @@ class VSSolutionTest(test_lib.BaseTestCase):
         project_file_reader = solution._GetProjectFileReader("bogus")
         self.assertIsNone(project_file_reader)
 
+        # Test that every call returns a new project file reader.
+        project_file_reader = solution._GetProjectFileReader("2008")
+        self.assertIsNot(project_file_reader, solution._GetProjectFileReader("2008"))
+
     def testGetProjectFileWriter(self):
         """Tests the _GetProjectFileWriter function."""
         solution = solutions.VSSolution()
@@ -71,6 +153,10 @@ class VSSolutionTest(test_lib.BaseTestCase):
         project_file_writer = solution._GetProjectFileWriter("bogus")
         self.assertIsNone(project_file_writer)
 
+        # Test that every call returns a new project file writer.
+        project_file_writer = solution._GetProjectFileWriter("2008")
+        self.assertIsNot(project_file_writer, solution._GetProjectFileWriter("2008"))
+
     def testGetSolutionFileReader(self):
         """Tests the _GetSolutionFileReader function."""
         solution = solutions.VSSolution()
@@ -93,6 +179,10 @@ class VSSolutionTest(test_lib.BaseTestCase):
         solution_file_reader = solution._GetSolutionFileReader("bogus")
         self.assertIsNone(solution_file_reader)
 
+        # Test that every call returns a new solution file reader.
+        solution_file_reader = solution._GetSolutionFileReader("2008")
+        self.assertIsNot(solution_file_reader, solution._GetSolutionFileReader("2008"))
+
     def testGetSolutionFileWriter(self):
         """Tests the _GetSolutionFileWriter function."""
         solution = solutions.VSSolution()
@@ -115,9 +205,294 @@ class VSSolutionTest(test_lib.BaseTestCase):
         solution_file_writer = solution._GetSolutionFileWriter("bogus")
         self.assertIsNone(solution_file_writer)
 
+        # Test that every call returns a new solution file writer.
+        solution_file_writer = solution._GetSolutionFileWriter("2008")
+        self.assertIsNot(solution_file_writer, solution._GetSolutionFileWriter("2008"))
+
     # TODO: add tests for _WriteProject
     # TODO: add tests for _WriteSolution
-    # TODO: add tests for Convert
+
+    def _ReadOutputFiles(self, output_directory):
+        """Reads the output files.
+
+        Args:
+          output_directory (str): path of the output directory.
+
+        Returns:
+          dict[str, bytes]: data of the output files per relative path.
+        """
+        output_files = {}
+        for directory_path, _, filenames in os.walk(output_directory):
+            for filename in filenames:
+                path = os.path.join(directory_path, filename)
+                with open(path, "rb") as file_object:
+                    relative_path = os.path.relpath(path, output_directory)
+                    output_files[relative_path] = file_object.read()
+
+        return output_files
+
+    @test_lib.skipUnlessHasTestFile(["2008.sln"])
+    @test_lib.skipUnlessHasTestFile(["2008.vcproj"])
+    def testConvert(self):
+        """Tests the Convert function."""
+        solution = solutions.VSSolution()
+
+        current_working_directory = os.getcwd()
+        with test_lib.TempDirectory() as temp_directory:
+            input_sln_path = self._CreateTestSolution(
+                os.path.join(temp_directory, "input")
+            )
+
+            output_files_per_jobs = []
+            for jobs in (1, 2):
+                output_directory = os.path.join(temp_directory, f"output{jobs:d}")
+                os.mkdir(output_directory)
+
+                os.chdir(output_directory)
+                try:
+                    result = solution.Convert(input_sln_path, "2022", jobs=jobs)
+                finally:
+                    os.chdir(current_working_directory)
+
+                self.assertTrue(result)
+
+                output_files = self._ReadOutputFiles(output_directory)
+                output_files_per_jobs.append(output_files)
+
+        self.assertEqual(len(output_files_per_jobs[0]), 4)
+        self.assertIn(
+            os.path.join("vs2022", "libcerror", "libcerror.vcxproj"),
+            output_files_per_jobs[0],
+        )
+        self.assertEqual(output_files_per_jobs[0], output_files_per_jobs[1])
+
+    @test_lib.skipUnlessHasTestFile(["2008.sln"])
+    @test_lib.skipUnlessHasTestFile(["2008.vcproj"])
+    def testConvertToVersions(self):
+        """Tests the ConvertToVersions function."""
+        solution = solutions.VSSolution()
+
+        current_working_directory = os.getcwd()
+        with test_lib.TempDirectory() as temp_directory:
+            input_sln_path = self._CreateTestSolution(
+                os.path.join(temp_directory, "input")
+            )
+
+            output_directory = os.path.join(temp_directory, "output")
+            os.mkdir(output_directory)
+
+            os.chdir(output_directory)
+            try:
+                result = solution.ConvertToVersions(input_sln_path, ["2008", "2026"])
+                self.assertTrue(result)
+
+                expected_output_files = self._ReadOutputFiles(output_directory)
+
+                shutil.rmtree(os.path.join(output_directory, "vs2008"))
+                shutil.rmtree(os.path.join(output_directory, "vs2026"))
+
+                for output_version in ("2008", "2026"):
+                    result = solution.Convert(input_sln_path, output_version)
+                    self.assertTrue(result)
+
+            finally:
+                os.chdir(current_working_directory)
+
+            output_files = self._ReadOutputFiles(output_directory)
+
+        self.assertEqual(len(expected_output_files), 8)
+        self.assertIn(
+            os.path.join("vs2026", "2008.slnx"),
+            expected_output_files,
+        )
+        self.assertEqual(output_files, expected_output_files)
+
+        # The solution file and the identical project files are parsed once.
+        self.assertEqual(len(solution._parsed_files), 2)
+
+    @test_lib.skipUnlessHasTestFile(["2008.sln"])
+    @test_lib.skipUnlessHasTestFile(["2008.vcproj"])
+    def testConvertToVersionsAsync(self):
+        """Tests the ConvertToVersionsAsync function."""
+        solution = solutions.VSSolution()
+
+        current_working_directory = os.getcwd()
+        with test_lib.TempDirectory() as temp_directory:
+            input_sln_path = self._CreateTestSolution(
+                os.path.join(temp_directory, "input")
+            )
+
+            output_directories = []
+            for name in ("output1", "output2", "output3"):
+                output_directory = os.path.join(temp_directory, name)
+                os.mkdir(output_directory)
+                output_directories.append(output_directory)
+
+            async def _ConvertToVersions():
+                semaphore = asyncio.Semaphore(2)
+                async with solution:
+                    return await asyncio.gather(
+                        *[
+                            solution.ConvertToVersionsAsync(
+                                input_sln_path,
+                                ["2008", "2022"],
+                                semaphore=semaphore,
+                                working_directory=output_directory,
+                            )
+                            for output_directory in output_directories
+                        ]
+                    )
+
+            results = asyncio.run(_ConvertToVersions())
+            self.assertEqual(results, [True, True, True])
+            self.assertEqual(os.getcwd(), current_working_directory)
+            self.assertIsNone(solution._asynchronous_executor)
+
+            output_files_per_directory = [
+                self._ReadOutputFiles(output_directory)
+                for output_directory in output_directories
+            ]
+
+        self.assertEqual(len(output_files_per_directory[0]), 8)
+        self.assertEqual(output_files_per_directory[0], output_files_per_directory[1])
+        self.assertEqual(output_files_per_directory[0], output_files_per_directory[2])
+
+    @test_lib.skipUnlessHasTestFile(["2008.sln"])
+    @test_lib.skipUnlessHasTestFile(["2008.vcproj"])
+    def testConvertToVersionsAsyncWithCancel(self):
+        """Tests cancelling the ConvertToVersionsAsync function."""
+        solution = solutions.VSSolution()
+
+        with test_lib.TempDirectory() as temp_directory:
+            input_sln_path = self._CreateTestSolution(
+                os.path.join(temp_directory, "input")
+            )
+
+            output_directory = os.path.join(temp_directory, "output")
+            os.mkdir(output_directory)
+
+            async def _ConvertToVersions():
+                async with solution:
+                    task = asyncio.create_task(
+                        solution.ConvertToVersionsAsync(
+                            input_sln_path,
+                            ["2008", "2022"],
+                            working_directory=output_directory,
+                        )
+                    )
+                    # Wait for the conversion to be submitted to the process
+                    # pool.
+                    while not solution._asynchronous_executor:
+                        await asyncio.sleep(0)
+
+                    executor = solution._asynchronous_executor
+
+                    task.cancel()
+                    with self.assertRaises(asyncio.CancelledError):
+                        await task
+
+                return executor
+
+            executor = asyncio.run(_ConvertToVersions())
+
+        self.assertIsNone(solution._asynchronous_executor)
+
+        # Test that the process pool has been shut down.
+        with self.assertRaises(RuntimeError):
+            executor.submit(os.getpid)
+
+    @test_lib.skipUnlessHasTestFile(["2008.sln"])
+    @test_lib.skipUnlessHasTestFile(["2008.vcproj"])
+    def testConvertToVersionsWithVcxprojInput(self):
+        """Tests the ConvertToVersions function with .vcxproj based input."""
+        solution = solutions.VSSolution()
+
+        current_working_directory = os.getcwd()
+        with test_lib.TempDirectory() as temp_directory:
+            input_sln_path = self._CreateTestSolution(
+                os.path.join(temp_directory, "input")
+            )
+
+            output_directory = os.path.join(temp_directory, "output")
+            os.mkdir(output_directory)
+
+            os.chdir(output_directory)
+            try:
+                result = solution.ConvertToVersions(input_sln_path, ["2022", "2026"])
+                self.assertTrue(result)
+
+                expected_output_files = self._ReadOutputFiles(
+                    os.path.join(output_directory, "vs2026")
+                )
+
+                os.rename("vs2022", "input")
+                shutil.rmtree("vs2026")
+
+                input_sln_path = os.path.join(output_directory, "input", "2008.sln")
+                result = solution.Convert(input_sln_path, "2026")
+                self.assertTrue(result)
+
+            finally:
+                os.chdir(current_working_directory)
+
+            output_files = self._ReadOutputFiles(
+                os.path.join(output_directory, "vs2026")
+            )
+
+        self.assertEqual(len(expected_output_files), 4)
+        self.assertEqual(output_files, expected_output_files)
+
+    @test_lib.skipUnlessHasTestFile(["2008.sln"])
+    @test_lib.skipUnlessHasTestFile(["2008.vcproj"])
+    def testConvertToVersionsWithVcxprojInputTo2008(self):
+        """Tests the ConvertToVersions function with .vcxproj based input to 2008."""
+        solution = solutions.VSSolution()
+
+        expected_project_section = (
+            b'"cerror_test_error\\cerror_test_error.vcproj", '
+            b'"{E2F616EC-1326-453F-8FC5-29701EC5A031}"\r\n'
+            b"\tProjectSection(ProjectDependencies) = postProject\r\n"
+            b"\t\t{C42F5217-137D-4F10-9D6A-3C6D44E43453} = "
+            b"{C42F5217-137D-4F10-9D6A-3C6D44E43453}\r\n"
+            b"\tEndProjectSection\r\n"
+        )
+
+        current_working_directory = os.getcwd()
+        with test_lib.TempDirectory() as temp_directory:
+            input_sln_path = self._CreateTestSolution(
+                os.path.join(temp_directory, "input")
+            )
+
+            output_directory = os.path.join(temp_directory, "output")
+            os.mkdir(output_directory)
+
+            os.chdir(output_directory)
+            try:
+                result = solution.ConvertToVersions(input_sln_path, ["2022", "2026"])
+                self.assertTrue(result)
+
+                for input_version, solution_filename in (
+                    ("2022", "2008.sln"),
+                    ("2026", "2008.slnx"),
+                ):
+                    for jobs in (1, 2):
+                        input_sln_path = os.path.join(
+                            output_directory, f"vs{input_version:s}", solution_filename
+                        )
+                        result = solution.Convert(input_sln_path, "2008", jobs=jobs)
+                        self.assertTrue(result)
+
+                        with open(
+                            os.path.join(output_directory, "vs2008", "2008.sln"), "rb"
+                        ) as file_object:
+                            output_data = file_object.read()
+
+                        self.assertIn(expected_project_section, output_data)
+
+                        shutil.rmtree("vs2008")
+
+            finally:
+                os.chdir(current_working_directory)
 
 
 if __name__ == "__main__":
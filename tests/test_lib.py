@@ -35,6 +35,32 @@ class BaseTestCase(unittest.TestCase):
     # conventions.
     maxDiff = None
 
+    def _CreateTestSolution(self, input_directory):
+        """Creates a test solution with a project file per project.
+
+        Args:
+          input_directory (str): path of the directory to create the test
+              solution in, which should not exist.
+
+        Returns:
+          str: path of the test solution file.
+        """
+        os.makedirs(input_directory)
+
+        input_sln_path = os.path.join(input_directory, "2008.sln")
+        shutil.copyfile(self._GetTestFilePath(["2008.sln"]), input_sln_path)
+
+        for project_name in ("cerror_test_error", "cerror_test_support", "libcerror"):
+            project_directory = os.path.join(input_directory, project_name)
+            os.mkdir(project_directory)
+
+            shutil.copyfile(
+                self._GetTestFilePath(["2008.vcproj"]),
+                os.path.join(project_directory, f"{project_name:s}.vcproj"),
+            )
+
+        return input_sln_path
+
     def _GetTestFilePath(self, path_segments):
         """Retrieves the path of a test file in the test data directory.
 
@@ -30,6 +30,58 @@ class FileWriterTest(test_lib.BaseTestCase):
 
             file_writer.Close()
 
+    def testOpenFileObject(self):
+        """Tests the OpenFileObject function."""
+        file_object = io.BytesIO()
+
+        file_writer = writers.FileWriter()
+        file_writer.OpenFileObject(file_object)
+
+        file_writer.WriteLine("First line of text")
+
+        file_writer.Close()
+
+        self.assertFalse(file_object.closed)
+        self.assertEqual(file_object.getvalue(), b"First line of text\r\n")
+
+    def testNumberOfWriteCalls(self):
+        """Tests the number_of_write_calls property."""
+        with test_lib.TempDirectory() as temp_directory:
+            filename = os.path.join(temp_directory, "testfile")
+
+            file_writer = writers.FileWriter()
+            file_writer.Open(filename)
+
+            file_writer.WriteLines(["First line of text", "Second line of text"])
+            file_writer.WriteLine("Third line of text")
+            self.assertEqual(file_writer.number_of_write_calls, 0)
+
+            file_writer.Close()
+            self.assertEqual(file_writer.number_of_write_calls, 1)
+
+            with open(filename, "rb") as file_object:
+                output_data = file_object.read()
+
+            expected_output_data = (
+                b"First line of text\r\nSecond line of text\r\nThird line of text\r\n"
+            )
+            self.assertEqual(output_data, expected_output_data)
+
+            file_writer = writers.FileWriter(buffered=False)
+            file_writer.Open(filename)
+
+            file_writer.WriteLines(["First line of text", "Second line of text"])
+            file_writer.WriteLine("Third line of text")
+            self.assertEqual(file_writer.number_of_write_calls, 2)
+
+            file_writer.Close()
+            self.assertEqual(file_writer.number_of_write_calls, 2)
+
+            with open(filename, "rb") as file_object:
+                output_data = file_object.read()
+
+            self.assertEqual(output_data, expected_output_data)
+
     def testWriteBinaryData(self):
         """Tests the WriteBinaryData function."""
         file_writer = writers.FileWriter()
@@ -0,0 +1,238 @@
+#!/usr/bin/env python3
+"""Script to benchmark the Visual Studio 2008 project file reader."""
+
+import argparse
+import importlib.util
+import os
+import subprocess
+import sys
+import tempfile
+import timeit
+
+# Change PYTHONPATH to include vstools.
+sys.path.insert(0, ".")
+
+from vstools import readers  # pylint: disable=wrong-import-position
+
+
+def WriteTestProjectFile(path, number_of_files):
+    """Writes a synthetic Visual Studio 2008 project file.
+
+    Args:
+      path (str): path of the project file.
+      number_of_files (int): number of source and header files in the project.
+    """
+    lines = [
+        '<?xml version="1.0" encoding="Windows-1252"?>',
+        "<VisualStudioProject",
+        '\tProjectType="Visual C++"',
+        '\tVersion="9,00"',
+        '\tName="libtest"',
+        '\tProjectGUID="{C42F5217-137D-4F10-9D6A-3C6D44E43453}"',
+        '\tRootNamespace="libtest"',
+        '\tTargetFrameworkVersion="131072"',
+        "\t>",
+        "\t<Configurations>",
+    ]
+    for configuration_name in ("Release", "VSDebug"):
+        lines.extend(
+            [
+                "\t\t<Configuration",
+                f'\t\t\tName="{configuration_name:s}|Win32"',
+                '\t\t\tConfigurationType="2"',
+                '\t\t\tCharacterSet="1"',
+                "\t\t\t>",
+                "\t\t\t<Tool",
+                '\t\t\t\tName="VCCLCompilerTool"',
+                '\t\t\t\tAdditionalIncludeDirectories="..\\..\\include;..\\..\\common"',
+                '\t\t\t\tPreprocessorDefinitions="_CRT_SECURE_NO_DEPRECATE"',
+                '\t\t\t\tRuntimeLibrary="2"',
+                '\t\t\t\tWarningLevel="4"',
+                '\t\t\t\tCompileAs="1"',
+                "\t\t\t/>",
+                "\t\t\t<Tool",
+                '\t\t\t\tName="VCLinkerTool"',
+                '\t\t\t\tOutputFile="$(OutDir)\\$(ProjectName).dll"',
+                '\t\t\t\tAdditionalDependencies="a.lib b.lib"',
+                '\t\t\t\tTargetMachine="1"',
+                "\t\t\t/>",
+                "\t\t</Configuration>",
+            ]
+        )
+
+    lines.extend(["\t</Configurations>", "\t<Files>"])
+
+    for filter_name, extension in (("Source Files", "c"), ("Header Files", "h")):
+        lines.extend(["\t\t<Filter", f'\t\t\tName="{filter_name:s}"', "\t\t\t>"])
+
+        for file_index in range(number_of_files // 2):
+            lines.extend(
+                [
+                    "\t\t\t<File",
+                    f'\t\t\t\tRelativePath="..\\..\\libtest\\file{file_index:d}.'
+                    f'{extension:s}"',
+                    "\t\t\t\t>",
+                    "\t\t\t</File>",
+                ]
+            )
+
+        lines.append("\t\t</Filter>")
+
+    lines.extend(["\t</Files>", "</VisualStudioProject>", ""])
+
+    with open(path, "wb") as file_object:
+        file_object.write("\r\n".join(lines).encode("utf-8"))
+
+
+def ImportBaselineReaders(revision, temp_directory):
+    """Imports the project file readers of a specific revision.
+
+    Args:
+      revision (str): git revision of the readers, such as "HEAD~1".
+      temp_directory (str): path of a temporary directory to store the readers
+          module in.
+
+    Returns:
+      module: readers module of the revision.
+
+    Raises:
+      RuntimeError: if the readers module cannot be retrieved.
+    """
+    try:
+        readers_data = subprocess.check_output(
+            ["git", "show", f"{revision:s}:vstools/readers.py"]
+        )
+    except (OSError, subprocess.CalledProcessError) as exception:
+        raise RuntimeError(
+            f"Unable to retrieve readers of revision: {revision:s}"
+        ) from exception
+
+    path = os.path.join(temp_directory, "baseline_readers.py")
+    with open(path, "wb") as file_object:
+        file_object.write(readers_data)
+
+    module_spec = importlib.util.spec_from_file_location("baseline_readers", path)
+    readers_module = importlib.util.module_from_spec(module_spec)
+    module_spec.loader.exec_module(readers_module)
+
+    return readers_module
+
+
+def ReadTestProjectFile(path, readers_module=readers):
+    """Reads a Visual Studio 2008 project file.
+
+    Args:
+      path (str): path of the project file.
+      readers_module (Optional[module]): module that provides the project file
+          reader.
+
+    Returns:
+      VSProjectInformation: project information.
+    """
+    project_reader = readers_module.VS2008ProjectFileReader()
+    project_reader.Open(path)
+    project_reader.ReadHeader()
+    project_information = project_reader.ReadProject()
+    project_reader.Close()
+
+    return project_information
+
+
+def Main():
+    """Entry point of console script to benchmark the project file reader.
+
+    Returns:
+      int: exit code that is provided to sys.exit().
+    """
+    argument_parser = argparse.ArgumentParser(
+        description=(
+            "Benchmarks the Visual Studio 2008 project file reader on a "
+            "synthetic project file."
+        )
+    )
+    argument_parser.add_argument(
+        "--baseline",
+        dest="baseline",
+        action="store",
+        metavar="REVISION",
+        default=None,
+        help=(
+            "git revision of the reader to compare against, such as the "
+            "revision before the reader was changed."
+        ),
+    )
+    argument_parser.add_argument(
+        "--number_of_files",
+        "--number-of-files",
+        dest="number_of_files",
+        type=int,
+        action="store",
+        metavar="NUMBER",
+        default=50000,
+        help="number of files in the synthetic project.",
+    )
+    argument_parser.add_argument(
+        "--repeat",
+        dest="repeat",
+        type=int,
+        action="store",
+        metavar="NUMBER",
+        default=5,
+        help="number of times to read the synthetic project.",
+    )
+    options = argument_parser.parse_args()
+
+    readers_modules = [("current", readers)]
+
+    with tempfile.TemporaryDirectory() as temp_directory:
+        if options.baseline:
+            try:
+                baseline_readers = ImportBaselineReaders(
+                    options.baseline, temp_directory
+                )
+            except RuntimeError as exception:
+                print(f"{exception!s}.")
+                return 1
+
+            readers_modules.insert(0, ("baseline", baseline_readers))
+
+        path = os.path.join(temp_directory, "libtest.vcproj")
+        WriteTestProjectFile(path, options.number_of_files)
+
+        best_timings = {}
+        for name, readers_module in readers_modules:
+            project_information = ReadTestProjectFile(path, readers_module)
+            number_of_files = len(project_information.source_files) + len(
+                project_information.header_files
+            )
+            if number_of_files != options.number_of_files:
+                print(
+                    f"Read {number_of_files:d} of {options.number_of_files:d} "
+                    f"files with {name:s} reader."
+                )
+                return 1
+
+            timings = timeit.repeat(
+                lambda readers_module=readers_module: ReadTestProjectFile(
+                    path, readers_module
+                ),
+                repeat=options.repeat,
+                number=1,
+            )
+            best_timings[name] = min(timings)
+
+            print(
+                f"Read project with {options.number_of_files:d} files with "
+                f"{name:s} reader in: {best_timings[name]:.3f} seconds (best of "
+                f"{options.repeat:d})"
+            )
+
+    if options.baseline and best_timings["current"]:
+        speedup = best_timings["baseline"] / best_timings["current"]
+        print(f"Speedup compared to {options.baseline:s}: {speedup:.2f}x")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(Main())
@@ -0,0 +1,353 @@
+"""Automake Makefile.am classes."""
+
+import hashlib
+import io
+import logging
+import re
+
+
+class MakefileAmAssignment:
+    """Makefile.am variable assignment.
+
+    Attributes:
+      conditions (tuple[str]): names of the automake conditionals the assignment
+          depends on, where a name prefixed with "!" represents the else branch.
+      line_number (int): line number of the start of the assignment.
+      name (str): name of the variable.
+      operator (str): assignment operator, such as "=" or "+=".
+      value (str): value with the continuation lines joined.
+    """
+
+    def __init__(self, name, operator, value, conditions=(), line_number=0):
+        """Initializes a Makefile.am variable assignment.
+
+        Args:
+          name (str): name of the variable.
+          operator (str): assignment operator, such as "=" or "+=".
+          value (str): value with the continuation lines joined.
+          conditions (Optional[tuple[str]]): names of the automake conditionals
+              the assignment depends on.
+          line_number (Optional[int]): line number of the start of the
+              assignment.
+        """
+        super().__init__()
+        self.conditions = conditions
+        self.line_number = line_number
+        self.name = name
+        self.operator = operator
+        self.value = value
+
+
+class MakefileAm:
+    """Makefile.am.
+
+    The Makefile.am is parsed into variable assignments in order of appearance.
+    Rules and their recipes are ignored.
+
+    Attributes:
+      assignments (list[MakefileAmAssignment]): variable assignments.
+      data_hash (str): SHA-256 of the Makefile.am data or None if not available.
+      path (str): path of the Makefile.am file.
+    """
+
+    _ASSIGNMENT_RE = re.compile(r"^([A-Za-z0-9_@.]+)\s*([+:?]?=)\s*(.*)$")
+
+    _CONDITIONAL_RE = re.compile(r"^(if|else|endif)\b\s*(.*)$")
+
+    _VARIABLE_REFERENCE_RE = re.compile(
+        r"\$\(([A-Za-z0-9_@.]+)\)|\$\{([A-Za-z0-9_@.]+)\}"
+    )
+
+    def __init__(self, path):
+        """Initializes a Makefile.am.
+
+        Args:
+          path (str): path of the Makefile.am file.
+        """
+        super().__init__()
+        self._assignments_per_name = {}
+        self._expanded_values = {}
+        self.assignments = []
+        self.data_hash = None
+        self.path = path
+
+    def _ExpandVariable(self, name, conditionals, names_in_expansion):
+        """Expands a variable.
+
+        An assignment with the "=" or ":=" operator replaces the value of
+        earlier assignments with the same automake conditions, an assignment
+        with the "+=" operator appends to it and an assignment with the "?="
+        operator only sets it when not set before.
+
+        Args:
+          name (str): name of the variable.
+          conditionals (frozenset[str]): names of the automake conditionals
+              that are true or None to combine the values of every branch.
+          names_in_expansion (set[str]): names of the variables that are being
+              expanded, used to detect recursive references.
+
+        Returns:
+          tuple[str, bool]: expanded value of the variable or None if the
+              variable is not defined in the Makefile.am and True if the
+              expansion is complete or False if a recursive reference was
+              not expanded.
+        """
+        expanded_value = self._expanded_values.get((name, conditionals), None)
+        if expanded_value is not None:
+            return expanded_value, True
+
+        assignments = self._assignments_per_name.get(name, None)
+        if not assignments:
+            return None, True
+
+        if name in names_in_expansion:
+            return None, False
+
+        values_per_conditions = {}
+        for assignment in assignments:
+            if conditionals is not None and not all(
+                (
+                    condition[1:] not in conditionals
+                    if condition.startswith("!")
+                    else condition in conditionals
+                )
+                for condition in assignment.conditions
+            ):
+                continue
+
+            values = values_per_conditions.get(assignment.conditions, None)
+            if assignment.operator == "+=" and values is not None:
+                values.append(assignment.value)
+            elif assignment.operator != "?=" or values is None:
+                values_per_conditions[assignment.conditions] = [assignment.value]
+
+        names_in_expansion.add(name)
+
+        is_complete = True
+        expanded_values = []
+        for values in values_per_conditions.values():
+            for value in values:
+                expanded_value, is_complete_value = self._ExpandValue(
+                    value, conditionals, names_in_expansion
+                )
+                is_complete = is_complete and is_complete_value
+                if expanded_value:
+                    expanded_values.append(expanded_value)
+
+        names_in_expansion.remove(name)
+
+        if len(values_per_conditions) > 1:
+            # Remove the values that are defined by multiple branches.
+            expanded_values = [
+                " ".join(dict.fromkeys(" ".join(expanded_values).split()))
+            ]
+
+        expanded_value = " ".join(expanded_values)
+
+        # A partial expansion, due to a recursive reference, depends on where
+        # the expansion started and is therefore not kept.
+        if is_complete:
+            self._expanded_values[(name, conditionals)] = expanded_value
+
+        return expanded_value, is_complete
+
+    def _ExpandValue(self, value, conditionals, names_in_expansion):
+        """Expands the variable references in a value.
+
+        References to variables that are not defined in the Makefile.am, such
+        as $(top_srcdir), are preserved.
+
+        Args:
+          value (str): value.
+          conditionals (frozenset[str]): names of the automake conditionals
+              that are true or None to combine the values of every branch.
+          names_in_expansion (set[str]): names of the variables that are being
+              expanded, used to detect recursive references.
+
+        Returns:
+          tuple[str, bool]: expanded value and True if the expansion is complete
+              or False if a recursive reference was not expanded.
+        """
+        if "$" not in value:
+            return value, True
+
+        is_complete = True
+
+        def _ReplaceVariableReference(match):
+            nonlocal is_complete
+
+            name = match.group(1) or match.group(2)
+            expanded_value, is_complete_value = self._ExpandVariable(
+                name, conditionals, names_in_expansion
+            )
+            is_complete = is_complete and is_complete_value
+            if expanded_value is None:
+                return match.group(0)
+            return expanded_value
+
+        value = self._VARIABLE_REFERENCE_RE.sub(_ReplaceVariableReference, value)
+
+        return value, is_complete
+
+    def _ReadLogicalLines(self, lines):
+        """Reads logical lines.
+
+        Continuation lines are joined, comments are removed and recipe lines,
+        that start with a tab, are skipped.
+
+        Args:
+          lines (list[str]): physical lines.
+
+        Yields:
+          tuple[int, str]: line number and logical line.
+        """
+        logical_line_number = 0
+        logical_line_parts = []
+
+        for line_number, line in enumerate(lines, start=1):
+            line = line.rstrip("\r\n")
+
+            if not logical_line_parts:
+                if line.startswith("\t"):
+                    continue
+
+                logical_line_number = line_number
+
+            stripped_line = line.strip()
+            if stripped_line.endswith("\\"):
+                if not stripped_line.endswith(" \\") and len(stripped_line) > 1:
+                    logging.warning(
+                        f"Detected missing space before \\ in line: "
+                        f'{line_number:d} "{stripped_line:s}" ({self.path:s})'
+                    )
+
+                logical_line_parts.append(stripped_line[:-1].strip())
+                continue
+
+            logical_line_parts.append(stripped_line)
+
+            logical_line = " ".join(part for part in logical_line_parts if part)
+            logical_line_parts = []
+
+            if "#" in logical_line:
+                logical_line, _, _ = logical_line.partition("#")
+                logical_line = logical_line.rstrip()
+
+            if logical_line:
+                yield logical_line_number, logical_line
+
+        if logical_line_parts:
+            logical_line = " ".join(part for part in logical_line_parts if part)
+            if logical_line:
+                yield logical_line_number, logical_line
+
+    def AddAssignment(self, assignment):
+        """Adds a variable assignment.
+
+        Args:
+          assignment (MakefileAmAssignment): variable assignment.
+        """
+        self.assignments.append(assignment)
+        self._assignments_per_name.setdefault(assignment.name, []).append(assignment)
+        self._expanded_values = {}
+
+    def GetPrograms(self):
+        """Retrieves the program names.
+
+        Returns:
+          list[str]: names of the programs defined by the *_PROGRAMS variables.
+        """
+        programs = []
+        for name in self._assignments_per_name:
+            if name.endswith("_PROGRAMS"):
+                programs.extend(self.GetValues(name))
+
+        return programs
+
+    def GetValues(self, name, conditionals=None):
+        """Retrieves the values of a variable.
+
+        Args:
+          name (str): name of the variable.
+          conditionals (Optional[set[str]]): names of the automake conditionals
+              that are true, where None represents that the values of every
+              branch of the automake conditionals are combined, without
+              duplicates.
+
+        Returns:
+          list[str]: values of the variable, with variable references expanded,
+              or an empty list if the variable is not defined.
+        """
+        if conditionals is not None:
+            conditionals = frozenset(conditionals)
+
+        expanded_value, _ = self._ExpandVariable(name, conditionals, set())
+        if not expanded_value:
+            return []
+
+        return expanded_value.split()
+
+    def GetVariableNames(self):
+        """Retrieves the names of the variables.
+
+        Returns:
+          list[str]: names of the variables in order of their first assignment.
+        """
+        return list(self._assignments_per_name.keys())
+
+    def Read(self):
+        """Reads the Makefile.am."""
+        with io.open(self.path, "rb") as file_object:
+            data = file_object.read()
+
+        self.ReadData(data)
+
+    def ReadData(self, data):
+        """Reads the Makefile.am from data.
+
+        Args:
+          data (bytes): Makefile.am data.
+        """
+        self.data_hash = hashlib.sha256(data).hexdigest()
+
+        text_io_wrapper = io.TextIOWrapper(io.BytesIO(data), encoding="utf8")
+        lines = text_io_wrapper.readlines()
+
+        conditions = []
+
+        for line_number, line in self._ReadLogicalLines(lines):
+            match = self._CONDITIONAL_RE.match(line)
+            if match:
+                directive, condition = match.groups()
+                if directive == "if":
+                    conditions.append(condition)
+
+                elif not conditions:
+                    logging.warning(
+                        f"Unmatched {directive:s} in line: {line_number:d} "
+                        f"({self.path:s})"
+                    )
+
+                elif directive == "else":
+                    condition = conditions.pop()
+                    if condition.startswith("!"):
+                        conditions.append(condition[1:])
+                    else:
+                        conditions.append(f"!{condition:s}")
+
+                else:
+                    conditions.pop()
+
+                continue
+
+            match = self._ASSIGNMENT_RE.match(line)
+            if match:
+                name, operator, value = match.groups()
+                assignment = MakefileAmAssignment(
+                    name,
+                    operator,
+                    value,
+                    conditions=tuple(conditions),
+                    line_number=line_number,
+                )
+                self.AddAssignment(assignment)
@@ -0,0 +1,386 @@
+"""Batch conversion classes."""
+
+import concurrent.futures
+import logging
+import os
+import time
+
+from vstools import filesystem
+from vstools import libyal
+from vstools import solutions
+
+
+class BatchConversionResult:
+    """Batch conversion result.
+
+    Attributes:
+      duration (float): duration of the conversion in seconds.
+      error (str): error that prevented the conversion or None if not set.
+      input_path (str): path of the source directory or solution file.
+      result (bool): True if the conversion was successful or False if not.
+    """
+
+    def __init__(self, input_path):
+        """Initializes a batch conversion result.
+
+        Args:
+          input_path (str): path of the source directory or solution file.
+        """
+        super().__init__()
+        self.duration = 0.0
+        self.error = None
+        self.input_path = input_path
+        self.result = False
+
+
+class ConversionOptions:
+    """Conversion options.
+
+    Attributes:
+      extend_with_x64 (bool): True if the solution should be extended with
+          configuration for the x64 platform.
+      generate_python_dll (bool): True if a Python module DLL should be
+          generated.
+      guid_namespace (uuid.UUID): namespace to derive the GUIDs of new projects
+          from, where None represents random GUIDs.
+      python_path (str): path to the Python installation.
+      with_dokany (bool): True if DokanY should be used instead of Dokan.
+    """
+
+    def __init__(self):
+        """Initializes conversion options."""
+        super().__init__()
+        self.extend_with_x64 = True
+        self.generate_python_dll = True
+        self.guid_namespace = None
+        self.python_path = "C:\\Python314"
+        self.with_dokany = False
+
+
+class BatchConverter:
+    """Converts multiple source directories and solution files.
+
+    The Makefile.am cache, project memo and process pool are shared between
+    the conversions.
+
+    Attributes:
+      project_memo (ProjectMemo): memo of library and third party projects.
+    """
+
+    def __init__(
+        self,
+        output_versions,
+        conversion_options=None,
+        jobs=1,
+        cost_model=None,
+        executor=None,
+        makefile_am_cache=None,
+        project_memo=None,
+    ):
+        """Initializes a batch converter.
+
+        Args:
+          output_versions (list[str]): output Visual Studio versions.
+          conversion_options (Optional[ConversionOptions]): conversion options,
+              where None represents the default conversion options.
+          jobs (Optional[int]): maximum number of projects to convert at the
+              same time.
+          cost_model (Optional[CostModel]): cost model to schedule parallel
+              tasks with, where None represents a cost model without recorded
+              durations.
+          executor (Optional[concurrent.futures.ProcessPoolExecutor]): process
+              pool shared with other batch converters, where None represents
+              that a process pool is created when the batch converter is opened.
+          makefile_am_cache (Optional[MakefileAmCache]): cache of read
+              Makefile.am files, where None represents no cache.
+          project_memo (Optional[ProjectMemo]): memo of library and third party
+              projects shared with other batch converters, where None represents
+              a memo of the batch converter.
+        """
+        super().__init__()
+        self._conversion_options = conversion_options or ConversionOptions()
+        self._cost_model = cost_model
+        self._executor = None
+        self._shared_executor = executor
+        self._jobs = jobs
+        self._libyal_solution = None
+        self._makefile_am_cache = makefile_am_cache
+        self._output_versions = output_versions
+        self._solution = None
+        self.project_memo = project_memo or libyal.ProjectMemo()
+
+    def _GetChangedInputPaths(self, input_paths, file_modification_indexes):
+        """Retrieves the inputs of which a watched file has changed.
+
+        Args:
+          input_paths (list[str]): paths of the source directories or solution
+              files.
+          file_modification_indexes (dict[str, FileModificationIndex]): file
+              modification index of the watched files per input path.
+
+        Returns:
+          list[str]: paths of the changed inputs, in input order.
+        """
+        changed_input_paths = []
+        for input_path in input_paths:
+            watched_paths = self._GetWatchedPaths(os.path.abspath(input_path))
+            if file_modification_indexes[input_path].Update(watched_paths):
+                changed_input_paths.append(input_path)
+
+        return changed_input_paths
+
+    def _GetWatchedPaths(self, input_path):
+        """Retrieves the paths of the files that a conversion depends on.
+
+        Args:
+          input_path (str): absolute path of the source directory or solution
+              file.
+
+        Returns:
+          list[str]: paths of the watched files.
+
+        Raises:
+          OSError: if the source directory cannot be read.
+        """
+        output_directory_names = frozenset(
+            f"vs{output_version:s}" for output_version in self._output_versions
+        )
+
+        if os.path.isdir(input_path):
+            watched_paths = [os.path.join(input_path, "configure.ac")]
+
+            # Every subdirectory is watched for a Makefile.am, such that added
+            # and removed directories are detected as well.
+            with os.scandir(input_path) as scandir_iterator:
+                directory_names = sorted(
+                    directory_entry.name
+                    for directory_entry in scandir_iterator
+                    if directory_entry.is_dir()
+                    and directory_entry.name not in output_directory_names
+                )
+
+            for directory_name in directory_names:
+                watched_paths.append(
+                    os.path.join(input_path, directory_name, "Makefile.am")
+                )
+
+            # The existing solution files provide the project GUIDs.
+            if "msvscpp" in directory_names:
+                msvscpp_directory = os.path.join(input_path, "msvscpp")
+                for filename in sorted(os.listdir(msvscpp_directory)):
+                    if filename.endswith(".sln"):
+                        watched_paths.append(os.path.join(msvscpp_directory, filename))
+
+            return watched_paths
+
+        # The project files of a solution are stored in the directory that
+        # contains the solution file or its subdirectories.
+        watched_paths = [input_path]
+
+        for directory_path, directory_names, filenames in os.walk(
+            os.path.dirname(input_path)
+        ):
+            directory_names[:] = sorted(
+                directory_name
+                for directory_name in directory_names
+                if directory_name not in output_directory_names
+            )
+            for filename in sorted(filenames):
+                if filename.endswith((".vcproj", ".vcxproj")):
+                    watched_paths.append(os.path.join(directory_path, filename))
+
+        return watched_paths
+
+    def _GetWorkingDirectory(self, input_path):
+        """Retrieves the working directory to convert an input in.
+
+        The output of a source directory is written in the source directory.
+        The output of a solution file is written in the parent directory of
+        the directory that contains the solution file, such that the relative
+        paths in the solution remain valid for the output solution.
+
+        Args:
+          input_path (str): absolute path of the source directory or solution
+              file.
+
+        Returns:
+          str: absolute path of the working directory.
+        """
+        if os.path.isdir(input_path):
+            return input_path
+
+        return os.path.dirname(os.path.dirname(input_path))
+
+    def Close(self):
+        """Closes the batch converter."""
+        if self._executor and self._executor is not self._shared_executor:
+            self._executor.shutdown()
+
+        self._executor = None
+        self._libyal_solution = None
+        self._solution = None
+
+    def ConvertInput(self, input_path, working_directory=None):
+        """Converts a source directory or solution file.
+
+        Args:
+          input_path (str): path of the source directory or solution file.
+          working_directory (Optional[str]): directory to write the output in,
+              where None represents the directory derived from the input path.
+
+        Returns:
+          bool: True if the conversion was successful or False if not.
+        """
+        input_path = os.path.abspath(input_path)
+
+        if os.path.isdir(input_path):
+            input_solution = self._libyal_solution
+        else:
+            input_solution = self._solution
+
+        if working_directory is None:
+            working_directory = self._GetWorkingDirectory(input_path)
+
+        original_working_directory = os.getcwd()
+        os.chdir(working_directory)
+
+        try:
+            relative_input_path = os.path.relpath(input_path, working_directory)
+
+            return input_solution.ConvertToVersions(
+                relative_input_path, self._output_versions, jobs=self._jobs
+            )
+
+        finally:
+            os.chdir(original_working_directory)
+
+    def ConvertInputs(self, input_paths, working_directory=None):
+        """Converts multiple source directories and solution files.
+
+        A failed conversion does not stop the conversion of the remaining
+        inputs.
+
+        Args:
+          input_paths (list[str]): paths of the source directories or solution
+              files.
+          working_directory (Optional[str]): directory to write the output in,
+              where None represents the directory derived from each input path.
+
+        Yields:
+          BatchConversionResult: result per input, in input order.
+        """
+        for input_path in input_paths:
+            batch_result = BatchConversionResult(input_path)
+
+            start_time = time.perf_counter()
+            try:
+                batch_result.result = self.ConvertInput(
+                    input_path, working_directory=working_directory
+                )
+                if not batch_result.result:
+                    logging.error(f"Unable to convert: {input_path:s}")
+
+            # A malformed input should not stop the conversion of the remaining
+            # inputs.
+            except Exception as exception:  # pylint: disable=broad-except
+                batch_result.error = str(exception)
+                logging.error(
+                    f"Unable to convert: {input_path:s} with error: {exception!s}"
+                )
+
+            batch_result.duration = time.perf_counter() - start_time
+
+            yield batch_result
+
+    def Open(self):
+        """Opens the batch converter."""
+        if self._shared_executor:
+            self._executor = self._shared_executor
+
+        elif self._jobs > 1:
+            self._executor = concurrent.futures.ProcessPoolExecutor(
+                max_workers=self._jobs
+            )
+
+        conversion_options = self._conversion_options
+
+        self._libyal_solution = libyal.LibyalSourceVSSolution(
+            extend_with_x64=conversion_options.extend_with_x64,
+            generate_python_dll=conversion_options.generate_python_dll,
+            python_path=conversion_options.python_path,
+            with_dokany=conversion_options.with_dokany,
+            cost_model=self._cost_model,
+            executor=self._executor,
+            guid_namespace=conversion_options.guid_namespace,
+            makefile_am_cache=self._makefile_am_cache,
+            project_memo=self.project_memo,
+        )
+        self._solution = solutions.VSSolution(
+            extend_with_x64=conversion_options.extend_with_x64,
+            generate_python_dll=conversion_options.generate_python_dll,
+            python_path=conversion_options.python_path,
+            with_dokany=conversion_options.with_dokany,
+            cost_model=self._cost_model,
+            executor=self._executor,
+        )
+
+    def WatchInputs(self, input_paths, working_directory=None, interval=1.0):
+        """Converts source directories and solution files whenever they change.
+
+        The inputs are converted first and then again after a file they depend
+        on has changed, which is detected by polling the modification time and
+        size of the files. The solutions, with the Makefile.am files they have
+        read, and the project memo are kept between conversions, such that only
+        changed Makefile.am files are read again. Output files that are not
+        changed by a conversion are not written.
+
+        Args:
+          input_paths (list[str]): paths of the source directories or solution
+              files.
+          working_directory (Optional[str]): directory to write the output in,
+              where None represents the directory derived from each input path.
+          interval (Optional[float]): number of seconds between polls.
+
+        Yields:
+          BatchConversionResult: result per converted input.
+
+        Raises:
+          OSError: if a source directory cannot be read.
+        """
+        file_modification_indexes = {
+            input_path: filesystem.FileModificationIndex() for input_path in input_paths
+        }
+        self._GetChangedInputPaths(input_paths, file_modification_indexes)
+
+        yield from self.ConvertInputs(input_paths, working_directory=working_directory)
+
+        while True:
+            time.sleep(interval)
+
+            changed_input_paths = self._GetChangedInputPaths(
+                input_paths, file_modification_indexes
+            )
+            if not changed_input_paths:
+                continue
+
+            # Wait for the changes to settle, since editors and version control
+            # systems can write multiple files in succession.
+            while True:
+                time.sleep(interval)
+
+                settling_input_paths = self._GetChangedInputPaths(
+                    input_paths, file_modification_indexes
+                )
+                if not settling_input_paths:
+                    break
+
+                changed_input_paths = [
+                    input_path
+                    for input_path in input_paths
+                    if input_path in changed_input_paths
+                    or input_path in settling_input_paths
+                ]
+
+            yield from self.ConvertInputs(
+                changed_input_paths, working_directory=working_directory
+            )
@@ -0,0 +1,183 @@
+"""File system classes."""
+
+import os
+
+
+class FileModificationIndex:
+    """File modification index.
+
+    The modification time and size of files are indexed such that changes to
+    the files can be detected by polling.
+    """
+
+    def __init__(self):
+        """Initializes a file modification index."""
+        super().__init__()
+        self._signatures = {}
+
+    def _GetSignature(self, path):
+        """Retrieves the signature of a file.
+
+        Args:
+          path (str): path of the file.
+
+        Returns:
+          tuple[int, int]: modification time in nanoseconds and size of the file
+              or None if the file does not exist.
+        """
+        try:
+            stat_object = os.stat(path)
+        except (FileNotFoundError, NotADirectoryError):
+            return None
+
+        return stat_object.st_mtime_ns, stat_object.st_size
+
+    def Update(self, paths):
+        """Updates the index.
+
+        Args:
+          paths (list[str]): paths of the files to index.
+
+        Returns:
+          bool: True if a file was changed, added or removed since the previous
+              update.
+        """
+        signatures = {path: self._GetSignature(path) for path in paths}
+
+        has_changes = signatures != self._signatures
+        self._signatures = signatures
+
+        return has_changes
+
+
+class FileSystemSnapshot:
+    """File system snapshot.
+
+    The entries of a directory are read with a single os.scandir call the first
+    time the directory is accessed and are answered from memory afterwards. The
+    snapshot is not updated when the file system changes and hence is intended
+    to be used for the duration of a single conversion.
+
+    Attributes:
+      number_of_avoided_calls (int): number of file system calls that were
+          answered from memory instead.
+      number_of_scandir_calls (int): number of os.scandir calls.
+    """
+
+    def __init__(self):
+        """Initializes a file system snapshot."""
+        super().__init__()
+        self._directories = {}
+        self.number_of_avoided_calls = 0
+        self.number_of_scandir_calls = 0
+
+    def _GetDirectoryEntries(self, path):
+        """Retrieves the entries of a directory.
+
+        Args:
+          path (str): path of the directory.
+
+        Returns:
+          dict[str, bool]: True if the entry is a directory or False if not per
+              name of the entry, in directory order, or None if the path does
+              not exist, is not a directory or cannot be read.
+        """
+        path = os.path.normpath(path)
+
+        if path in self._directories:
+            self.number_of_avoided_calls += 1
+            return self._directories[path]
+
+        self.number_of_scandir_calls += 1
+
+        try:
+            with os.scandir(path) as scandir_iterator:
+                directory_entries = {
+                    directory_entry.name: directory_entry.is_dir()
+                    for directory_entry in scandir_iterator
+                }
+
+        # A directory that cannot be read, for example due to insufficient
+        # permissions, is treated as a directory that does not exist.
+        except OSError:
+            directory_entries = None
+
+        self._directories[path] = directory_entries
+
+        return directory_entries
+
+    def Exists(self, path):
+        """Determines if a path exists.
+
+        Args:
+          path (str): path.
+
+        Returns:
+          bool: True if the path exists.
+        """
+        parent_path, name = os.path.split(os.path.normpath(path))
+        directory_entries = self._GetDirectoryEntries(parent_path or os.curdir)
+        return bool(directory_entries) and name in directory_entries
+
+    def IsDirectory(self, path):
+        """Determines if a path is a directory.
+
+        Args:
+          path (str): path.
+
+        Returns:
+          bool: True if the path is a directory.
+        """
+        parent_path, name = os.path.split(os.path.normpath(path))
+        directory_entries = self._GetDirectoryEntries(parent_path or os.curdir)
+        return bool(directory_entries) and directory_entries.get(name, False)
+
+    def ListDirectory(self, path):
+        """Lists the entries of a directory.
+
+        Args:
+          path (str): path of the directory.
+
+        Returns:
+          list[str]: names of the entries in directory order, or an empty list
+              if the path does not exist or is not a directory.
+        """
+        directory_entries = self._GetDirectoryEntries(path)
+        return list(directory_entries or [])
+
+
+class FileUpdater:
+    """File updater.
+
+    A file that already contains the data is not written, which preserves its
+    modification time such that build tools and editors do not consider the
+    file changed.
+    """
+
+    def UpdateFile(self, path, data):
+        """Updates a file.
+
+        Args:
+          path (str): path of the file.
+          data (bytes): data of the file.
+
+        Returns:
+          bool: True if the file was written or False if the file already
+              contained the data.
+
+        Raises:
+          OSError: if the file cannot be read or written.
+        """
+        try:
+            if os.stat(path).st_size == len(data):
+                with open(path, "rb") as file_object:
+                    if file_object.read() == data:
+                        return False
+
+        except FileNotFoundError:
+            pass
+
+        with open(path, "wb") as file_object:
+            file_object.write(data)
+
+        return True
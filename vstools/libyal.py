@@ -1,10 +1,16 @@
 """Libyal sources classes."""
 
+import copy
+import hashlib
 import io
+import json
 import logging
 import os
 import uuid
 
+from vstools import automake
+from vstools import filesystem
+from vstools import pipeline
 from vstools import readers
 from vstools import resources
 from vstools import solutions
@@ -279,12 +285,468 @@ class VSDebugPythonDllVSProjectConfiguration(VSDebugDllVSProjectConfiguration):
         self.library_directories = [f"{python_path:s}\\libs"]
 
 
+class MakefileAmCache:
+    """Persistent cache of read Makefile.am files.
+
+    The cache directory contains JSON files with the variable assignments of a
+    Makefile.am per SHA-256 of its data, and with the size, modification time
+    and SHA-256 of the data per Makefile.am path. The latter allows an unchanged
+    Makefile.am to be retrieved without reading it. When the cache directory
+    exceeds its maximum size the least recently used files are removed.
+    """
+
+    # Version of the cache entry format, entries with a different version are
+    # ignored.
+    _FORMAT_VERSION = 3
+
+    _MAXIMUM_SIZE = 64 * 1024 * 1024
+
+    def __init__(self, path, maximum_size=_MAXIMUM_SIZE):
+        """Initializes a Makefile.am cache.
+
+        Args:
+          path (str): path of the cache directory.
+          maximum_size (Optional[int]): maximum size of the cache directory in
+              bytes.
+        """
+        super().__init__()
+        self._maximum_size = maximum_size
+        self._path = path
+        self._size = None
+
+    def _GetEntryPath(self, key):
+        """Retrieves the path of a cache entry.
+
+        Args:
+          key (str): key of the cache entry.
+
+        Returns:
+          str: path of the cache entry file.
+        """
+        return os.path.join(self._path, f"{key:s}.json")
+
+    def _AddAssignments(self, makefile_am, data_entry):
+        """Adds the variable assignments of a data cache entry to a Makefile.am.
+
+        Args:
+          makefile_am (automake.MakefileAm): Makefile.am.
+          data_entry (dict[str, object]): data cache entry.
+        """
+        for line_number, name, operator, value, conditions in data_entry.get(
+            "assignments", []
+        ):
+            assignment = automake.MakefileAmAssignment(
+                name,
+                operator,
+                value,
+                conditions=tuple(conditions),
+                line_number=line_number,
+            )
+            makefile_am.AddAssignment(assignment)
+
+    def _ReadEntry(self, key):
+        """Reads a cache entry.
+
+        Reading a cache entry marks it as most recently used.
+
+        Args:
+          key (str): key of the cache entry.
+
+        Returns:
+          dict[str, object]: cache entry or None if not available.
+        """
+        entry_path = self._GetEntryPath(key)
+
+        try:
+            with io.open(entry_path, "r", encoding="utf8") as file_object:
+                entry = json.load(file_object)
+
+            os.utime(entry_path)
+
+        except (OSError, ValueError):
+            return None
+
+        if not isinstance(entry, dict):
+            return None
+
+        if entry.get("format_version", None) != self._FORMAT_VERSION:
+            return None
+
+        return entry
+
+    def _RemoveLeastRecentlyUsedEntries(self):
+        """Removes the least recently used cache entries.
+
+        Entries are removed until the size of the cache directory no longer
+        exceeds the maximum size.
+        """
+        entries = []
+        with os.scandir(self._path) as directory_entries:
+            for directory_entry in directory_entries:
+                if directory_entry.name.endswith(".json"):
+                    # The entry can be removed concurrently by another process.
+                    try:
+                        stat_object = directory_entry.stat()
+                    except FileNotFoundError:
+                        continue
+
+                    entries.append(
+                        (
+                            stat_object.st_mtime_ns,
+                            stat_object.st_size,
+                            directory_entry.path,
+                        )
+                    )
+
+        size = sum(entry_size for _, entry_size, _ in entries)
+
+        for _, entry_size, entry_path in sorted(entries):
+            if size <= self._maximum_size:
+                break
+
+            try:
+                os.remove(entry_path)
+            except OSError:
+                continue
+
+            size -= entry_size
+
+        self._size = size
+
+    def _WriteEntry(self, key, entry):
+        """Writes a cache entry.
+
+        Args:
+          key (str): key of the cache entry.
+          entry (dict[str, object]): cache entry.
+        """
+        entry["format_version"] = self._FORMAT_VERSION
+
+        data = json.dumps(entry).encode("utf8")
+
+        entry_path = self._GetEntryPath(key)
+        temporary_path = f"{entry_path:s}.{os.getpid():d}.tmp"
+
+        try:
+            os.makedirs(self._path, exist_ok=True)
+
+            with io.open(temporary_path, "wb") as file_object:
+                file_object.write(data)
+
+            # An existing entry is replaced, hence its size is no longer part
+            # of the size of the cache directory.
+            try:
+                replaced_size = os.stat(entry_path).st_size
+            except FileNotFoundError:
+                replaced_size = 0
+
+            os.replace(temporary_path, entry_path)
+
+            if self._size is None:
+                self._RemoveLeastRecentlyUsedEntries()
+            else:
+                self._size += len(data) - replaced_size
+                if self._size > self._maximum_size:
+                    self._RemoveLeastRecentlyUsedEntries()
+
+        except OSError as exception:
+            logging.warning(
+                f"Unable to write cache entry: {entry_path:s} with error: "
+                f"{exception!s}"
+            )
+
+    def GetMakefileAm(self, makefile_am_path):
+        """Retrieves a Makefile.am.
+
+        Args:
+          makefile_am_path (str): path of the Makefile.am file.
+
+        Returns:
+          automake.MakefileAm: Makefile.am.
+        """
+        makefile_am = automake.MakefileAm(makefile_am_path)
+
+        stat_object = os.stat(makefile_am_path)
+        absolute_path = os.path.abspath(makefile_am_path)
+
+        path_key = hashlib.sha256(absolute_path.encode("utf8")).hexdigest()
+
+        path_entry = self._ReadEntry(path_key)
+        if (
+            path_entry
+            and path_entry.get("path", None) == absolute_path
+            and path_entry.get("size", None) == stat_object.st_size
+            and path_entry.get("mtime_ns", None) == stat_object.st_mtime_ns
+        ):
+            data_key = path_entry.get("data_key", "")
+            data_entry = self._ReadEntry(data_key)
+            if data_entry:
+                makefile_am.data_hash = data_key
+                self._AddAssignments(makefile_am, data_entry)
+                return makefile_am
+
+        with io.open(makefile_am_path, "rb") as file_object:
+            data = file_object.read()
+
+        data_key = hashlib.sha256(data).hexdigest()
+
+        data_entry = self._ReadEntry(data_key)
+        if data_entry:
+            makefile_am.data_hash = data_key
+            self._AddAssignments(makefile_am, data_entry)
+        else:
+            makefile_am.ReadData(data)
+
+            assignments = [
+                [
+                    assignment.line_number,
+                    assignment.name,
+                    assignment.operator,
+                    assignment.value,
+                    list(assignment.conditions),
+                ]
+                for assignment in makefile_am.assignments
+            ]
+            self._WriteEntry(data_key, {"assignments": assignments})
+
+        self._WriteEntry(
+            path_key,
+            {
+                "data_key": data_key,
+                "mtime_ns": stat_object.st_mtime_ns,
+                "path": absolute_path,
+                "size": stat_object.st_size,
+            },
+        )
+        return makefile_am
+
+
+class ProjectMemo:
+    """Memo of libyal library and third party projects.
+
+    Libyal source directories commonly contain identical local libraries, such
+    as libcerror, and third party dependencies, such as zlib. The memo allows
+    their project information and rendered project files to be reused between
+    conversions. The memo is not copied to worker processes. When the memo
+    exceeds its maximum number of entries the least recently used entries are
+    removed.
+
+    Attributes:
+      number_of_hits (int): number of lookups found in the memo.
+      number_of_lookups (int): number of lookups.
+    """
+
+    _MAXIMUM_NUMBER_OF_ENTRIES = 4096
+
+    def __init__(self, maximum_number_of_entries=_MAXIMUM_NUMBER_OF_ENTRIES):
+        """Initializes a project memo.
+
+        Args:
+          maximum_number_of_entries (Optional[int]): maximum number of project
+              information and of rendered project file entries.
+        """
+        super().__init__()
+        self._maximum_number_of_entries = maximum_number_of_entries
+        self._project_data = {}
+        self._projects = {}
+        self.number_of_hits = 0
+        self.number_of_lookups = 0
+
+    def __getstate__(self):
+        """Retrieves the state of the memo for pickling.
+
+        Returns:
+          dict[str, object]: state of an empty memo.
+        """
+        return {
+            "_maximum_number_of_entries": self._maximum_number_of_entries,
+            "_project_data": {},
+            "_projects": {},
+            "number_of_hits": 0,
+            "number_of_lookups": 0,
+        }
+
+    @property
+    def hit_rate(self):
+        """float: ratio of lookups found in the memo."""
+        if not self.number_of_lookups:
+            return 0.0
+
+        return self.number_of_hits / self.number_of_lookups
+
+    def _AddEntry(self, entries, key, value):
+        """Adds an entry as the most recently used entry.
+
+        Args:
+          entries (dict[str, object]): entries per memo key.
+          key (str): memo key.
+          value (object): value of the entry.
+        """
+        entries.pop(key, None)
+        entries[key] = value
+
+        while len(entries) > self._maximum_number_of_entries:
+            del entries[next(iter(entries))]
+
+    def _GetEntry(self, entries, key):
+        """Retrieves an entry and marks it as the most recently used entry.
+
+        Args:
+          entries (dict[str, object]): entries per memo key.
+          key (str): memo key.
+
+        Returns:
+          object: value of the entry or None if not available.
+        """
+        value = entries.pop(key, None)
+
+        self.number_of_lookups += 1
+        if value:
+            self.number_of_hits += 1
+            entries[key] = value
+
+        return value
+
+    def AddProject(self, key, project_information):
+        """Adds project information.
+
+        Args:
+          key (str): memo key.
+          project_information (VSProjectInformation): project information.
+        """
+        self._AddEntry(self._projects, key, project_information)
+
+    def AddProjectData(self, key, project_data):
+        """Adds rendered project file data.
+
+        Args:
+          key (str): memo key.
+          project_data (bytes): data of the project file.
+        """
+        self._AddEntry(self._project_data, key, project_data)
+
+    def GetProject(self, key):
+        """Retrieves project information.
+
+        Args:
+          key (str): memo key.
+
+        Returns:
+          VSProjectInformation: project information or None if not available.
+        """
+        return self._GetEntry(self._projects, key)
+
+    def GetProjectData(self, key):
+        """Retrieves rendered project file data.
+
+        Args:
+          key (str): memo key.
+
+        Returns:
+          bytes: data of the project file or None if not available.
+        """
+        return self._GetEntry(self._project_data, key)
+
+
 class LibyalSourceVSSolution(solutions.VSSolution):
     """Libyal source Visual Studio solution."""
 
+    # LIBADD and LDADD values that do not define a dependency.
+    _IGNORED_LIBADD_VALUES = frozenset(
+        ["@LIBDL_LIBADD@", "@LIBINTL@", "@PTHREAD_LIBADD@"]
+    )
+
     _SUPPORTED_THIRD_PARTY_DEPENDENCIES = frozenset(["bzip2", "zlib"])
 
+    # Maximum number of previously read Makefile.am files kept in memory.
+    _MAXIMUM_NUMBER_OF_CACHED_MAKEFILE_AMS = 1024
+
+    # Namespace to derive the GUIDs of new projects from by default.
+    DEFAULT_GUID_NAMESPACE = uuid.uuid5(
+        uuid.NAMESPACE_URL, "https://github.com/libyal/vstools"
+    )
+
+    def __init__(
+        self,
+        extend_with_x64=True,
+        generate_python_dll=True,
+        python_path="C:\\Python314",
+        with_dokany=False,
+        cost_model=None,
+        executor=None,
+        guid_namespace=None,
+        makefile_am_cache=None,
+        project_memo=None,
+    ):
+        """Initializes a libyal source Visual Studio solution.
+
+        Args:
+          extend_with_x64 (Optional[bool]): True if the solution should be
+              extended with configuration for the x64 platform.
+          generate_python_dll (Optional[bool]): True if a Python module DLL
+              should be generated.
+          python_path (Optional[str]): path to the Python installation.
+          with_dokany (Optional[bool]): True if DokanY should be used instead
+              of Dokan.
+          cost_model (Optional[CostModel]): cost model to schedule parallel
+              tasks with, where None represents a cost model without recorded
+              durations.
+          executor (Optional[concurrent.futures.ProcessPoolExecutor]): process
+              pool shared between conversions, where None represents that a
+              process pool is created per conversion.
+          guid_namespace (Optional[uuid.UUID]): namespace to derive the GUIDs
+              of new projects from with the solution and project name, where
+              None represents random GUIDs.
+          makefile_am_cache (Optional[MakefileAmCache]): cache of read
+              Makefile.am files, where None represents no cache.
+          project_memo (Optional[ProjectMemo]): memo of library and third party
+              projects shared between conversions, where None represents no memo.
+        """
+        super().__init__(
+            extend_with_x64=extend_with_x64,
+            generate_python_dll=generate_python_dll,
+            python_path=python_path,
+            with_dokany=with_dokany,
+            cost_model=cost_model,
+            executor=executor,
+        )
+        self._guid_namespace = guid_namespace
+        self._makefile_am_cache = makefile_am_cache
+        self._project_memo = project_memo
+        # Previously read Makefile.am files, per absolute path.
+        self._makefile_ams_cache = {}
+        # Project GUIDs per name of previously read solution files, per path.
+        self._project_guids_cache = {}
+
+    def __getstate__(self):
+        """Retrieves the state of the solution for pickling.
+
+        Returns:
+          dict[str, object]: state of the solution without the process pools,
+              cost model, parsed files, write-behind file writer and previously
+              read Makefile.am files.
+        """
+        state = super().__getstate__()
+        state["_makefile_ams_cache"] = {}
+        return state
+
     # pylint: disable=unused-argument
+    def _AddCachedMakefileAm(self, makefile_am_path, cache_key, makefile_am):
+        """Adds a Makefile.am as the most recently used previously read file.
+
+        Args:
+          makefile_am_path (str): path of the Makefile.am file.
+          cache_key (tuple[int, int]): size and modification time of the file.
+          makefile_am (automake.MakefileAm): Makefile.am.
+        """
+        absolute_path = os.path.abspath(makefile_am_path)
+        self._makefile_ams_cache[absolute_path] = (cache_key, makefile_am)
+
+        while (
+            len(self._makefile_ams_cache) > self._MAXIMUM_NUMBER_OF_CACHED_MAKEFILE_AMS
+        ):
+            del self._makefile_ams_cache[next(iter(self._makefile_ams_cache))]
+
     def _ConfigureAsBzip2Dll(
         self,
         project_information,
@@ -378,12 +840,75 @@ class LibyalSourceVSSolution(solutions.VSSolution):
         if dependency not in debug_project_configuration.additional_dependencies:
             debug_project_configuration.additional_dependencies.append(dependency)
 
+    def _CreateProjectInformation(
+        self, makefile_am, solution_name, project_name, project_guid
+    ):
+        """Creates the project information of a project defined by a Makefile.am.
+
+        Args:
+          makefile_am (automake.MakefileAm): Makefile.am.
+          solution_name (str): name of the solution.
+          project_name (str): name of the project.
+          project_guid (str): lower case GUID of the project.
+
+        Returns:
+          VSProjectInformation: project information.
+        """
+        project_information = resources.VSProjectInformation()
+        project_information.name = project_name
+        project_information.guid = project_guid
+        project_information.root_name_space = project_name
+
+        if project_name == solution_name:
+            release_project_configuration = ReleaseDllVSProjectConfiguration()
+            debug_project_configuration = VSDebugDllVSProjectConfiguration()
+
+        elif project_name.endswith(".net"):
+            release_project_configuration = ReleaseDotNetDllVSProjectConfiguration()
+            debug_project_configuration = VSDebugDotNetDllVSProjectConfiguration()
+
+        elif project_name.startswith("py"):
+            release_project_configuration = ReleasePythonDllVSProjectConfiguration(
+                python_path=self._python_path
+            )
+            debug_project_configuration = VSDebugPythonDllVSProjectConfiguration(
+                python_path=self._python_path
+            )
+        elif project_name.startswith("lib"):
+            release_project_configuration = ReleaseLibraryVSProjectConfiguration()
+            debug_project_configuration = VSDebugLibraryVSProjectConfiguration()
+
+        else:
+            project_information.keyword = "Win32Proj"
+
+            release_project_configuration = ReleaseExeVSProjectConfiguration()
+            debug_project_configuration = VSDebugExeVSProjectConfiguration()
+
+        # TODO: determine autogenerated source.
+
+        self._ReadMakefile(
+            makefile_am,
+            solution_name,
+            project_information,
+            release_project_configuration,
+            debug_project_configuration,
+        )
+
+        # TODO: add additional Python 3 project.
+
+        project_information.configurations.Append(release_project_configuration)
+        if debug_project_configuration:
+            project_information.configurations.Append(debug_project_configuration)
+
+        return project_information
+
     def _CreateThirdPartyDependencies(
-        self, solution_projects, projects_by_guid, project_guids_by_name
+        self, solution_name, solution_projects, projects_by_guid, project_guids_by_name
     ):
         """Creates the project files for third party dependencies.
 
         Args:
+          solution_name (str): name of the solution.
           solution_projects (list[VSSolutionProject]): projects.
           projects_by_guid (dict[str, VSProjectInformation]): projects per lower
               case GUID.
@@ -404,11 +929,9 @@ class LibyalSourceVSSolution(solutions.VSSolution):
 
             project_filename = "\\".join([project_name, project_name])
 
-            project_guid = project_guids_by_name.get(project_name, "")
-            if not project_guid:
-                project_guid = project_guids_by_name.get(f"{project_name:s}.dll", "")
-            if not project_guid:
-                project_guid = str(uuid.uuid4())
+            project_guid = self._GetProjectGUID(
+                solution_name, project_name, project_guids_by_name
+            )
 
             solution_project = resources.VSSolutionProject(
                 project_name, project_filename, project_guid
@@ -453,18 +976,171 @@ class LibyalSourceVSSolution(solutions.VSSolution):
 
             projects_by_guid[project_guid] = project_information
 
+    def _GetDependencyName(self, value):
+        """Retrieves the dependency name from a LIBADD or LDADD value.
+
+        Args:
+          value (str): LIBADD or LDADD value.
+
+        Returns:
+          str: name of the dependency or None if the value does not define
+              a dependency.
+        """
+        if value in self._IGNORED_LIBADD_VALUES:
+            return None
+
+        if value.startswith("@") and value.endswith("_LIBADD@"):
+            return value[1:-8].lower()
+
+        if value.endswith(".la"):
+            _, _, dependency_name = value.rpartition("/")
+            return dependency_name[:-3]
+
+        logging.warning(f"Unuspported dependency definition: {value:s}")
+        return None
+
+    def _GetLocalDirectoryNames(self, makefile_am, input_directory, project_name):
+        """Retrieves the names of the local directories a Makefile.am refers to.
+
+        Only the directories of which _ReadMakefile checks if they exist are
+        considered.
+
+        Args:
+          makefile_am (automake.MakefileAm): Makefile.am.
+          input_directory (str): path of the input directory.
+          project_name (str): name of the project.
+
+        Returns:
+          list[str]: names of the local directories that exist, in sorted order.
+        """
+        local_directory_names = set()
+        for name in makefile_am.GetVariableNames():
+            if name not in ("AM_CFLAGS", "AM_CPPFLAGS"):
+                continue
+
+            for value in makefile_am.GetValues(name):
+                if not value.startswith("@") or not value.endswith("_CPPFLAGS@"):
+                    continue
+
+                directory_name = value[1:-10].lower()
+                if directory_name in ("bzip2", "zlib") or (
+                    directory_name == "libfuse" and project_name.endswith("mount")
+                ):
+                    continue
+
+                if self._file_system_snapshot.IsDirectory(
+                    os.path.join(input_directory, directory_name)
+                ):
+                    local_directory_names.add(directory_name)
+
+        return sorted(local_directory_names)
+
+    def _GetMemoKey(self, *values):
+        """Retrieves a key of the project memo.
+
+        Args:
+          values (list[str]): values that identify the memo entry.
+
+        Returns:
+          str: SHA-256 of the values.
+        """
+        key_hash = hashlib.sha256()
+        for value in values:
+            key_hash.update(value.encode("utf8"))
+            key_hash.update(b"\x00")
+
+        return key_hash.hexdigest()
+
+    def _GetProjectGUID(self, solution_name, project_name, project_guids_by_name):
+        """Retrieves the GUID of a project.
+
+        The GUID of the project in the existing solution file is preserved.
+        The GUID of a new project is derived from the GUID namespace, the
+        solution name and the project name, such that regenerating the solution
+        produces the same GUID, or random if no GUID namespace was provided.
+
+        Args:
+          solution_name (str): name of the solution.
+          project_name (str): name of the project.
+          project_guids_by_name (dict[str, str]): lower case project GUID per
+              name of the existing solution file.
+
+        Returns:
+          str: lower case GUID of the project.
+        """
+        project_guid = project_guids_by_name.get(project_name, "")
+        if not project_guid:
+            project_guid = project_guids_by_name.get(f"{project_name:s}.dll", "")
+
+        if not project_guid:
+            if self._guid_namespace:
+                project_guid = str(
+                    uuid.uuid5(
+                        self._guid_namespace, f"{solution_name:s}\\{project_name:s}"
+                    )
+                )
+            else:
+                project_guid = str(uuid.uuid4())
+
+        return project_guid
+
+    def _ReadConfigureAc(self, configure_ac_path):
+        """Reads a configure.ac.
+
+        Args:
+          configure_ac_path (str): path of the configure.ac file.
+
+        Returns:
+          tuple[str, list[str]]: name of the solution, or None if not available,
+              and paths of the files defined by AC_CONFIG_FILES.
+        """
+        config_files = []
+        solution_name = None
+
+        ac_config_files_value = None
+        in_ac_init_section = False
+
+        with io.open(configure_ac_path, "r", encoding="utf8") as file_object:
+            for line in file_object:
+                line = line.strip()
+
+                if in_ac_init_section:
+                    if line.startswith("[") and line.endswith("],"):
+                        solution_name = line[1:-2]
+                    in_ac_init_section = False
+
+                elif ac_config_files_value is not None:
+                    ac_config_files_value = " ".join([ac_config_files_value, line])
+
+                elif line.startswith("AC_INIT(") and solution_name is None:
+                    in_ac_init_section = True
+
+                elif line.startswith("AC_CONFIG_FILES("):
+                    ac_config_files_value = line[16:]
+
+                if ac_config_files_value is not None and ")" in ac_config_files_value:
+                    # Only the first argument contains the files.
+                    value, _, _ = ac_config_files_value.partition(")")
+                    value, _, _ = value.partition(",")
+                    config_files.extend(
+                        value.replace("[", " ").replace("]", " ").split()
+                    )
+                    ac_config_files_value = None
+
+        return solution_name, config_files
+
     def _ReadMakefile(
         self,
-        makefile_am_path,
+        makefile_am,
         solution_name,
         project_information,
         release_project_configuration,
         debug_project_configuration,
     ):
-        """Reads a Makefile.am.
+        """Reads the project specific sections of a Makefile.am.
 
         Args:
-          makefile_am_path (str): path of the Makefile.am file.
+          makefile_am (automake.MakefileAm): Makefile.am.
           solution_name (str): name of the solution.
           project_information (VSProjectInformation): project information.
           release_project_configuration (ReleaseVSProjectConfiguration):
@@ -473,9 +1149,10 @@ class LibyalSourceVSSolution(solutions.VSSolution):
               debug project configuration.
         """
         project_name = project_information.name
+        makefile_am_path = makefile_am.path
 
-        # pylint: disable=consider-using-with
-        file_object = io.open(makefile_am_path, "r", encoding="utf8")
+        makefile_am_directory = os.path.dirname(makefile_am_path)
+        input_directory = os.path.dirname(makefile_am_directory)
 
         include_directories = []
         preprocessor_definitions = []
@@ -504,248 +1181,105 @@ class LibyalSourceVSSolution(solutions.VSSolution):
         header_files = []
         resource_files = []
 
-        in_am_cppflags_section = False
-        in_extra_dist_section = False
-        in_la_libadd_section = False
-        in_la_sources_section = False
-        in_ldadd_section = False
-        in_sources_section = False
+        for name in makefile_am.GetVariableNames():
+            if name not in ("AM_CFLAGS", "AM_CPPFLAGS"):
+                continue
 
-        for index, line in enumerate(file_object.readlines()):
-            line = line.strip()
-            original_line = line
+            for value in makefile_am.GetValues(name):
+                if not value.startswith("@") or not value.endswith("_CPPFLAGS@"):
+                    continue
 
-            if in_am_cppflags_section:
-                if not line:
-                    in_am_cppflags_section = False
+                directory_name = value[1:-10].lower()
+                if directory_name == "bzip2":
+                    include_directories.append("..\\..\\..\\bzip2")
 
-                else:
-                    if line.endswith(" \\"):
-                        line = line[:-2]
-
-                    elif line.endswith("\\"):
-                        logging.warning(
-                            (
-                                f"Detected missing space before \\ in line: {index:d} "
-                                f'"{original_line:s}" ({makefile_am_path:s})'
-                            )
-                        )
-                        line = line[:-1]
-
-                    if line.startswith("@") and line.endswith("_CPPFLAGS@"):
-                        directory_name = line[1:-10].lower()
-                        if directory_name == "bzip2":
-                            include_directories.append("..\\..\\..\\bzip2")
-
-                            preprocessor_definitions.append("BZ_DLL")
-
-                            alternate_dependencies.append("bzip2")
-
-                        elif directory_name == "libfuse" and project_name.endswith(
-                            "mount"
-                        ):
-                            if self._with_dokany:
-                                include_directories.extend(
-                                    [
-                                        "..\\..\\..\\dokany\\dokan",
-                                        "..\\..\\..\\dokany\\sys",
-                                    ]
-                                )
-                            else:
-                                include_directories.append("..\\..\\..\\dokan\\dokan")
-
-                            preprocessor_definitions.append("HAVE_LIBDOKAN")
-
-                            if self._with_dokany:
-                                additional_dependencies.append(
-                                    "..\\..\\..\\dokany\\dokan\\{0:s}\\$(Platform)\\"
-                                    "$(ConfigurationName)\\dokan1.lib"
-                                )
-                            else:
-                                additional_dependencies.append(
-                                    "..\\..\\..\\dokan\\msvscpp\\$(ConfigurationName)\\"
-                                    "dokan.lib"
-                                )
-
-                        elif directory_name == "zlib":
-                            include_directories.append("..\\..\\..\\zlib")
-
-                            preprocessor_definitions.append("ZLIB_DLL")
-
-                            alternate_dependencies.append("zlib")
-
-                        elif os.path.isdir(directory_name):
-                            include_directories.append(
-                                "\\".join(["..", "..", directory_name])
-                            )
-                            library_name = line[1:-10]
-                            preprocessor_definitions.append(
-                                f"HAVE_LOCAL_{library_name:s}"
-                            )
-                            alternate_dependencies.append(directory_name)
-
-            elif in_extra_dist_section:
-                if not line:
-                    in_extra_dist_section = False
+                    preprocessor_definitions.append("BZ_DLL")
 
-                else:
-                    if line.endswith(" \\"):
-                        line = line[:-2]
+                    alternate_dependencies.append("bzip2")
 
-                    elif line.endswith("\\"):
-                        logging.warning(
-                            f"Space missing before '\\' in line: {index:d} "
-                            f"'{original_line:s}' ({makefile_am_path:s})"
+                elif directory_name == "libfuse" and project_name.endswith("mount"):
+                    if self._with_dokany:
+                        include_directories.extend(
+                            ["..\\..\\..\\dokany\\dokan", "..\\..\\..\\dokany\\sys"]
                         )
-                        line = line[:-1]
-
-                    for filename in line.split(" "):
-                        if filename.endswith(".c") or filename.endswith(".cpp"):
-                            source_files.append(
-                                "\\".join(["..", "..", project_name, filename])
-                            )
-                        elif filename.endswith(".h"):
-                            header_files.append(
-                                "\\".join(["..", "..", project_name, filename])
-                            )
-                        elif filename.endswith(".rc"):
-                            resource_files.append(
-                                "\\".join(["..", "..", project_name, filename])
-                            )
-
-            elif in_la_libadd_section:
-                if not line:
-                    in_la_libadd_section = False
-
-                else:
-                    if line.endswith(" \\"):
-                        line = line[:-2]
-
-                    if line in frozenset(
-                        ["endif", "@LIBDL_LIBADD@", "@LIBINTL@", "@PTHREAD_LIBADD@"]
-                    ):
-                        dependency_name = ""
-                    elif line.startswith("@") and line.endswith("_LIBADD@"):
-                        dependency_name = line[1:-8].lower()
-                    elif line.endswith(".la"):
-                        _, _, dependency_name = line.rpartition("/")
-                        dependency_name = dependency_name[:-3]
                     else:
-                        logging.warning(f"Unuspported dependency definition: {line:s}")
-                        dependency_name = ""
-
-                    if dependency_name:
-                        if dependency_name == "libuuid":
-                            self._ConfigureLibuuid(
-                                project_information,
-                                release_project_configuration,
-                                debug_project_configuration,
-                            )
+                        include_directories.append("..\\..\\..\\dokan\\dokan")
 
-                        elif dependency_name != "libcrypto":
-                            dependencies.append(dependency_name)
+                    preprocessor_definitions.append("HAVE_LIBDOKAN")
 
-            elif in_la_sources_section:
-                if not line:
-                    in_la_sources_section = False
-
-                else:
-                    if line.endswith(" \\"):
-                        line = line[:-2]
-
-                    elif line.endswith("\\"):
-                        logging.warning(
-                            f"Detected missing space before \\ in line: {index:d} "
-                            f'"{original_line:s}" ({makefile_am_path:s})'
+                    if self._with_dokany:
+                        additional_dependencies.append(
+                            "..\\..\\..\\dokany\\dokan\\{0:s}\\$(Platform)\\"
+                            "$(ConfigurationName)\\dokan1.lib"
                         )
-                        line = line[:-1]
-
-                    for filename in line.split(" "):
-                        if filename.endswith(".c") or filename.endswith(".cpp"):
-                            source_files.append(
-                                "\\".join(["..", "..", project_name, filename])
-                            )
-                        elif filename.endswith(".h"):
-                            header_files.append(
-                                "\\".join(["..", "..", project_name, filename])
-                            )
-
-            elif in_ldadd_section:
-                if not line:
-                    in_ldadd_section = False
-
-                else:
-                    if line.endswith(" \\"):
-                        line = line[:-2]
-
-                    if line in frozenset(
-                        ["endif", "@LIBDL_LIBADD@", "@LIBINTL@", "@PTHREAD_LIBADD@"]
-                    ):
-                        dependency_name = ""
-                    elif line.startswith("@") and line.endswith("_LIBADD@"):
-                        dependency_name = line[1:-8].lower()
-                    elif line.endswith(".la"):
-                        _, _, dependency_name = line.rpartition("/")
-                        dependency_name = dependency_name[:-3]
                     else:
-                        logging.warning(f"Unuspported dependency definition: {line:s}")
-
-                        dependency_name = ""
-
-                    if dependency_name:
-                        if dependency_name == "libuuid":
-                            self._ConfigureLibuuid(
-                                project_information,
-                                release_project_configuration,
-                                debug_project_configuration,
-                            )
+                        additional_dependencies.append(
+                            "..\\..\\..\\dokan\\msvscpp\\$(ConfigurationName)\\"
+                            "dokan.lib"
+                        )
 
-                        elif dependency_name not in ("libcrypto", "libfuse"):
-                            dependencies.append(dependency_name)
+                elif directory_name == "zlib":
+                    include_directories.append("..\\..\\..\\zlib")
+
+                    preprocessor_definitions.append("ZLIB_DLL")
+
+                    alternate_dependencies.append("zlib")
+
+                elif self._file_system_snapshot.IsDirectory(
+                    os.path.join(input_directory, directory_name)
+                ):
+                    include_directories.append("\\".join(["..", "..", directory_name]))
+                    library_name = value[1:-10]
+                    preprocessor_definitions.append(f"HAVE_LOCAL_{library_name:s}")
+                    alternate_dependencies.append(directory_name)
+
+        for filename in makefile_am.GetValues("EXTRA_DIST"):
+            path = "\\".join(["..", "..", project_name, filename])
+            if filename.endswith(".c") or filename.endswith(".cpp"):
+                source_files.append(path)
+            elif filename.endswith(".h"):
+                header_files.append(path)
+            elif filename.endswith(".rc"):
+                resource_files.append(path)
+
+        for filename in makefile_am.GetValues(f"{project_name:s}_la_SOURCES"):
+            path = "\\".join(["..", "..", project_name, filename])
+            if filename.endswith(".c") or filename.endswith(".cpp"):
+                source_files.append(path)
+            elif filename.endswith(".h"):
+                header_files.append(path)
+
+        directory_name = os.path.basename(makefile_am_directory)
+
+        for filename in makefile_am.GetValues(f"{project_name:s}_SOURCES"):
+            if filename.startswith("../"):
+                path = "\\".join(["..", filename.replace("/", "\\")])
+            else:
+                path = "\\".join(["..", "..", directory_name, filename])
 
-            elif in_sources_section:
-                if not line:
-                    in_sources_section = False
+            if filename.endswith(".c") or filename.endswith(".cpp"):
+                source_files.append(path)
+            elif filename.endswith(".h"):
+                header_files.append(path)
 
-                else:
-                    if line.endswith(" \\"):
-                        line = line[:-2]
+        for variable_name, ignored_dependency_names in (
+            (f"{project_name:s}_la_LIBADD", ("libcrypto",)),
+            (f"{project_name:s}_LDADD", ("libcrypto", "libfuse")),
+        ):
+            for value in makefile_am.GetValues(variable_name):
+                dependency_name = self._GetDependencyName(value)
+                if not dependency_name:
+                    continue
 
-                    _, _, directory_name = os.path.dirname(makefile_am_path).rpartition(
-                        os.path.sep
+                if dependency_name == "libuuid":
+                    self._ConfigureLibuuid(
+                        project_information,
+                        release_project_configuration,
+                        debug_project_configuration,
                     )
 
-                    for filename in line.split(" "):
-                        if filename.startswith("../"):
-                            filename = "\\".join(["..", filename.replace("/", "\\")])
-                        else:
-                            filename = "\\".join(["..", "..", directory_name, filename])
-
-                        if filename.endswith(".c") or filename.endswith(".cpp"):
-                            source_files.append(filename)
-
-                        elif filename.endswith(".h"):
-                            header_files.append(filename)
-
-            if line.startswith("AM_CFLAGS") or line.startswith("AM_CPPFLAGS"):
-                in_am_cppflags_section = True
-
-            elif line.startswith(f"{project_name:s}_la_LIBADD"):
-                in_la_libadd_section = True
-
-            elif line.startswith(f"{project_name:s}_la_SOURCES"):
-                in_la_sources_section = True
-
-            elif line.startswith(f"{project_name:s}_LDADD"):
-                in_ldadd_section = True
-
-            elif line.startswith(f"{project_name:s}_SOURCES"):
-                in_sources_section = True
-
-            elif line.startswith("EXTRA_DIST"):
-                in_extra_dist_section = True
-
-        file_object.close()
+                elif dependency_name not in ignored_dependency_names:
+                    dependencies.append(dependency_name)
 
         if project_name.endswith(".net"):
             dependencies.append(solution_name)
@@ -809,77 +1343,227 @@ class LibyalSourceVSSolution(solutions.VSSolution):
         project_information.header_files = sorted(header_files)
         project_information.resource_files = sorted(resource_files)
 
-    def _ReadMakefilePrograms(self, makefile_am_path):
-        """Reads the programs section in a Makefile.am.
+    def _ReadMakefileAm(self, makefile_am_path, makefile_am_data=None):
+        """Reads a Makefile.am.
 
         Args:
           makefile_am_path (str): path of the Makefile.am file.
+          makefile_am_data (Optional[bytes]): previously read data of the
+              Makefile.am file, where None represents that the file is read.
 
         Returns:
-          list[str]: binary program names.
+          automake.MakefileAm: Makefile.am or None if the file does not exist.
         """
-        # pylint: disable=consider-using-with
-        file_object = io.open(makefile_am_path, "r", encoding="utf8")
+        if makefile_am_data is not None:
+            makefile_am = automake.MakefileAm(makefile_am_path)
+            makefile_am.ReadData(makefile_am_data)
+            return makefile_am
 
-        bin_programs = []
+        try:
+            if self._makefile_am_cache:
+                return self._makefile_am_cache.GetMakefileAm(makefile_am_path)
 
-        in_bin_programs_section = False
+            makefile_am = automake.MakefileAm(makefile_am_path)
+            makefile_am.Read()
 
-        for line in file_object.readlines():
-            line = line.strip()
+        except FileNotFoundError:
+            logging.warning(f"No such file: {makefile_am_path:s}")
+            return None
 
-            if in_bin_programs_section:
-                if not line:
-                    in_bin_programs_section = False
+        return makefile_am
 
-                else:
-                    if line.endswith(" \\"):
-                        line = line[:-2]
+    def _ReadMakefileAms(self, jobs, makefile_am_paths):
+        """Reads Makefile.am files.
+
+        A Makefile.am that was read before by the solution and did not change
+        since is retrieved from memory. The other Makefile.am files are parsed
+        on the process pool or, when only a single job is used and there is no
+        Makefile.am cache, read ahead.
+
+        Args:
+          jobs (int): maximum number of Makefile.am files to read at the same
+              time.
+          makefile_am_paths (list[str]): paths of the Makefile.am files.
+
+        Yields:
+          automake.MakefileAm: Makefile.am or None if the file does not exist,
+              in path order.
+        """
+        cache_keys = []
+        cached_makefile_ams = []
+        tasks = []
+        for makefile_am_path in makefile_am_paths:
+            absolute_path = os.path.abspath(makefile_am_path)
+
+            # The size and modification time are determined before the file is
+            # read, such that a change while reading invalidates the entry.
+            try:
+                stat_object = os.stat(makefile_am_path)
+                cache_key = (stat_object.st_size, stat_object.st_mtime_ns)
+            except OSError:
+                cache_key = None
+
+            makefile_am = None
+            cached_value = self._makefile_ams_cache.pop(absolute_path, None)
+            if cached_value and cached_value[0] == cache_key:
+                makefile_am = cached_value[1]
+                # Re-add the entry to mark it as most recently used.
+                self._makefile_ams_cache[absolute_path] = cached_value
+            else:
+                tasks.append((makefile_am_path,))
+
+            cache_keys.append(cache_key)
+            cached_makefile_ams.append(makefile_am)
+
+        if jobs > 1 and len(tasks) > 1:
+            task_costs = []
+            for (makefile_am_path,) in tasks:
+                key = ":".join(["_ReadMakefileAm", os.path.abspath(makefile_am_path)])
+                heuristic_cost = self._cost_model.GetHeuristicCost(
+                    input_size=self._GetFileSize(makefile_am_path)
+                )
+                task_costs.append((key, heuristic_cost))
+
+            results = self._RunInParallel(
+                jobs, "_ReadMakefileAm", tasks, task_costs=task_costs
+            )
+
+        elif self._makefile_am_cache:
+            results = (self._ReadMakefileAm(*task) for task in tasks)
 
-                    bin_programs.append(line)
+        else:
+            # Overlap reading the upcoming Makefile.am files with parsing the
+            # current Makefile.am. A Makefile.am that could not be read ahead
+            # is read again by _ReadMakefileAm, such that it handles the error.
+            read_ahead_file_reader = pipeline.ReadAheadFileReader()
+            read_ahead_files = read_ahead_file_reader.ReadFiles(
+                [makefile_am_path for makefile_am_path, in tasks]
+            )
+            results = (
+                self._ReadMakefileAm(*task, makefile_am_data=makefile_am_data)
+                for task, (makefile_am_data, _) in zip(tasks, read_ahead_files)
+            )
 
-            elif line.endswith("_PROGRAMS = \\"):
-                in_bin_programs_section = True
+        for makefile_am_path, cache_key, makefile_am in zip(
+            makefile_am_paths, cache_keys, cached_makefile_ams
+        ):
+            if not makefile_am:
+                # There is a result for every Makefile.am that was not cached.
+                makefile_am = next(results, None)
 
-        file_object.close()
+                if makefile_am and cache_key:
+                    self._AddCachedMakefileAm(makefile_am_path, cache_key, makefile_am)
 
-        return bin_programs
+            yield makefile_am
 
-    # pylint: disable=arguments-differ,arguments-renamed
-    def Convert(self, input_directory, output_version):
-        """Converts a Visual Studio solution.
+    def _ReadProjectGUIDs(self, sln_path):
+        """Reads the project GUIDs of an existing solution file.
+
+        The project GUIDs are cached per absolute path, since the working
+        directory can change between conversions, and only read again when the
+        size or modification time of the solution file changed.
 
         Args:
-          input_directory (str): path of the input directory.
-          output_version (str): output Visual Studio version.
+          sln_path (str): path of the solution file.
 
         Returns:
-          bool: True if the conversion successful or False if not.
+          dict[str, str]: lower case project GUIDs per project name or None if
+              the solution file header could not be read.
         """
-        configure_ac_path = os.path.join(input_directory, "configure.ac")
-        if not os.path.exists(configure_ac_path):
-            logging.warning(f"No such file: {configure_ac_path:s}.")
-            return False
+        stat_object = os.stat(sln_path)
+        cache_key = (stat_object.st_size, stat_object.st_mtime_ns)
+        cache_path = os.path.abspath(sln_path)
 
-        solution_name = None
-        # pylint: disable=consider-using-with
-        file_object = io.open(configure_ac_path, "r", encoding="utf8")
+        cached_value = self._project_guids_cache.get(cache_path)
+        if cached_value and cached_value[0] == cache_key:
+            return cached_value[1]
 
-        in_ac_init_section = False
+        solution_reader = readers.VS2008SolutionFileReader()
+        solution_reader.Open(sln_path)
+
+        try:
+            if not solution_reader.ReadHeader():
+                return None
 
-        for line in file_object.readlines():
-            line = line.strip()
+            project_guids_by_name = solution_reader.ReadProjectGUIDs()
 
-            if in_ac_init_section:
-                if line.startswith("[") and line.endswith("],"):
-                    solution_name = line[1:-2]
-                break
+        finally:
+            solution_reader.Close()
+
+        self._project_guids_cache[cache_path] = (cache_key, project_guids_by_name)
+
+        return project_guids_by_name
+
+    def _WriteMakefile(self, output_version, solution_filename, solution_projects):
+        """Writes the Makefile.am corresponding to the Visual Studio solution.
+
+        Args:
+          output_version (str): output Visual Studio version.
+          solution_filename (str): the Visual Studio solution filename.
+          solution_projects (list[VSSolutionProject]): projects.
+        """
+        solution_project_filenames = []
+        for solution_project in solution_projects:
+            if output_version in ["2008"]:
+                solution_project_extension = "vcproj"
+            else:
+                solution_project_extension = "vcxproj"
+
+            solution_project_path_segments = solution_project.filename.split("\\")
+            solution_project_path = os.path.join(*solution_project_path_segments)
+            solution_project_filenames.append(
+                f"\t{solution_project_path:s}.{solution_project_extension:s} \\"
+            )
+
+        makefile_am_lines = ["MSVSCPP_FILES = \\"]
+        for solution_project_filename in sorted(solution_project_filenames):
+            makefile_am_lines.append(solution_project_filename)
+
+        makefile_am_lines.append(f"\t{solution_filename:s}")
+
+        makefile_am_lines.extend(
+            [
+                "",
+                "EXTRA_DIST = \\",
+                "\t$(MSVSCPP_FILES)",
+                "",
+                "DISTCLEANFILES = \\",
+                "\tMakefile \\",
+                "\tMakefile.in",
+                "",
+                "",
+            ]
+        )
+        filename = os.path.join(f"vs{output_version:s}", "Makefile.am")
+        logging.info(f"Writing: {filename:s}")
+
+        # Use the platform end of lines, as when writing in text mode.
+        lines = "\n".join(makefile_am_lines).replace("\n", os.linesep)
+        self._file_updater.UpdateFile(filename, lines.encode("utf8"))
+
+    # pylint: disable=arguments-renamed
+    def ConvertToVersions(self, input_directory, output_versions, jobs=1):
+        """Converts a libyal source directory to multiple Visual Studio versions.
+
+        The source directory is read once and written for every output version.
+
+        Args:
+          input_directory (str): path of the input directory.
+          output_versions (list[str]): output Visual Studio versions.
+          jobs (Optional[int]): maximum number of Makefile.am files to read and
+              projects to write at the same time.
 
-            if line.startswith("AC_INIT("):
-                in_ac_init_section = True
+        Returns:
+          bool: True if the conversion successful or False if not.
+        """
+        self._file_system_snapshot = filesystem.FileSystemSnapshot()
 
-        file_object.close()
+        configure_ac_path = os.path.join(input_directory, "configure.ac")
+        if not self._file_system_snapshot.Exists(configure_ac_path):
+            logging.warning(f"No such file: {configure_ac_path:s}.")
+            return False
 
+        solution_name, config_files = self._ReadConfigureAc(configure_ac_path)
         if not solution_name:
             logging.warning("Unable to determine solution name.")
             return False
@@ -891,29 +1575,46 @@ class LibyalSourceVSSolution(solutions.VSSolution):
         input_sln_path = os.path.join(
             input_directory, "msvscpp", f"{solution_name:s}.sln"
         )
-        if os.path.exists(input_sln_path):
-            solution_reader = readers.VS2008SolutionFileReader()
-            solution_reader.Open(input_sln_path)
-
-            if not solution_reader.ReadHeader():
+        if self._file_system_snapshot.Exists(input_sln_path):
+            project_guids_by_name = self._ReadProjectGUIDs(input_sln_path)
+            if project_guids_by_name is None:
                 logging.warning(
                     f"Unable to read solution file: {input_sln_path:s} header."
                 )
                 return False
 
-            solution_projects = solution_reader.ReadProjects()
-            solution_reader.Close()
-
-            for solution_project in solution_projects:
-                project_guids_by_name[solution_project.name] = solution_project.guid
+        # Directories with a Makefile generated by configure, which implies they
+        # contain a Makefile.am.
+        configured_directory_names = set()
+        for config_file in config_files:
+            directory_name, _, filename = config_file.rpartition("/")
+            if directory_name and filename == "Makefile":
+                configured_directory_names.add(directory_name)
+
+        directory_entries = [
+            directory_entry
+            for directory_entry in self._file_system_snapshot.ListDirectory(
+                input_directory
+            )
+            if self._file_system_snapshot.IsDirectory(
+                os.path.join(input_directory, directory_entry)
+            )
+        ]
 
         solution_projects = []
         projects_by_guid = {}
 
-        for directory_entry in os.listdir(input_directory):
-            if not os.path.isdir(directory_entry):
-                continue
+        # Conversion options that affect the projects, used by the project memo.
+        options = [
+            f"{self._extend_with_x64!s}",
+            f"{self._generate_python_dll!s}",
+            self._python_path,
+            f"{self._with_dokany!s}",
+        ]
+        project_keys_by_guid = {}
 
+        makefile_am_directory_entries = []
+        for directory_entry in directory_entries:
             if (
                 not directory_entry.startswith("lib")
                 and not directory_entry.startswith("py")
@@ -931,99 +1632,101 @@ class LibyalSourceVSSolution(solutions.VSSolution):
             ):
                 continue
 
-            makefile_am_path = os.path.join(
-                input_directory, directory_entry, "Makefile.am"
-            )
-            if not os.path.exists(makefile_am_path):
-                logging.warning(f"No such file: {makefile_am_path:s}")
+            # The .net directories are not configured by configure.
+            if (
+                configured_directory_names
+                and directory_entry not in configured_directory_names
+                and not directory_entry.endswith(".net")
+            ):
+                continue
+
+            makefile_am_directory_entries.append(directory_entry)
+
+        # Makefile.am files are assembled into the solution in directory order,
+        # as their results become available.
+        makefile_am_paths = [
+            os.path.join(input_directory, directory_entry, "Makefile.am")
+            for directory_entry in makefile_am_directory_entries
+        ]
+        makefile_ams = self._ReadMakefileAms(jobs, makefile_am_paths)
+
+        for directory_entry, makefile_am in zip(
+            makefile_am_directory_entries, makefile_ams
+        ):
+            if not makefile_am:
                 continue
 
             if directory_entry in ("src", "tests") or directory_entry.endswith("tools"):
-                project_names = self._ReadMakefilePrograms(makefile_am_path)
+                project_names = makefile_am.GetPrograms()
             else:
                 project_names = [directory_entry]
 
             for project_name in project_names:
                 project_filename = "\\".join([project_name, project_name])
 
-                project_guid = project_guids_by_name.get(project_name, "")
-                if not project_guid:
-                    project_guid = project_guids_by_name.get(
-                        f"{project_name:s}.dll", ""
-                    )
-
-                if not project_guid:
-                    project_guid = str(uuid.uuid4())
+                project_guid = self._GetProjectGUID(
+                    solution_name, project_name, project_guids_by_name
+                )
 
                 solution_project = resources.VSSolutionProject(
                     project_name, project_filename, project_guid
                 )
                 solution_projects.append(solution_project)
 
-                project_information = resources.VSProjectInformation()
-                project_information.name = project_name
-                project_information.guid = project_guid
-                project_information.root_name_space = project_name
-
-                if project_name == solution_name:
-                    release_project_configuration = ReleaseDllVSProjectConfiguration()
-                    debug_project_configuration = VSDebugDllVSProjectConfiguration()
-
-                elif project_name.endswith(".net"):
-                    release_project_configuration = (
-                        ReleaseDotNetDllVSProjectConfiguration()
-                    )
-                    debug_project_configuration = (
-                        VSDebugDotNetDllVSProjectConfiguration()
+                project_key = None
+                project_information = None
+
+                if (
+                    self._project_memo
+                    and makefile_am.data_hash
+                    and project_name.startswith("lib")
+                ):
+                    # The project information only depends on the solution name
+                    # for the project that builds the solution DLL, and the project
+                    # GUID is set after the lookup, such that the project
+                    # information can be reused by other source directories.
+                    project_key = self._GetMemoKey(
+                        "project",
+                        makefile_am.data_hash,
+                        directory_entry,
+                        project_name,
+                        f"{project_name == solution_name!s}",
+                        *options,
+                        *self._GetLocalDirectoryNames(
+                            makefile_am, input_directory, project_name
+                        ),
                     )
+                    project_information = self._project_memo.GetProject(project_key)
 
-                elif project_name.startswith("py"):
-                    release_project_configuration = (
-                        ReleasePythonDllVSProjectConfiguration(
-                            python_path=self._python_path
-                        )
-                    )
-                    debug_project_configuration = (
-                        VSDebugPythonDllVSProjectConfiguration(
-                            python_path=self._python_path
-                        )
-                    )
-                elif project_name.startswith("lib"):
-                    release_project_configuration = (
-                        ReleaseLibraryVSProjectConfiguration()
-                    )
-                    debug_project_configuration = VSDebugLibraryVSProjectConfiguration()
+                if project_information:
+                    # Copy the project information since it is shared with other
+                    # conversions.
+                    project_information = copy.copy(project_information)
+                    project_information.guid = project_guid
 
                 else:
-                    project_information.keyword = "Win32Proj"
-
-                    release_project_configuration = ReleaseExeVSProjectConfiguration()
-                    debug_project_configuration = VSDebugExeVSProjectConfiguration()
-
-                # TODO: determine autogenerated source.
-
-                self._ReadMakefile(
-                    makefile_am_path,
-                    solution_name,
-                    project_information,
-                    release_project_configuration,
-                    debug_project_configuration,
-                )
-
-                # TODO: add additional Python 3 project.
-
-                project_information.configurations.Append(release_project_configuration)
-                if debug_project_configuration:
-                    project_information.configurations.Append(
-                        debug_project_configuration
+                    project_information = self._CreateProjectInformation(
+                        makefile_am, solution_name, project_name, project_guid
                     )
+                    if project_key:
+                        self._project_memo.AddProject(project_key, project_information)
+
+                if project_key:
+                    project_keys_by_guid[project_guid] = project_key
 
                 projects_by_guid[project_guid] = project_information
 
         self._CreateThirdPartyDependencies(
-            solution_projects, projects_by_guid, project_guids_by_name
+            solution_name, solution_projects, projects_by_guid, project_guids_by_name
         )
 
+        if self._project_memo:
+            for solution_project in solution_projects:
+                if solution_project.name in self._SUPPORTED_THIRD_PARTY_DEPENDENCIES:
+                    project_keys_by_guid[solution_project.guid] = self._GetMemoKey(
+                        "third_party", solution_project.name, *options
+                    )
+
         # Set-up the solution configurations.
         solution_configurations = resources.VSConfigurations()
 
@@ -1037,10 +1740,6 @@ class LibyalSourceVSSolution(solutions.VSSolution):
         )
         solution_configurations.Append(solution_configuration)
 
-        if output_version not in ["2008"]:
-            # Add x64 as a platform.
-            solution_configurations.ExtendWithX64(output_version)
-
         # Create some look-up dictionaries.
         solution_project_guids_by_name = {}
         solution_projects_by_guid = {}
@@ -1065,61 +1764,137 @@ class LibyalSourceVSSolution(solutions.VSSolution):
 
                 solution_project.AddDependency(dependency_guid)
 
-        solution_filename = self._GetSolutionFilename(solution_name, output_version)
+        for output_version in output_versions:
+            output_configurations = solution_configurations.Copy()
+            if output_version not in ["2008"]:
+                # Add x64 as a platform.
+                output_configurations.ExtendWithX64(output_version)
 
-        self._WriteSolution(
-            solution_filename,
-            output_version,
-            solution_projects,
-            solution_configurations,
-        )
-        for solution_project in solution_projects:
-            project_information = projects_by_guid[solution_project.guid]
-            self._WriteProject(
+            solution_filename = self._GetSolutionFilename(solution_name, output_version)
+
+            self._WriteSolution(
+                solution_filename,
+                output_version,
+                solution_projects,
+                output_configurations,
+            )
+
+        project_data_keys = []
+        tasks = []
+        for output_version in output_versions:
+            for solution_project in solution_projects:
+                project_data = None
+                project_data_key = None
+
+                project_key = project_keys_by_guid.get(solution_project.guid, None)
+                if project_key:
+                    dependencies = []
+                    for dependency_guid in solution_project.dependencies:
+                        dependency_project = solution_projects_by_guid[dependency_guid]
+                        dependencies.extend(
+                            [
+                                dependency_guid,
+                                dependency_project.name,
+                                dependency_project.filename,
+                            ]
+                        )
+
+                    project_data_key = self._GetMemoKey(
+                        "project_data",
+                        project_key,
+                        solution_project.guid,
+                        output_version,
+                        *dependencies,
+                    )
+                    project_data = self._project_memo.GetProjectData(project_data_key)
+                    if project_data:
+                        project_data_key = None
+
+                project_data_keys.append(project_data_key)
+                tasks.append(
+                    (
+                        output_version,
+                        solution_project,
+                        projects_by_guid[solution_project.guid],
+                        solution_projects_by_guid,
+                        project_data,
+                        project_data_key is not None,
+                    )
+                )
+
+        if jobs > 1:
+            task_costs = []
+            for (
                 output_version,
                 solution_project,
                 project_information,
-                solution_projects_by_guid,
+                _,
+                project_data,
+                _,
+            ) in tasks:
+                key = ":".join(
+                    [
+                        "_WriteProject",
+                        os.path.abspath(os.curdir),
+                        output_version,
+                        solution_project.filename,
+                    ]
+                )
+                if project_data:
+                    heuristic_cost = self._cost_model.GetHeuristicCost(
+                        input_size=len(project_data)
+                    )
+                else:
+                    configurations = project_information.configurations
+                    heuristic_cost = self._cost_model.GetHeuristicCost(
+                        number_of_files=(
+                            len(project_information.source_files)
+                            + len(project_information.header_files)
+                            + len(project_information.resource_files)
+                        ),
+                        number_of_configurations=(
+                            configurations.number_of_configurations
+                        ),
+                    )
+                task_costs.append((key, heuristic_cost))
+
+            results = self._RunInParallel(
+                jobs, "_WriteProject", tasks, task_costs=task_costs
             )
 
-        # Create the corresponding Makefile.am
-        solution_project_filenames = []
-        for solution_project in solution_projects:
-            if output_version in ["2008"]:
-                solution_project_extension = "vcproj"
-            else:
-                solution_project_extension = "vcxproj"
+            for project_data_key, project_data in zip(project_data_keys, results):
+                if project_data_key:
+                    self._project_memo.AddProjectData(project_data_key, project_data)
 
-            solution_project_path_segments = solution_project.filename.split("\\")
-            solution_project_path = os.path.join(*solution_project_path_segments)
-            solution_project_filenames.append(
-                f"\t{solution_project_path:s}.{solution_project_extension:s} \\"
-            )
+        else:
+            # Overlap writing the project files with rendering the next project.
+            self._write_behind_file_writer = pipeline.WriteBehindFileWriter()
+            self._write_behind_file_writer.Open()
+
+            try:
+                for project_data_key, task in zip(project_data_keys, tasks):
+                    project_data = self._WriteProject(*task)
+                    if project_data_key:
+                        self._project_memo.AddProjectData(
+                            project_data_key, project_data
+                        )
 
-        makefile_am_lines = ["MSVSCPP_FILES = \\"]
-        for solution_project_filename in sorted(solution_project_filenames):
-            makefile_am_lines.append(solution_project_filename)
+            finally:
+                write_behind_file_writer = self._write_behind_file_writer
+                self._write_behind_file_writer = None
+                write_behind_file_writer.Close()
 
-        makefile_am_lines.append(f"\t{solution_filename:s}")
+        for output_version in output_versions:
+            solution_filename = self._GetSolutionFilename(solution_name, output_version)
+            self._WriteMakefile(output_version, solution_filename, solution_projects)
 
-        makefile_am_lines.extend(
-            [
-                "",
-                "EXTRA_DIST = \\",
-                "\t$(MSVSCPP_FILES)",
-                "",
-                "DISTCLEANFILES = \\",
-                "\tMakefile \\",
-                "\tMakefile.in",
-                "",
-                "",
-            ]
-        )
-        filename = os.path.join(f"vs{output_version:s}", "Makefile.am")
-        logging.info(f"Writing: {filename:s}")
+        self._LogFileSystemSnapshotCounters()
 
-        with io.open(filename, "w", encoding="utf8") as makefile_am:
-            lines = "\n".join(makefile_am_lines)
-            makefile_am.write(lines)
+        if self._project_memo:
+            logging.debug(
+                f"Project memo: {self._project_memo.number_of_hits:d} hits of "
+                f"{self._project_memo.number_of_lookups:d} lookups, hit rate: "
+                f"{self._project_memo.hit_rate:.0%}."
+            )
 
         return True
@@ -0,0 +1,173 @@
+"""Input and output pipeline classes."""
+
+import queue
+import threading
+
+from vstools import filesystem
+
+
+class ReadAheadFileReader:
+    """Reads files ahead of their use on a background thread.
+
+    The files are read in order into a bounded queue, such that reading the
+    upcoming files overlaps with processing the current file while at most
+    a maximum number of files is held in memory.
+    """
+
+    _MAXIMUM_NUMBER_OF_FILES = 8
+
+    def __init__(self, maximum_number_of_files=_MAXIMUM_NUMBER_OF_FILES):
+        """Initializes a read-ahead file reader.
+
+        Args:
+          maximum_number_of_files (Optional[int]): maximum number of files that
+              are read ahead.
+        """
+        super().__init__()
+        self._maximum_number_of_files = maximum_number_of_files
+
+    def _ReadFiles(self, paths, files_queue, abort_event):
+        """Reads files into a queue.
+
+        Args:
+          paths (list[str]): paths of the files.
+          files_queue (queue.Queue): queue to add the data and read error of
+              the files to.
+          abort_event (threading.Event): event that signals the reader to stop.
+        """
+        for path in paths:
+            if abort_event.is_set():
+                break
+
+            data = None
+            exception = None
+            if path:
+                try:
+                    with open(path, "rb") as file_object:
+                        data = file_object.read()
+
+                except (OSError, ValueError) as read_exception:
+                    exception = read_exception
+
+            files_queue.put((data, exception))
+
+    def ReadFiles(self, paths):
+        """Reads files ahead of their use.
+
+        Args:
+          paths (list[str]): paths of the files, where None represents a file
+              that is not read.
+
+        Yields:
+          tuple[bytes, Exception]: data of the file or None if the file could
+              not be read and the error that prevented the file from being read
+              or None if not set, in path order.
+        """
+        files_queue = queue.Queue(maxsize=self._maximum_number_of_files)
+        abort_event = threading.Event()
+
+        thread = threading.Thread(
+            target=self._ReadFiles,
+            args=(paths, files_queue, abort_event),
+            daemon=True,
+        )
+        thread.start()
+
+        try:
+            for _ in paths:
+                yield files_queue.get()
+
+        finally:
+            abort_event.set()
+
+            # Make room in the queue in case the thread is waiting for it.
+            while not files_queue.empty():
+                files_queue.get_nowait()
+
+            thread.join()
+
+
+class WriteBehindFileWriter:
+    """Writes files behind their creation on a background thread.
+
+    Files to write are added to a bounded queue, such that writing the files
+    overlaps with creating the next file. Adding a file blocks when the queue
+    is full, which caps the number of files held in memory. Files that already
+    contain the data are not written.
+    """
+
+    _MAXIMUM_NUMBER_OF_FILES = 8
+
+    def __init__(self, maximum_number_of_files=_MAXIMUM_NUMBER_OF_FILES):
+        """Initializes a write-behind file writer.
+
+        Args:
+          maximum_number_of_files (Optional[int]): maximum number of files that
+              are waiting to be written.
+        """
+        super().__init__()
+        self._exception = None
+        self._file_updater = filesystem.FileUpdater()
+        self._files_queue = None
+        self._maximum_number_of_files = maximum_number_of_files
+        self._thread = None
+
+    def _WriteFiles(self):
+        """Writes the files in the queue until the end of the queue."""
+        while True:
+            queued_file = self._files_queue.get()
+            if queued_file is None:
+                break
+
+            # Files that are queued after a failed write are discarded.
+            if self._exception:
+                continue
+
+            path, data = queued_file
+            try:
+                self._file_updater.UpdateFile(path, data)
+
+            except OSError as exception:
+                self._exception = exception
+
+    def Close(self):
+        """Closes the writer after the queued files have been written.
+
+        Raises:
+          OSError: if a file could not be written.
+        """
+        if self._thread:
+            self._files_queue.put(None)
+            self._thread.join()
+
+        exception = self._exception
+
+        self._exception = None
+        self._files_queue = None
+        self._thread = None
+
+        if exception:
+            raise exception
+
+    def Open(self):
+        """Opens the writer."""
+        self._exception = None
+        self._files_queue = queue.Queue(maxsize=self._maximum_number_of_files)
+
+        self._thread = threading.Thread(target=self._WriteFiles, daemon=True)
+        self._thread.start()
+
+    def WriteFile(self, path, data):
+        """Queues a file to be written.
+
+        Args:
+          path (str): path of the file.
+          data (bytes): data of the file.
+
+        Raises:
+          OSError: if a previously queued file could not be written.
+        """
+        if self._exception:
+            raise self._exception
+
+        self._files_queue.put((path, data))
@@ -1,13 +1,20 @@
 """Project and solution file reader classes."""
 
 import abc
+import collections
 import re
 
+from xml.etree import ElementTree
+
 from vstools import resources
 
 
 class FileReader:
-    """File reader."""
+    """File reader.
+
+    The file data is read in a single call and decoded at once when the first
+    line is read, after which lines are read by index.
+    """
 
     def __init__(self, encoding="utf-8"):
         """Initializes a file reader.
@@ -16,20 +23,33 @@ class FileReader:
           encoding (str): encoding.
         """
         super().__init__()
+        self._data = None
+        self._data_offset = 0
         self._encoding = encoding
         self._file = None
-        self._line = None
+        self._line_index = 0
+        self._lines = None
 
     def _ReadBinaryData(self, size):
         """Reads binary data.
 
+        Binary data can only be read before the first line is read, since lines
+        are read from data that has been decoded.
+
         Args:
           size (int): number of bytes to read.
 
         Returns:
           bytes: binary data.
         """
-        return self._file.read(size)
+        if self._data is None:
+            self._data = self._file.read()
+
+        data_end_offset = self._data_offset + size
+        binary_data = self._data[self._data_offset : data_end_offset]
+        self._data_offset += len(binary_data)
+
+        return binary_data
 
     def _ReadLine(self, look_ahead=False):
         """Reads a line.
@@ -39,29 +59,42 @@ class FileReader:
               read (False) or not (True).
 
         Returns:
-          str: line stripped of leading and trailing white space or None if no
-              input is available.
+          str: line stripped of leading and trailing white space or an empty
+              string if no input is available.
         """
-        if self._line is not None:
-            line = self._line
-            if not look_ahead:
-                self._line = None
+        if self._lines is None:
+            self._ReadLines()
+
+        line_index = self._line_index
+        if line_index >= len(self._lines):
+            return ""
 
-        else:
-            line = self._file.readline()
-            if line:
-                line = line.strip()
-            if look_ahead:
-                self._line = line
+        if not look_ahead:
+            self._line_index = line_index + 1
 
-        if isinstance(line, bytes):
-            line = line.decode(self._encoding)
+        return self._lines[line_index]
 
-        return line
+    def _ReadLines(self):
+        """Reads and decodes the remaining data into lines."""
+        if self._data is None:
+            self._data = self._file.read()
+
+        text = self._data[self._data_offset :].decode(self._encoding)
+
+        self._data = None
+        self._data_offset = 0
+        self._line_index = 0
+        self._lines = [line.strip() for line in text.split("\n")]
 
     def Close(self):
         """Closes the file."""
         self._file.close()
+        self._file = None
+
+        self._data = None
+        self._data_offset = 0
+        self._line_index = 0
+        self._lines = None
 
     def Open(self, filename):
         """Opens the file.
@@ -71,6 +104,18 @@ class FileReader:
         """
         self._file = open(filename, "rb")  # pylint: disable=consider-using-with
 
+    def OpenFileObject(self, file_object):
+        """Opens a file-like object.
+
+        The file reader takes ownership of the file-like object and closes it
+        on Close.
+
+        Args:
+          file_object (file): binary file-like object, which is positioned at
+              the start of the data.
+        """
+        self._file = file_object
+
 
 class VSProjectFileReader(FileReader):
     """Visual Studio project file reader."""
@@ -126,6 +171,48 @@ class VS2008ProjectFileReader(VSProjectFileReader):
         "TargetMachine": "target_machine",
     }
 
+    _TOOL_CONFIGURATION_OPTIONS = {
+        "VCCLCompilerTool": _TOOL_COMPILER_CONFIGURATION_OPTIONS,
+        "VCLibrarianTool": _TOOL_LIBRARIAN_CONFIGURATION_OPTIONS,
+        "VCLinkerTool": _TOOL_LINKER_CONFIGURATION_OPTIONS,
+    }
+
+    _FILTER_FILES = {
+        "Header Files": "header_files",
+        "Resource Files": "resource_files",
+        "Source Files": "source_files",
+    }
+
+    _PROJECT_INFORMATION_OPTIONS = {
+        "Keyword": "keyword",
+        "Name": "name",
+        "ProjectGUID": "guid",
+        "RootNamespace": "root_name_space",
+    }
+
+    # Attribute formatted as: name="value"
+    _ATTRIBUTE_RE = re.compile(r'([^\s="]+)="([^"]*)"')
+
+    # Separator of a list of library directories, where the semicolon of
+    # an escaped quote, such as in "&quot;$(OutDir)&quot;", is not a separator.
+    _LIBRARY_DIRECTORIES_SEPARATOR_RE = re.compile(r"(?<!&quot);")
+
+    def _ParseAttribute(self, line):
+        """Parses an attribute.
+
+        Args:
+          line (str): line that contains the attribute.
+
+        Returns:
+          tuple[str, str]: name and value of the attribute or None and None if
+              the line does not contain an attribute.
+        """
+        match = self._ATTRIBUTE_RE.match(line)
+        if not match:
+            return None, None
+
+        return match.groups()
+
     def _ParseConfigurationOption(self, project_configuration, definition, name, line):
         """Parses a configuration option.
 
@@ -135,9 +222,9 @@ class VS2008ProjectFileReader(VSProjectFileReader):
           name (str): name of the configuration value in the project information.
           line (str): line that contains the configuration value.
         """
-        values = re.findall(f'{definition:s}="([^"]*)"', line)
-        if len(values) == 1:
-            setattr(project_configuration, name, values[0])
+        attribute_name, attribute_value = self._ParseAttribute(line)
+        if attribute_name == definition:
+            setattr(project_configuration, name, attribute_value)
 
     def _ParseConfigurationOptions(
         self, project_configuration, configuration_options, line
@@ -150,17 +237,11 @@ class VS2008ProjectFileReader(VSProjectFileReader):
               as a name per definition.
           line (str): line that contains the configuration value.
         """
-        configuration_definition, _, _ = line.partition("=")
-
-        configuration_value = configuration_options.get(configuration_definition, None)
+        attribute_name, attribute_value = self._ParseAttribute(line)
 
+        configuration_value = configuration_options.get(attribute_name, None)
         if configuration_value:
-            self._ParseConfigurationOption(
-                project_configuration,
-                configuration_definition,
-                configuration_value,
-                line,
-            )
+            setattr(project_configuration, configuration_value, attribute_value)
 
     def _ReadConfiguration(self, line):
         """Reads a configuration.
@@ -178,9 +259,7 @@ class VS2008ProjectFileReader(VSProjectFileReader):
         project_configuration = resources.VSProjectConfiguration()
 
         found_tool = False
-        found_tool_compiler = False
-        found_tool_librarian = False
-        found_tool_linker = False
+        tool_configuration_options = None
 
         while line:
             line = self._ReadLine()
@@ -191,71 +270,29 @@ class VS2008ProjectFileReader(VSProjectFileReader):
             if found_tool:
                 if line.startswith("/>"):
                     found_tool = False
-                    found_tool_compiler = False
-                    found_tool_librarian = False
-                    found_tool_linker = False
+                    tool_configuration_options = None
 
-                elif found_tool_compiler:
+                elif tool_configuration_options:
                     self._ParseConfigurationOptions(
-                        project_configuration,
-                        self._TOOL_COMPILER_CONFIGURATION_OPTIONS,
-                        line,
+                        project_configuration, tool_configuration_options, line
                     )
 
-                    if isinstance(project_configuration.include_directories, str):
-                        project_configuration.include_directories = (
-                            project_configuration.include_directories.split(";")
-                        )
-
-                elif found_tool_librarian:
-                    self._ParseConfigurationOptions(
-                        project_configuration,
-                        self._TOOL_LIBRARIAN_CONFIGURATION_OPTIONS,
-                        line,
-                    )
-
-                elif found_tool_linker:
-                    self._ParseConfigurationOptions(
-                        project_configuration,
-                        self._TOOL_LINKER_CONFIGURATION_OPTIONS,
-                        line,
+                elif line.startswith("Name="):
+                    _, tool_name = self._ParseAttribute(line)
+                    tool_configuration_options = self._TOOL_CONFIGURATION_OPTIONS.get(
+                        tool_name, None
                     )
 
-                    additional_dependencies = (
-                        project_configuration.additional_dependencies
-                    )
-                    if isinstance(additional_dependencies, str):
-                        # pylint: disable=no-member
-                        additional_dependencies = additional_dependencies.split(" ")
-
-                    project_configuration.additional_dependencies = []
-                    for dependency in additional_dependencies:
-                        dependency.replace("$(ConfigurationName)", "$(Configuration)")
-                        project_configuration.additional_dependencies.append(dependency)
-
-                    if isinstance(project_configuration.library_directories, str):
-                        project_configuration.library_directories = (
-                            project_configuration.library_directories.split(";")
-                        )
-
-                elif line.startswith('Name="VCCLCompilerTool"'):
-                    found_tool_compiler = True
-
-                elif line.startswith('Name="VCLibrarianTool"'):
-                    found_tool_librarian = True
-
-                elif line.startswith('Name="VCLinkerTool"'):
-                    found_tool_linker = True
-
             elif line.startswith("<Tool"):
                 found_tool = True
 
             elif line.startswith("Name="):
-                # For more than 1 match findall will return a list with a tuple.
-                values = re.findall('Name="([^|]*)[|]([^"]*)"', line)[0]
-                if len(values) == 2:
-                    project_configuration.name = values[0]
-                    project_configuration.platform = values[1]
+                _, configuration_identifier = self._ParseAttribute(line)
+                if configuration_identifier:
+                    name, separator, platform = configuration_identifier.partition("|")
+                    if separator:
+                        project_configuration.name = name
+                        project_configuration.platform = platform
 
             else:
                 self._ParseConfigurationOptions(
@@ -265,6 +302,26 @@ class VS2008ProjectFileReader(VSProjectFileReader):
             # TODO: PlatformToolset.
             # TargetFrameworkVersion ?
 
+        if isinstance(project_configuration.include_directories, str):
+            project_configuration.include_directories = (
+                project_configuration.include_directories.split(";")
+            )
+
+        if isinstance(project_configuration.additional_dependencies, str):
+            # pylint: disable=no-member
+            project_configuration.additional_dependencies = (
+                project_configuration.additional_dependencies.split(" ")
+            )
+
+        if isinstance(project_configuration.library_directories, str):
+            project_configuration.library_directories = [
+                library_directory
+                for library_directory in self._LIBRARY_DIRECTORIES_SEPARATOR_RE.split(
+                    project_configuration.library_directories
+                )
+                if library_directory
+            ]
+
         # Add the target machine when not defined.
         if not project_configuration.target_machine:
             if project_configuration.platform == "Win32":
@@ -324,9 +381,7 @@ class VS2008ProjectFileReader(VSProjectFileReader):
 
         if result:
             found_filter = False
-            found_filter_source_files = False
-            found_filter_header_files = False
-            found_filter_resource_files = False
+            filter_files = None
 
             while line:
                 line = self._ReadLine()
@@ -337,40 +392,19 @@ class VS2008ProjectFileReader(VSProjectFileReader):
                 if found_filter:
                     if line.startswith("</Filter>"):
                         found_filter = False
-                        found_filter_source_files = False
-                        found_filter_header_files = False
-                        found_filter_resource_files = False
-
-                    elif found_filter_source_files:
-                        if line.startswith("RelativePath="):
-                            values = re.findall('RelativePath="([^"]*)"', line)
-
-                            if len(values) == 1:
-                                project_information.source_files.append(values[0])
+                        filter_files = None
 
-                    elif found_filter_header_files:
+                    elif filter_files is not None:
                         if line.startswith("RelativePath="):
-                            values = re.findall('RelativePath="([^"]*)"', line)
+                            _, relative_path = self._ParseAttribute(line)
+                            if relative_path is not None:
+                                filter_files.append(relative_path)
 
-                            if len(values) == 1:
-                                project_information.header_files.append(values[0])
-
-                    elif found_filter_resource_files:
-                        if line.startswith("RelativePath="):
-                            values = re.findall('RelativePath="([^"]*)"', line)
-
-                            if len(values) == 1:
-                                project_information.resource_files.append(values[0])
-
-                    elif line.startswith('Name="Source Files"'):
-                        found_filter_source_files = True
-
-                    elif line.startswith('Name="Header Files"'):
-                        found_filter_header_files = True
-
-                    elif line.startswith('Name="Resource Files"'):
-
-                        found_filter_resource_files = True
+                    elif line.startswith("Name="):
+                        _, filter_name = self._ParseAttribute(line)
+                        files_attribute = self._FILTER_FILES.get(filter_name, None)
+                        if files_attribute:
+                            filter_files = getattr(project_information, files_attribute)
 
                 elif line.startswith("<Filter"):
                     found_filter = True
@@ -386,25 +420,18 @@ class VS2008ProjectFileReader(VSProjectFileReader):
             if line.startswith(">"):
                 break
 
-            if line.startswith("Name="):
-                values = re.findall('Name="([^"]*)"', line)
-                if len(values) == 1:
-                    project_information.name = values[0]
-
-            elif line.startswith("ProjectGUID="):
-                values = re.findall('ProjectGUID="{([^}]*)}"', line)
-                if len(values) == 1:
-                    project_information.guid = values[0]
+            attribute_name, attribute_value = self._ParseAttribute(line)
 
-            elif line.startswith("RootNamespace="):
-                values = re.findall('RootNamespace="([^"]*)"', line)
-                if len(values) == 1:
-                    project_information.root_name_space = values[0]
+            project_information_value = self._PROJECT_INFORMATION_OPTIONS.get(
+                attribute_name, None
+            )
+            if project_information_value == "guid":
+                # The GUID is formatted as: {%GUID%}
+                if attribute_value.startswith("{") and attribute_value.endswith("}"):
+                    project_information.guid = attribute_value[1:-1]
 
-            elif line.startswith("Keyword="):
-                values = re.findall('Keyword="([^"]*)"', line)
-                if len(values) == 1:
-                    project_information.keyword = values[0]
+            elif project_information_value:
+                setattr(project_information, project_information_value, attribute_value)
 
             line = self._ReadLine()
 
@@ -450,56 +477,440 @@ class VS2008ProjectFileReader(VSProjectFileReader):
 
 
 class VS2010ProjectFileReader(VSProjectFileReader):
-    """Visual Studio 2010 project file reader."""
+    """Visual Studio 2010 project file reader.
+
+    The project file is read incrementally with iterparse and elements are
+    discarded once they have been read, so that the memory used does not
+    depend on the number of files in the project.
+    """
+
+    # ToolsVersion of the project files supported by the reader.
+    TOOLS_VERSION = "4.0"
+
+    _NAMESPACE = "{http://schemas.microsoft.com/developer/msbuild/2003}"
+
+    # Configuration options defined as an attribute name and the attribute
+    # value per element value, where None indicates the element value is used.
+    _CONFIGURATION_OPTIONS = {
+        "CLRSupport": ("managed_extensions", {"true": "1"}),
+        "CharacterSet": ("character_set", {"Unicode": "1"}),
+        "ConfigurationType": (
+            "output_type",
+            {"Application": "1", "DynamicLibrary": "2", "StaticLibrary": "4"},
+        ),
+        "LinkIncremental": ("link_incremental", {"false": "1"}),
+        "WholeProgramOptimization": (
+            "whole_program_optimization",
+            {"false": "0", "true": "1"},
+        ),
+    }
+
+    _TOOL_COMPILER_CONFIGURATION_OPTIONS = {
+        "AdditionalIncludeDirectories": ("include_directories", None),
+        "BasicRuntimeChecks": (
+            "basic_runtime_checks",
+            {"Default": "0", "EnableFastChecks": "3"},
+        ),
+        "CompileAs": ("compile_as", {"CompileAsC": "1", "CompileAsCpp": "2"}),
+        "DebugInformationFormat": (
+            "debug_information_format",
+            {"": "0", "ProgramDatabase": "3"},
+        ),
+        "FunctionLevelLinking": ("enable_function_level_linking", None),
+        "IntrinsicFunctions": ("enable_intrinsic_functions", None),
+        "Optimization": ("optimization", {"Disabled": "0", "MaxSpeed": "2"}),
+        "PrecompiledHeader": ("precompiled_header", {"": "0"}),
+        "PreprocessorDefinitions": ("preprocessor_definitions", None),
+        "RuntimeLibrary": (
+            "runtime_library",
+            {"MultiThreadedDLL": "2", "MultiThreadedDebugDLL": "3"},
+        ),
+        "SmallerTypeCheck": ("smaller_type_check", None),
+        "TreatWarningAsError": ("warning_as_error", None),
+        "WarningLevel": ("warning_level", {"Level3": "3", "Level4": "4"}),
+        "WholeProgramOptimization": (
+            "whole_program_optimization",
+            {"false": "0", "true": "1"},
+        ),
+    }
+
+    _TOOL_LIBRARIAN_CONFIGURATION_OPTIONS = {
+        "IgnoreAllDefaultLibraries": ("librarian_ignore_defaults", None),
+        "ModuleDefinitionFile": ("module_definition_file", None),
+        "OutputFile": ("librarian_output_file", None),
+    }
+
+    _TOOL_LINKER_CONFIGURATION_OPTIONS = {
+        "AdditionalDependencies": ("additional_dependencies", None),
+        "AdditionalLibraryDirectories": ("library_directories", None),
+        "DataExecutionPrevention": (
+            "data_execution_prevention",
+            {"": "0", "false": "1", "true": "2"},
+        ),
+        "EnableCOMDATFolding": ("enable_comdat_folding", {"": "0", "true": "2"}),
+        "FixedBaseAddress": ("fixed_base_address", {"": "0"}),
+        "GenerateDebugInformation": ("generate_debug_information", None),
+        "ImportLibrary": ("import_library", None),
+        "ModuleDefinitionFile": ("module_definition_file", None),
+        "OptimizeReferences": ("optimize_references", {"": "0", "true": "2"}),
+        "OutputFile": ("linker_output_file", None),
+        "RandomizedBaseAddress": (
+            "randomized_base_address",
+            {"false": "1", "true": "2"},
+        ),
+        "SubSystem": ("sub_system", {"Console": "1", "NotSet": "0"}),
+        "TargetMachine": ("target_machine", {"MachineX64": "2", "MachineX86": "1"}),
+    }
+
+    _TOOL_CONFIGURATION_OPTIONS = {
+        "ClCompile": _TOOL_COMPILER_CONFIGURATION_OPTIONS,
+        "Lib": _TOOL_LIBRARIAN_CONFIGURATION_OPTIONS,
+        "Link": _TOOL_LINKER_CONFIGURATION_OPTIONS,
+    }
+
+    _ITEM_FILES = {
+        "ClCompile": "source_files",
+        "ClInclude": "header_files",
+        "ResourceCompile": "resource_files",
+    }
+
+    _LIST_CONFIGURATION_OPTIONS = frozenset(
+        ["additional_dependencies", "include_directories", "library_directories"]
+    )
+
+    # Configuration options of which the writers remove the path segment
+    # separator after $(OutDir).
+    _OUT_DIR_CONFIGURATION_OPTIONS = frozenset(
+        [
+            "additional_dependencies",
+            "import_library",
+            "librarian_output_file",
+            "library_directories",
+            "linker_output_file",
+        ]
+    )
+
+    _OUT_DIR_RE = re.compile(r"[$][(]OutDir[)](?=[^\\;])")
+
+    _PROJECT_INFORMATION_OPTIONS = {
+        "Keyword": "keyword",
+        "ProjectGuid": "guid",
+        "ProjectName": "name",
+        "RootNamespace": "root_name_space",
+    }
+
+    # Condition formatted as: '$(Configuration)|$(Platform)'=='name|platform'
+    _CONDITION_RE = re.compile(r"=='([^|']*)\|([^']*)'")
 
-    # TODO: implement.
+    def __init__(self, encoding="utf-8"):
+        """Initializes a Visual Studio project file reader.
+
+        Args:
+          encoding (str): encoding.
+        """
+        super().__init__(encoding=encoding)
+        self._events = None
+        self._root_element = None
+
+    def _GetConfiguration(self, project_information, configuration_identifier):
+        """Retrieves a configuration and creates it if needed.
+
+        Args:
+          project_information (VSProjectInformation): project information.
+          configuration_identifier (tuple[str, str]): name and platform of
+              the configuration.
+
+        Returns:
+          VSProjectConfiguration: configuration.
+        """
+        name, platform = configuration_identifier
+        try:
+            return project_information.configurations.GetByIdentifier(name, platform)
+        except KeyError:
+            pass
+
+        project_configuration = resources.VSProjectConfiguration()
+        project_configuration.name = name
+        project_configuration.platform = platform
+
+        project_information.configurations.Append(project_configuration)
+
+        return project_configuration
+
+    def _ParseCondition(self, element):
+        """Parses the configuration identifier of a condition attribute.
+
+        Args:
+          element (xml.etree.ElementTree.Element): element.
+
+        Returns:
+          tuple[str, str]: name and platform of the configuration or None if
+              the element has no configuration condition.
+        """
+        condition = element.get("Condition", None)
+        if not condition:
+            return None
+
+        match = self._CONDITION_RE.search(condition)
+        if not match:
+            return None
+
+        return match.groups()
+
+    def _ParseConfigurationOption(
+        self, project_configuration, configuration_options, element
+    ):
+        """Parses a configuration option.
+
+        Args:
+          project_configuration (VSProjectConfiguration): project configuration.
+          configuration_options (dict[str, tuple[str, dict[str, str]]]):
+              configuration options per element name.
+          element (xml.etree.ElementTree.Element): element that contains
+              the configuration value.
+        """
+        element_name = element.tag[len(self._NAMESPACE) :]
+
+        configuration_option = configuration_options.get(element_name, None)
+        if not configuration_option:
+            return
+
+        name, values = configuration_option
+
+        value = (element.text or "").strip()
+        value = value.removesuffix(f"%({element_name:s})").rstrip(";")
+
+        if name in self._OUT_DIR_CONFIGURATION_OPTIONS:
+            value = self._OUT_DIR_RE.sub(r"$(OutDir)\\", value)
+
+        # The Visual Studio 2017 and later project file writers add the default
+        # import library themselves.
+        if name == "import_library" and value == "$(OutDir)\\$(ProjectName).lib":
+            return
+
+        if values is not None:
+            value = values.get(value, None)
+            if value is None:
+                return
 
+        elif name in self._LIST_CONFIGURATION_OPTIONS:
+            value = [item for item in value.split(";") if item]
 
-class VS2012ProjectFileReader(VSProjectFileReader):
+        setattr(project_configuration, name, value)
+
+    def _ReadElement(self, project_information, element, parent_elements):
+        """Reads an element.
+
+        Args:
+          project_information (VSProjectInformation): project information.
+          element (xml.etree.ElementTree.Element): element.
+          parent_elements (list[xml.etree.ElementTree.Element]): parent elements
+              of the element, where the first is the root element.
+        """
+        if len(parent_elements) < 2:
+            return
+
+        element_name = element.tag[len(self._NAMESPACE) :]
+        group_element = parent_elements[1]
+        group_name = group_element.tag[len(self._NAMESPACE) :]
+
+        if group_name == "PropertyGroup" and len(parent_elements) == 2:
+            if group_element.get("Label", None) == "Globals":
+                name = self._PROJECT_INFORMATION_OPTIONS.get(element_name, None)
+                if name:
+                    value = (element.text or "").strip()
+                    if name == "guid":
+                        value = value.strip("{}")
+                    setattr(project_information, name, value)
+
+            else:
+                # Visual Studio 2010 defines the condition on the element instead
+                # of the property group.
+                configuration_identifier = self._ParseCondition(element)
+                if not configuration_identifier:
+                    configuration_identifier = self._ParseCondition(group_element)
+
+                if configuration_identifier:
+                    project_configuration = self._GetConfiguration(
+                        project_information, configuration_identifier
+                    )
+                    self._ParseConfigurationOption(
+                        project_configuration, self._CONFIGURATION_OPTIONS, element
+                    )
+
+        elif group_name == "ItemDefinitionGroup" and len(parent_elements) == 3:
+            configuration_identifier = self._ParseCondition(group_element)
+            if configuration_identifier:
+                project_configuration = self._GetConfiguration(
+                    project_information, configuration_identifier
+                )
+                tool_name = parent_elements[2].tag[len(self._NAMESPACE) :]
+
+                # The writers use the linker section to determine if linker values
+                # are set.
+                if tool_name == "Link":
+                    project_configuration.linker_values_set = True
+
+                configuration_options = self._TOOL_CONFIGURATION_OPTIONS.get(
+                    tool_name, None
+                )
+                if configuration_options:
+                    self._ParseConfigurationOption(
+                        project_configuration, configuration_options, element
+                    )
+
+        elif group_name == "ItemGroup":
+            if len(parent_elements) == 2:
+                if element_name == "ProjectConfiguration":
+                    configuration_identifier = element.get("Include", "")
+                    name, separator, platform = configuration_identifier.partition("|")
+                    if separator:
+                        self._GetConfiguration(project_information, (name, platform))
+
+                else:
+                    files_name = self._ITEM_FILES.get(element_name, None)
+                    filename = element.get("Include", None)
+                    if files_name and filename:
+                        files = getattr(project_information, files_name)
+                        files.append(filename)
+
+            elif element_name == "Project" and len(parent_elements) == 3:
+                dependency_guid = (element.text or "").strip().strip("{}")
+                if dependency_guid:
+                    project_information.dependencies.append(dependency_guid.lower())
+
+    def Close(self):
+        """Closes the file."""
+        super().Close()
+        self._events = None
+        self._root_element = None
+
+    def ReadHeader(self):
+        """Reads a file header.
+
+        Returns:
+          bool: True if successful or false otherwise.
+        """
+        self._events = ElementTree.iterparse(self._file, events=("start", "end"))
+
+        try:
+            _, self._root_element = next(self._events)
+        except (ElementTree.ParseError, StopIteration):
+            return False
+
+        if self._root_element.tag != f"{self._NAMESPACE:s}Project":
+            return False
+
+        tools_version = self._root_element.get("ToolsVersion", None)
+        return tools_version == self.TOOLS_VERSION
+
+    def ReadProject(self):
+        """Reads the project.
+
+        Returns:
+          VSProjectInformation: project information if successful or None otherwise.
+        """
+        project_information = resources.VSProjectInformation()
+
+        parent_elements = [self._root_element]
+        try:
+            for event, element in self._events:
+                if event == "start":
+                    parent_elements.append(element)
+                    continue
+
+                parent_elements.pop()
+                if not parent_elements:
+                    break
+
+                self._ReadElement(project_information, element, parent_elements)
+
+                # Discard the element since it has been read.
+                parent_elements[-1].remove(element)
+
+        except ElementTree.ParseError:
+            return None
+
+        # The project name is not stored in the project file by default.
+        if not project_information.name:
+            project_information.name = project_information.root_name_space
+
+        for project_configuration in project_information.configurations.GetSorted():
+            # Add the target machine when not defined.
+            if not project_configuration.target_machine:
+                if project_configuration.platform == "Win32":
+                    project_configuration.target_machine = "1"
+                # TODO: assuming here that 2 is x64.
+                elif project_configuration.platform == "x64":
+                    project_configuration.target_machine = "2"
+
+        return project_information
+
+
+class VS2012ProjectFileReader(VS2010ProjectFileReader):
     """Visual Studio 2012 project file reader."""
 
-    # TODO: implement.
+    TOOLS_VERSION = "4.0"
 
 
-class VS2013ProjectFileReader(VSProjectFileReader):
+class VS2013ProjectFileReader(VS2010ProjectFileReader):
     """Visual Studio 2013 project file reader."""
 
-    # TODO: implement.
+    TOOLS_VERSION = "12.0"
 
 
-class VS2015ProjectFileReader(VSProjectFileReader):
+class VS2015ProjectFileReader(VS2010ProjectFileReader):
     """Visual Studio 2015 project file reader."""
 
-    # TODO: implement.
+    TOOLS_VERSION = "14.0"
 
 
-class VS2017ProjectFileReader(VSProjectFileReader):
+class VS2017ProjectFileReader(VS2010ProjectFileReader):
     """Visual Studio 2017 project file reader."""
 
-    # TODO: implement.
+    TOOLS_VERSION = "15.0"
 
 
-class VS2019ProjectFileReader(VSProjectFileReader):
+class VS2019ProjectFileReader(VS2010ProjectFileReader):
     """Visual Studio 2019 project file reader."""
 
-    # TODO: implement.
+    TOOLS_VERSION = "15.0"
 
 
-class VS2022ProjectFileReader(VSProjectFileReader):
+class VS2022ProjectFileReader(VS2010ProjectFileReader):
     """Visual Studio 2022 project file reader."""
 
-    # TODO: implement.
+    TOOLS_VERSION = "Current"
 
 
-class VS2026ProjectFileReader(VSProjectFileReader):
+class VS2026ProjectFileReader(VS2010ProjectFileReader):
     """Visual Studio 2026 project file reader."""
 
-    # TODO: implement.
+    TOOLS_VERSION = "Current"
 
 
 class VSSolutionFileReader(FileReader):
     """Visual Studio solution file (.sln) reader."""
 
+    # 8BC9CEB8-8B4A-11D0-8D11-00A0C91BC942 is a Visual C++ related GUID.
+    _PROJECT_PREFIX = 'Project("{8BC9CEB8-8B4A-11D0-8D11-00A0C91BC942}") = '
+
+    # Project formatted as: Project("{%GUID%}") = "name", "filename", "{%GUID%}"
+    _PROJECT_RE = re.compile(
+        r'Project\("{8BC9CEB8-8B4A-11D0-8D11-00A0C91BC942}"\) = "([^"]*)", '
+        r'"([^"]*)\.vcx?proj", '
+        r'"{([0-9A-F]*-[0-9A-F]*-[0-9A-F]*-[0-9A-F]*-[0-9A-F]*)}"'
+    )
+
+    # Project dependency formatted as: {%GUID%} = {%GUID%}
+    _PROJECT_DEPENDENCY_RE = re.compile(
+        r"{([0-9A-F]*-[0-9A-F]*-[0-9A-F]*-[0-9A-F]*-[0-9A-F]*)} = "
+        r"{([0-9A-F]*-[0-9A-F]*-[0-9A-F]*-[0-9A-F]*-[0-9A-F]*)}"
+    )
+
+    # Solution configuration formatted as: name|platform = name|platform
+    _SOLUTION_CONFIGURATION_RE = re.compile(r"([^|]*)[|]([^ ]*) = ([^|]*)[|]([^ ]*)")
+
     # pylint: disable=redundant-returns-doc
 
     @abc.abstractmethod
@@ -549,16 +960,10 @@ class VSSolutionFileReader(FileReader):
                     found_section = False
 
                 else:
-                    # For more than 1 match findall will return a list with a tuple.
-                    values = re.findall("([^|]*)[|]([^ ]*) = ([^|]*)[|]([^ ]*)", line)
-
-                    if len(values) == 1:
-                        values = values[0]
-                        if (
-                            len(values) == 4
-                            and values[0] == values[2]
-                            and values[1] == values[3]
-                        ):
+                    match = self._SOLUTION_CONFIGURATION_RE.match(line)
+                    if match:
+                        values = match.groups()
+                        if values[0] == values[2] and values[1] == values[3]:
                             configuration = resources.VSSolutionConfiguration()
                             configuration.name = values[0]
                             configuration.platform = values[1]
@@ -595,7 +1000,7 @@ class VSSolutionFileReader(FileReader):
 
         line = self._ReadLine(look_ahead=True)
         while line:
-            if line.startswith("# Visual C++ "):
+            if line.startswith(("# ", "MinimumVisualStudioVersion = ")):
                 self._ReadLine()
 
             elif line.startswith("VisualStudioVersion = "):
@@ -613,38 +1018,36 @@ class VSSolutionFileReader(FileReader):
 
         return True
 
+    def IterProjects(self):
+        """Iterates over the projects.
+
+        Every project is yielded as soon as it has been read, before the rest
+        of the solution file is read.
+
+        Yields:
+          VSSolutionProject: project in preserved order.
+        """
+        solution_project = self.ReadProject()
+
+        while solution_project:
+            yield solution_project
+            solution_project = self.ReadProject()
+
     def ReadProject(self):
         """Reads a project.
 
         Returns:
           VSSolutionProject: project if successful or None otherwise.
         """
-        # 8BC9CEB8-8B4A-11D0-8D11-00A0C91BC942 is a Visual C++ related GUID.
-
         line = self._ReadLine(look_ahead=True)
-        if not line or not line.startswith(
-            'Project("{8BC9CEB8-8B4A-11D0-8D11-00A0C91BC942}") = '
-        ):
+        if not line or not line.startswith(self._PROJECT_PREFIX):
             return None
 
-        # For more than 1 match findall will return a list with a tuple.
-        values = re.findall(
-            (
-                'Project\\("{8BC9CEB8-8B4A-11D0-8D11-00A0C91BC942}"\\) = "([^"]*)", '
-                '"([^"]*)\\.vcproj", '
-                '"{([0-9A-F]*-[0-9A-F]*-[0-9A-F]*-[0-9A-F]*-[0-9A-F]*)}"'
-            ),
-            line,
-        )
-
-        if len(values) != 1:
-            return None
-
-        values = values[0]
-        if len(values) != 3:
+        match = self._PROJECT_RE.match(line)
+        if not match:
             return None
 
-        solution_project = resources.VSSolutionProject(values[0], values[1], values[2])
+        solution_project = resources.VSSolutionProject(*match.groups())
 
         found_dependencies = False
 
@@ -658,41 +1061,49 @@ class VSSolutionFileReader(FileReader):
                     found_dependencies = False
 
                 else:
-                    # The dependencies are defined as: {%GUID%} = {%GUID%}
-                    # For more than 1 match findall will return a list with a tuple.
-                    guids = re.findall(
-                        (
-                            "{([0-9A-F]*-[0-9A-F]*-[0-9A-F]*-[0-9A-F]*-[0-9A-F]*)} = "
-                            "{([0-9A-F]*-[0-9A-F]*-[0-9A-F]*-[0-9A-F]*-[0-9A-F]*)}"
-                        ),
-                        line,
-                    )
-
-                    if len(guids) == 1:
-                        guids = guids[0]
-
-                        if len(guids) == 2 and guids[0] == guids[1]:
-                            solution_project.AddDependency(guids[0])
+                    match = self._PROJECT_DEPENDENCY_RE.match(line)
+                    if match:
+                        dependency_guid, guid = match.groups()
+                        if dependency_guid == guid:
+                            solution_project.AddDependency(dependency_guid)
 
             elif line == "ProjectSection(ProjectDependencies) = postProject":
                 found_dependencies = True
 
         return solution_project
 
+    def ReadProjectGUIDs(self):
+        """Reads the project GUIDs.
+
+        Only the project lines are read, the project sections and the global
+        section are skipped. The solution file cannot be read any further
+        afterwards.
+
+        Returns:
+          dict[str, str]: lower case project GUIDs per project name.
+        """
+        if self._lines is None:
+            self._ReadLines()
+
+        project_guids_by_name = {}
+        for line in self._lines[self._line_index :]:
+            if line.startswith(self._PROJECT_PREFIX):
+                match = self._PROJECT_RE.match(line)
+                if match:
+                    name, _, guid = match.groups()
+                    project_guids_by_name[name] = guid.lower()
+
+        self._line_index = len(self._lines)
+
+        return project_guids_by_name
+
     def ReadProjects(self):
         """Reads the projects.
 
         Returns:
           list[VSSolutionProject]: projects in preserved order.
         """
-        solution_projects = []
-        solution_project = self.ReadProject()
-
-        while solution_project:
-            solution_projects.append(solution_project)
-            solution_project = self.ReadProject()
-
-        return solution_projects
+        return list(self.IterProjects())
 
 
 class VS2008SolutionFileReader(VSSolutionFileReader):
@@ -726,7 +1137,11 @@ class VS2010SolutionFileReader(VSSolutionFileReader):
 
 
 class VS2012SolutionFileReader(VSSolutionFileReader):
-    """Visual Studio 2012 solution file (.sln) reader."""
+    """Visual Studio 2012 solution file (.sln) reader.
+
+    The reader is also used for solution files of format version 12.00 with an
+    unsupported Visual Studio version.
+    """
 
     def _CheckFormatVersion(self, line):
         """Checks the format version.
@@ -739,6 +1154,17 @@ class VS2012SolutionFileReader(VSSolutionFileReader):
         """
         return line.endswith(" 12.00")
 
+    def _CheckVisualStudioVersion(self, line):
+        """Checks the Visual Studio version.
+
+        Args:
+          line (str): line containing the Visual Studio format version.
+
+        Returns:
+          bool: True if successful or false otherwise.
+        """
+        return True
+
 
 class VS2013SolutionFileReader(VS2012SolutionFileReader):
     """Visual Studio 2013 solution file (.sln) reader."""
@@ -821,6 +1247,238 @@ class VS2022SolutionFileReader(VS2012SolutionFileReader):
 
 
 class VS2026SolutionFileReader(FileReader):
-    """Visual Studio 2026 solution file (.slnx) reader."""
+    """Visual Studio 2026 solution file (.slnx) reader.
+
+    The solution file is read incrementally with iterparse and elements are
+    discarded once they have been read, so that the memory used does not
+    depend on the number of projects in the solution.
+    """
+
+    def __init__(self, encoding="utf-8"):
+        """Initializes a Visual Studio solution file reader.
+
+        Args:
+          encoding (str): encoding.
+        """
+        super().__init__(encoding=encoding)
+        self._configuration_names = []
+        self._configuration_platforms = []
+        self._dependency_filenames = {}
+        self._events = None
+        self._parent_elements = []
+
+    def _GetProjectFilename(self, path):
+        """Retrieves the project filename from a path in the solution file.
+
+        Args:
+          path (str): path of the project file, relative to the solution file.
+
+        Returns:
+          str: name of the project file without extension.
+        """
+        project_filename, _, _ = path.replace("/", "\\").rpartition(".")
+        return project_filename
+
+    def _ReadProjectElement(self, element):
+        """Reads a project element.
+
+        Args:
+          element (xml.etree.ElementTree.Element): project element.
+
+        Returns:
+          VSSolutionProject: project or None if not available.
+        """
+        path = element.get("Path", None)
+        if not path or not path.endswith(".vcxproj"):
+            return None
+
+        project_filename = self._GetProjectFilename(path)
+        _, _, project_name = project_filename.rpartition("\\")
 
-    # TODO: implement.
+        solution_project = resources.VSSolutionProject(
+            project_name, project_filename, element.get("Id", "")
+        )
+
+        self._dependency_filenames[project_filename] = [
+            self._GetProjectFilename(dependency_element.get("Project", ""))
+            for dependency_element in element.iter("BuildDependency")
+        ]
+
+        return solution_project
+
+    def Close(self):
+        """Closes the file."""
+        super().Close()
+        self._events = None
+        self._parent_elements = []
+
+    def IterProjects(self):
+        """Iterates over the projects.
+
+        Dependencies are defined by path and a project is only yielded once
+        the projects it depends on have been read, so that its dependencies
+        are complete. Projects that depend on a project that is defined later
+        in the solution file are held back until then, and projects that
+        depend on a project that is not defined in the solution file are held
+        back until the end of the solution file.
+
+        Yields:
+          VSSolutionProject: project in preserved order.
+        """
+        solution_projects_by_filename = {}
+        dependent_projects_by_filename = {}
+        pending_projects = collections.deque()
+        unresolved_dependencies = {}
+
+        solution_project = self.ReadProject()
+
+        while solution_project:
+            project_filename = solution_project.filename
+            solution_projects_by_filename[project_filename] = solution_project
+            pending_projects.append(solution_project)
+
+            for dependent_project in dependent_projects_by_filename.pop(
+                project_filename, []
+            ):
+                if solution_project.guid:
+                    dependent_project.AddDependency(solution_project.guid)
+                unresolved_dependencies[id(dependent_project)] -= 1
+
+            number_of_unresolved_dependencies = 0
+            for dependency_filename in self._dependency_filenames.pop(
+                project_filename, []
+            ):
+                dependency_project = solution_projects_by_filename.get(
+                    dependency_filename, None
+                )
+                if not dependency_project:
+                    dependent_projects = dependent_projects_by_filename.setdefault(
+                        dependency_filename, []
+                    )
+                    dependent_projects.append(solution_project)
+                    number_of_unresolved_dependencies += 1
+
+                elif dependency_project.guid:
+                    solution_project.AddDependency(dependency_project.guid)
+
+            unresolved_dependencies[id(solution_project)] = (
+                number_of_unresolved_dependencies
+            )
+
+            while (
+                pending_projects
+                and not unresolved_dependencies[id(pending_projects[0])]
+            ):
+                pending_project = pending_projects.popleft()
+                del unresolved_dependencies[id(pending_project)]
+                yield pending_project
+
+            solution_project = self.ReadProject()
+
+        yield from pending_projects
+
+    def ReadConfigurations(self):
+        """Reads the configurations.
+
+        Returns:
+          VSConfigurations: configurations or None if not available.
+        """
+        # The configurations can be defined after the projects, hence any
+        # remaining projects are read first.
+        while self.ReadProject():
+            pass
+
+        if not self._configuration_names or not self._configuration_platforms:
+            return None
+
+        solution_configurations = resources.VSConfigurations()
+
+        for configuration_name in self._configuration_names:
+            for configuration_platform in self._configuration_platforms:
+                configuration = resources.VSSolutionConfiguration(
+                    name=configuration_name, platform=configuration_platform
+                )
+                solution_configurations.Append(configuration)
+
+        return solution_configurations
+
+    def ReadHeader(self):
+        """Reads a file header.
+
+        Returns:
+          bool: True if successful or false otherwise.
+        """
+        self._events = ElementTree.iterparse(self._file, events=("start", "end"))
+
+        try:
+            _, root_element = next(self._events)
+        except (ElementTree.ParseError, StopIteration):
+            self._events = None
+            return False
+
+        if root_element.tag != "Solution":
+            self._events = None
+            return False
+
+        self._parent_elements = [root_element]
+
+        return True
+
+    def ReadProject(self):
+        """Reads a project.
+
+        Returns:
+          VSSolutionProject: project if successful or None otherwise.
+        """
+        if not self._events:
+            return None
+
+        try:
+            for event, element in self._events:
+                if event == "start":
+                    self._parent_elements.append(element)
+                    continue
+
+                self._parent_elements.pop()
+                if not self._parent_elements:
+                    break
+
+                parent_element = self._parent_elements[-1]
+
+                # Elements that are part of a project are read together with
+                # the project element.
+                if parent_element.tag == "Project":
+                    continue
+
+                solution_project = None
+
+                if parent_element.tag == "Configurations":
+                    name = element.get("Name", None)
+                    if name and element.tag == "BuildType":
+                        self._configuration_names.append(name)
+                    elif name and element.tag == "Platform":
+                        self._configuration_platforms.append(name)
+
+                elif element.tag == "Project":
+                    solution_project = self._ReadProjectElement(element)
+
+                # Discard the element since it has been read.
+                parent_element.remove(element)
+
+                if solution_project:
+                    return solution_project
+
+        except ElementTree.ParseError:
+            pass
+
+        self._events = None
+
+        return None
+
+    def ReadProjects(self):
+        """Reads the projects.
+
+        Returns:
+          list[VSSolutionProject]: projects in preserved order.
+        """
+        return list(self.IterProjects())
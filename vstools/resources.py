@@ -61,6 +61,22 @@ class VSConfigurations:
 
         self._configurations[identifier] = configuration
 
+    def Copy(self):
+        """Copies the configurations.
+
+        Note that the configurations are shared with the copy, only the
+        collection of configurations is copied. This allows configurations to be
+        appended to the copy without affecting the original.
+
+        Returns:
+          VSConfigurations: copy of the configurations.
+        """
+        copy = self.__class__()
+        for configuration in self._configurations.values():
+            copy.Append(configuration)
+
+        return copy
+
     # pylint: disable=unused-argument
     def ExtendWithX64(self, output_version):
         """Extends the configurations with the x64 platform.
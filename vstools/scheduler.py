@@ -0,0 +1,244 @@
+"""Work scheduler classes."""
+
+import io
+import json
+import logging
+import os
+
+
+class CostModel:
+    """Cost model of conversion tasks.
+
+    The cost of a task is estimated from a heuristic cost, which is based on
+    the input size, number of files and number of configurations, and from
+    the recorded duration of previous runs of the same task. The durations
+    can be stored in a file such that the estimates improve on the next run.
+    """
+
+    # Version of the cost model file format, files with a different version
+    # are ignored.
+    _FORMAT_VERSION = 1
+
+    _MAXIMUM_NUMBER_OF_TASKS = 65536
+
+    def __init__(self, path=None, maximum_number_of_tasks=_MAXIMUM_NUMBER_OF_TASKS):
+        """Initializes a cost model.
+
+        Args:
+          path (Optional[str]): path of the cost model file, where None
+              represents that the durations are not stored.
+          maximum_number_of_tasks (Optional[int]): maximum number of tasks to
+              record the duration of, where the least recently recorded tasks
+              are removed first.
+        """
+        super().__init__()
+        self._maximum_number_of_tasks = maximum_number_of_tasks
+        self._path = path
+        # Scale of the recorded tasks, which is computed once until another
+        # duration is recorded.
+        self._scale = None
+        # Duration and heuristic cost per task key, in order of recording.
+        self._tasks = {}
+
+    def _GetScale(self):
+        """Retrieves the scale to convert a heuristic cost into a duration.
+
+        Returns:
+          float: average duration per heuristic cost of the recorded tasks or
+              1.0 if no durations were recorded.
+        """
+        if self._scale is None:
+            total_duration = sum(duration for duration, _ in self._tasks.values())
+            total_heuristic_cost = sum(
+                heuristic_cost for _, heuristic_cost in self._tasks.values()
+            )
+            if not total_duration or not total_heuristic_cost:
+                self._scale = 1.0
+            else:
+                self._scale = total_duration / total_heuristic_cost
+
+        return self._scale
+
+    def _IsValidTask(self, task):
+        """Determines if a task read from the cost model file is valid.
+
+        Args:
+          task (object): task read from the cost model file.
+
+        Returns:
+          bool: True if the task is a list of a key, a duration and a heuristic
+              cost.
+        """
+        if not isinstance(task, list) or len(task) != 3:
+            return False
+
+        key, duration, heuristic_cost = task
+        return (
+            isinstance(key, str)
+            and all(
+                isinstance(value, (int, float)) and not isinstance(value, bool)
+                for value in (duration, heuristic_cost)
+            )
+            and duration >= 0
+            and heuristic_cost >= 0
+        )
+
+    def AddDuration(self, key, heuristic_cost, duration):
+        """Records the duration of a task.
+
+        Args:
+          key (str): key of the task.
+          heuristic_cost (float): heuristic cost of the task.
+          duration (float): duration of the task in seconds.
+        """
+        previous_duration, _ = self._tasks.pop(key, (None, None))
+        if previous_duration is not None:
+            # Smooth out variations in duration between runs.
+            duration = (previous_duration + duration) / 2.0
+
+        self._scale = None
+        self._tasks[key] = (duration, heuristic_cost)
+
+        while len(self._tasks) > self._maximum_number_of_tasks:
+            del self._tasks[next(iter(self._tasks))]
+
+    def EstimateCost(self, key, heuristic_cost):
+        """Estimates the cost of a task.
+
+        Args:
+          key (str): key of the task.
+          heuristic_cost (float): heuristic cost of the task.
+
+        Returns:
+          float: estimated duration of the task in seconds.
+        """
+        duration, recorded_heuristic_cost = self._tasks.get(key, (None, None))
+        if duration is None:
+            return heuristic_cost * self._GetScale()
+
+        # Adjust the recorded duration for changes of the task since.
+        if recorded_heuristic_cost:
+            duration *= heuristic_cost / recorded_heuristic_cost
+
+        return duration
+
+    def GetDispatchOrder(self, task_costs):
+        """Retrieves the order to dispatch tasks in.
+
+        Tasks are dispatched longest processing time (LPT) first, such that a
+        costly task does not start last and stretch the total duration.
+
+        Args:
+          task_costs (list[float]): estimated cost per task.
+
+        Returns:
+          list[int]: indexes of the tasks in dispatch order.
+        """
+        return sorted(
+            range(len(task_costs)), key=lambda index: task_costs[index], reverse=True
+        )
+
+    def GetHeuristicCost(
+        self,
+        input_size=0,
+        number_of_files=0,
+        number_of_configurations=1,
+        number_of_outputs=1,
+    ):
+        """Retrieves the heuristic cost of a task.
+
+        Args:
+          input_size (Optional[int]): size of the input in bytes.
+          number_of_files (Optional[int]): number of source, header and resource
+              files.
+          number_of_configurations (Optional[int]): number of configurations.
+          number_of_outputs (Optional[int]): number of output files.
+
+        Returns:
+          float: heuristic cost.
+        """
+        return (
+            (1.0 + (input_size / 1024.0) + number_of_files)
+            * max(number_of_configurations, 1)
+            * max(number_of_outputs, 1)
+        )
+
+    def Read(self):
+        """Reads the recorded durations from the cost model file."""
+        if not self._path:
+            return
+
+        try:
+            with io.open(self._path, "r", encoding="utf8") as file_object:
+                cost_model = json.load(file_object)
+
+        except FileNotFoundError:
+            return
+
+        except (OSError, ValueError) as exception:
+            logging.warning(
+                f"Unable to read cost model: {self._path:s} with error: "
+                f"{exception!s}"
+            )
+            return
+
+        if not isinstance(cost_model, dict):
+            return
+
+        if cost_model.get("format_version", None) != self._FORMAT_VERSION:
+            return
+
+        tasks = cost_model.get("tasks", [])
+        if not isinstance(tasks, list):
+            logging.warning(
+                f"Unable to read cost model: {self._path:s} with error: invalid "
+                f"tasks."
+            )
+            return
+
+        number_of_invalid_tasks = 0
+
+        self._scale = None
+        for task in tasks:
+            if not self._IsValidTask(task):
+                number_of_invalid_tasks += 1
+                continue
+
+            key, duration, heuristic_cost = task
+            self._tasks[key] = (duration, heuristic_cost)
+
+        if number_of_invalid_tasks:
+            logging.warning(
+                f"Ignored {number_of_invalid_tasks:d} invalid tasks in cost model: "
+                f"{self._path:s}"
+            )
+
+    def Write(self):
+        """Writes the recorded durations to the cost model file."""
+        if not self._path:
+            return
+
+        cost_model = {
+            "format_version": self._FORMAT_VERSION,
+            "tasks": [
+                [key, duration, heuristic_cost]
+                for key, (duration, heuristic_cost) in self._tasks.items()
+            ],
+        }
+        data = json.dumps(cost_model).encode("utf8")
+
+        temporary_path = f"{self._path:s}.{os.getpid():d}.tmp"
+
+        try:
+            os.makedirs(os.path.dirname(self._path) or os.curdir, exist_ok=True)
+
+            with io.open(temporary_path, "wb") as file_object:
+                file_object.write(data)
+
+            os.replace(temporary_path, self._path)
+
+        except OSError as exception:
+            logging.warning(
+                f"Unable to write cost model: {self._path:s} with error: "
+                f"{exception!s}"
+            )
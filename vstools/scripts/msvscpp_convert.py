@@ -5,6 +5,14 @@
 Currently supported input formats:
 * libyal source directory (configure.ac and Makefile.am)
 * 2008 (9.0)
+* 2010 (10.0)
+* 2012 (11.0)
+* 2013 (12.0)
+* 2015 (14.0)
+* 2017 (15.0)
+* 2019 (16.0)
+* 2022 (17.0)
+* 2026 (18.0)
 
 Currently supported output formats:
 * 2008 (9.0)
@@ -19,22 +27,59 @@ Currently supported output formats:
 """
 
 # TODO: add automated tests.
-# TODO: add vs2010 reader.
-# TODO: add vs2012 reader.
-# TODO: add vs2013 reader.
-# TODO: add vs2015 reader.
-# TODO: add vs2017 reader.
-# TODO: add vs2019 reader.
-# TODO: add vs2022 reader.
-# TODO: add vs2026 reader.
 
 import argparse
+import glob
 import logging
 import os
+import signal
+import socket
 import sys
+import time
+import uuid
 
+from vstools import batch
 from vstools import libyal
-from vstools import solutions
+from vstools import scheduler
+from vstools import server
+
+
+def PrintBatchSummary(batch_results, project_memo, duration):
+    """Prints a summary of a batch conversion.
+
+    Args:
+      batch_results (list[BatchConversionResult]): results per input.
+      project_memo (ProjectMemo): memo of library and third party projects.
+      duration (float): duration of the batch conversion in seconds.
+    """
+    column_width = max(
+        [len("Input")]
+        + [len(batch_result.input_path) for batch_result in batch_results]
+    )
+
+    print("")
+    print(f"{'Input':<{column_width:d}s}  Status  Time (s)")
+    for batch_result in batch_results:
+        status = "OK" if batch_result.result else "FAILED"
+        print(
+            f"{batch_result.input_path:<{column_width:d}s}  {status:<6s}  "
+            f"{batch_result.duration:8.2f}"
+        )
+
+    number_of_converted = sum(
+        1 for batch_result in batch_results if batch_result.result
+    )
+    print("")
+    print(
+        f"Converted {number_of_converted:d} of {len(batch_results):d} inputs "
+        f"in {duration:.2f} seconds."
+    )
+    print(
+        f"Project memo hit rate: {project_memo.hit_rate:.1%} "
+        f"({project_memo.number_of_hits:d} of "
+        f"{project_memo.number_of_lookups:d} lookups)."
+    )
+    print("")
 
 
 def Main():
@@ -54,14 +99,51 @@ def Main():
         )
     )
     argument_parser.add_argument(
-        "solution_file",
-        nargs="?",
+        "solution_files",
+        nargs="*",
         action="store",
         metavar="FILENAME",
-        default=None,
+        default=[],
         help=(
             "location of the source directory or the Visual Studio solution "
-            "file (.sln)."
+            "file (.sln or .slnx). Multiple locations can be specified to "
+            "convert them in batch, where the output of a source directory is "
+            "written in the source directory and the output of a solution file "
+            "in the parent directory of the directory that contains it."
+        ),
+    )
+    argument_parser.add_argument(
+        "--cache_directory",
+        "--cache-directory",
+        dest="cache_directory",
+        action="store",
+        metavar="PATH",
+        default=None,
+        help=(
+            "location of the directory to cache read Makefile.am files, where "
+            "the default is $XDG_CACHE_HOME/vstools or ~/.cache/vstools."
+        ),
+    )
+    argument_parser.add_argument(
+        "--client",
+        dest="client",
+        action="store_true",
+        default=False,
+        help=(
+            "convert on a server started with --serve instead of in this "
+            "process, where the number of jobs and the caches of the server "
+            "are used."
+        ),
+    )
+    argument_parser.add_argument(
+        "--deterministic_guids",
+        "--deterministic-guids",
+        dest="deterministic_guids",
+        action="store_true",
+        default=False,
+        help=(
+            "derive the GUIDs of new projects from the solution and project "
+            "name instead of generating random GUIDs."
         ),
     )
     argument_parser.add_argument(
@@ -72,6 +154,60 @@ def Main():
         default=False,
         help=("extend the solution with configurations for the x64 patform."),
     )
+    argument_parser.add_argument(
+        "--guid_namespace",
+        "--guid-namespace",
+        dest="guid_namespace",
+        action="store",
+        metavar="GUID",
+        default=None,
+        help=(
+            "namespace to derive the GUIDs of new projects from, implies "
+            "--deterministic_guids."
+        ),
+    )
+    argument_parser.add_argument(
+        "--input_glob",
+        "--input-glob",
+        dest="input_globs",
+        action="append",
+        metavar="PATTERN",
+        default=[],
+        help=(
+            "glob pattern of source directories or solution files to convert "
+            "in batch, can be specified multiple times."
+        ),
+    )
+    argument_parser.add_argument(
+        "--input_list",
+        "--input-list",
+        dest="input_list",
+        action="store",
+        metavar="PATH",
+        default=None,
+        help=(
+            "location of a file with the source directories or solution files "
+            "to convert in batch, one per line."
+        ),
+    )
+    argument_parser.add_argument(
+        "-j",
+        "--jobs",
+        dest="jobs",
+        type=int,
+        action="store",
+        metavar="JOBS",
+        default=1,
+        help="number of projects to convert at the same time.",
+    )
+    argument_parser.add_argument(
+        "--no_cache",
+        "--no-cache",
+        dest="use_cache",
+        action="store_false",
+        default=True,
+        help="do not cache read Makefile.am files.",
+    )
     argument_parser.add_argument(
         "--no_python_dll",
         "--no-python-dll",
@@ -89,11 +225,13 @@ def Main():
         "--to",
         dest="output_format",
         nargs="?",
-        choices=sorted(output_formats),
         action="store",
         metavar="FORMAT",
         default="2010",
-        help="output format.",
+        help=(
+            "output format, multiple output formats can be specified as a comma "
+            'separated list or "all" for all supported output formats.'
+        ),
     )
     argument_parser.add_argument(
         "--python_path",
@@ -105,6 +243,57 @@ def Main():
         default="C:\\Python310",
         help="location of the Python installation.",
     )
+    argument_parser.add_argument(
+        "--serve",
+        dest="serve",
+        action="store_true",
+        default=False,
+        help=(
+            "serve conversion requests of clients, keeping the read Makefile.am "
+            "files, projects and process pool between requests."
+        ),
+    )
+    argument_parser.add_argument(
+        "--socket",
+        dest="socket_path",
+        action="store",
+        metavar="PATH",
+        default=None,
+        help=(
+            "location of the Unix socket of the server, where the default is "
+            "$XDG_RUNTIME_DIR/vstools.socket or vstools.socket in the cache "
+            "directory."
+        ),
+    )
+    argument_parser.add_argument(
+        "--stop_server",
+        "--stop-server",
+        dest="stop_server",
+        action="store_true",
+        default=False,
+        help="request the server to shut down.",
+    )
+    argument_parser.add_argument(
+        "--watch",
+        dest="watch",
+        action="store_true",
+        default=False,
+        help=(
+            "keep converting when the inputs change, where only changed "
+            "Makefile.am files are read again and only changed output files "
+            "are written."
+        ),
+    )
+    argument_parser.add_argument(
+        "--watch_interval",
+        "--watch-interval",
+        dest="watch_interval",
+        type=float,
+        action="store",
+        metavar="SECONDS",
+        default=1.0,
+        help="number of seconds between checks for changes in watch mode.",
+    )
     argument_parser.add_argument(
         "--with_dokany",
         "--with-dokany",
@@ -113,39 +302,250 @@ def Main():
         default=False,
         help="use DokanY instead of Dokan.",
     )
-    options = argument_parser.parse_args()
+    options = argument_parser.parse_intermixed_args()
+
+    input_paths = list(options.solution_files)
+
+    if options.input_list:
+        try:
+            with open(options.input_list, "r", encoding="utf8") as file_object:
+                for line in file_object:
+                    line = line.strip()
+                    if line and not line.startswith("#"):
+                        input_paths.append(line)
+
+        except OSError as exception:
+            print(f"Unable to read input list with error: {exception!s}.")
+            print("")
+            return 1
 
-    if not options.solution_file:
+    for input_glob in options.input_globs:
+        input_paths.extend(sorted(glob.glob(input_glob)))
+
+    server_mode = options.serve or options.stop_server
+    if options.watch and (options.client or server_mode):
+        print("Unable to watch in client or server mode.")
+        print("")
+        return 1
+
+    if options.watch_interval <= 0.0:
+        print(f"Unsupported watch interval: {options.watch_interval!s}.")
+        print("")
+        return 1
+
+    if server_mode and (options.client or input_paths):
+        print("Unable to serve or stop the server and convert at the same time.")
+        print("")
+        return 1
+
+    if (options.client or server_mode) and not hasattr(socket, "AF_UNIX"):
+        print("Unix sockets are not supported on this platform.")
+        print("")
+        return 1
+
+    if not input_paths and not server_mode:
         print("Solution file missing.")
         print("")
         argument_parser.print_help()
         print("")
         return 1
 
-    if options.output_format not in output_formats:
-        print(f"Unsupported output format: {options.format_to:s}.")
+    batch_mode = bool(len(input_paths) > 1 or options.input_list or options.input_globs)
+
+    if options.output_format == "all":
+        output_versions = sorted(output_formats)
+    else:
+        output_versions = []
+        for output_version in options.output_format.split(","):
+            output_version = output_version.strip()
+            if output_version not in output_formats:
+                print(f"Unsupported output format: {output_version:s}.")
+                print("")
+                return 1
+
+            if output_version not in output_versions:
+                output_versions.append(output_version)
+
+    if options.jobs < 1:
+        print(f"Unsupported number of jobs: {options.jobs:d}.")
         print("")
         return 1
 
+    guid_namespace = None
+    if options.guid_namespace:
+        try:
+            guid_namespace = uuid.UUID(options.guid_namespace)
+        except ValueError:
+            print(f"Unsupported GUID namespace: {options.guid_namespace:s}.")
+            print("")
+            return 1
+
+    elif options.deterministic_guids:
+        guid_namespace = libyal.LibyalSourceVSSolution.DEFAULT_GUID_NAMESPACE
+
     logging.basicConfig(level=logging.INFO, format="[%(levelname)s] %(message)s")
 
-    if os.path.isdir(options.solution_file):
-        input_solution = libyal.LibyalSourceVSSolution(
-            extend_with_x64=options.extend_with_x64,
-            generate_python_dll=options.generate_python_dll,
-            python_path=options.python_path,
-            with_dokany=options.with_dokany,
+    cache_directory = options.cache_directory
+    if not cache_directory:
+        cache_directory = os.path.join(
+            os.environ.get("XDG_CACHE_HOME", None)
+            or os.path.join(os.path.expanduser("~"), ".cache"),
+            "vstools",
         )
-    else:
-        input_solution = solutions.VSSolution(
-            extend_with_x64=options.extend_with_x64,
-            generate_python_dll=options.generate_python_dll,
-            python_path=options.python_path,
-            with_dokany=options.with_dokany,
+
+    socket_path = options.socket_path
+    if not socket_path:
+        socket_path = os.path.join(
+            os.environ.get("XDG_RUNTIME_DIR", None) or cache_directory,
+            "vstools.socket",
         )
 
-    if not input_solution.Convert(options.solution_file, options.output_format):
-        print("Unable to convert Visual Studio solution file.")
+    if options.stop_server:
+        try:
+            server.ConversionClient(socket_path).Shutdown()
+        except (OSError, RuntimeError) as exception:
+            print(f"Unable to stop server with error: {exception!s}.")
+            return 1
+
+        return 0
+
+    # Remove duplicate inputs while preserving the order of the inputs.
+    unique_input_paths = {}
+    for input_path in input_paths:
+        unique_input_paths.setdefault(os.path.abspath(input_path), input_path)
+
+    if options.client:
+        start_time = time.perf_counter()
+
+        try:
+            batch_results, project_memo = server.ConversionClient(socket_path).Convert(
+                list(unique_input_paths.values()),
+                output_versions,
+                extend_with_x64=options.extend_with_x64,
+                generate_python_dll=options.generate_python_dll,
+                python_path=options.python_path,
+                with_dokany=options.with_dokany,
+                guid_namespace=guid_namespace,
+                working_directory=None if batch_mode else os.getcwd(),
+            )
+        except (OSError, RuntimeError) as exception:
+            print(f"Unable to convert on server with error: {exception!s}.")
+            return 1
+
+        if batch_mode:
+            PrintBatchSummary(
+                batch_results, project_memo, time.perf_counter() - start_time
+            )
+
+        elif not batch_results[0].result:
+            print("Unable to convert Visual Studio solution file.")
+
+        if not all(batch_result.result for batch_result in batch_results):
+            return 1
+
+        return 0
+
+    cost_model_path = None
+    makefile_am_cache = None
+    if options.use_cache:
+        makefile_am_cache = libyal.MakefileAmCache(cache_directory)
+
+        # The durations of the parallel tasks are stored in a subdirectory,
+        # which is not managed by the Makefile.am cache.
+        cost_model_path = os.path.join(cache_directory, "costs", "tasks.json")
+
+    # The cost model is only used to schedule parallel tasks.
+    cost_model = scheduler.CostModel(path=cost_model_path)
+    if options.jobs > 1:
+        cost_model.Read()
+
+    if options.serve:
+        conversion_server = server.ConversionServer(
+            socket_path,
+            jobs=options.jobs,
+            cost_model=cost_model,
+            makefile_am_cache=makefile_am_cache,
+        )
+
+        # Exit on SIGTERM such that the Unix socket is removed.
+        signal.signal(signal.SIGTERM, lambda signal_number, frame: sys.exit(0))
+
+        try:
+            os.makedirs(os.path.dirname(socket_path) or os.curdir, exist_ok=True)
+            conversion_server.Serve()
+
+        except (OSError, RuntimeError) as exception:
+            print(f"Unable to serve with error: {exception!s}.")
+            return 1
+
+        except KeyboardInterrupt:
+            pass
+
+        return 0
+
+    conversion_options = batch.ConversionOptions()
+    conversion_options.extend_with_x64 = options.extend_with_x64
+    conversion_options.generate_python_dll = options.generate_python_dll
+    conversion_options.guid_namespace = guid_namespace
+    conversion_options.python_path = options.python_path
+    conversion_options.with_dokany = options.with_dokany
+
+    batch_converter = batch.BatchConverter(
+        output_versions,
+        conversion_options=conversion_options,
+        jobs=options.jobs,
+        cost_model=cost_model,
+        makefile_am_cache=makefile_am_cache,
+    )
+    batch_converter.Open()
+
+    try:
+        if options.watch:
+            logging.info("Watching for changes, press Ctrl+C to stop.")
+
+            try:
+                for batch_result in batch_converter.WatchInputs(
+                    list(unique_input_paths.values()),
+                    working_directory=None if batch_mode else os.getcwd(),
+                    interval=options.watch_interval,
+                ):
+                    if batch_result.result:
+                        logging.info(
+                            f"Converted: {batch_result.input_path:s} in "
+                            f"{batch_result.duration:.2f} seconds."
+                        )
+
+            except KeyboardInterrupt:
+                pass
+
+            return 0
+
+        if not batch_mode:
+            if not batch_converter.ConvertInput(
+                input_paths[0], working_directory=os.getcwd()
+            ):
+                print("Unable to convert Visual Studio solution file.")
+                return 1
+
+            return 0
+
+        start_time = time.perf_counter()
+
+        batch_results = list(
+            batch_converter.ConvertInputs(list(unique_input_paths.values()))
+        )
+
+    finally:
+        batch_converter.Close()
+
+        if options.jobs > 1:
+            cost_model.Write()
+
+    PrintBatchSummary(
+        batch_results, batch_converter.project_memo, time.perf_counter() - start_time
+    )
+
+    if not all(batch_result.result for batch_result in batch_results):
         return 1
 
     return 0
@@ -0,0 +1,422 @@
+"""Conversion server and client classes."""
+
+import concurrent.futures
+import json
+import logging
+import os
+import socket
+import socketserver
+import uuid
+
+from vstools import batch
+from vstools import libyal
+from vstools import scheduler
+from vstools import solutions
+
+
+class _ConversionRequestHandler(socketserver.StreamRequestHandler):
+    """Conversion request handler."""
+
+    def handle(self):
+        """Handles a request."""
+        request_data = self.rfile.readline(ConversionServer.MAXIMUM_REQUEST_SIZE)
+        response_data = self.server.conversion_server.HandleRequest(request_data)
+        self.wfile.write(response_data)
+
+
+class ConversionServer:
+    """Conversion server.
+
+    The server converts source directories and solution files on request of
+    clients that connect to a Unix socket. A request and its response are a
+    single line of JSON. The requests are handled one at a time, since a
+    conversion changes the working directory of the process.
+
+    The process pool, Makefile.am cache, project memo and cost model are kept
+    between requests, as are the solutions with the Makefile.am files and the
+    project GUIDs they have read and the solution and project files they have
+    parsed. The project files parsed by worker processes are not kept.
+    """
+
+    MAXIMUM_REQUEST_SIZE = 16 * 1024 * 1024
+
+    # Maximum number of batch converters, with different options, to keep.
+    _MAXIMUM_NUMBER_OF_BATCH_CONVERTERS = 8
+
+    def __init__(self, socket_path, jobs=1, cost_model=None, makefile_am_cache=None):
+        """Initializes a conversion server.
+
+        Args:
+          socket_path (str): path of the Unix socket.
+          jobs (Optional[int]): maximum number of projects to convert at the
+              same time.
+          cost_model (Optional[CostModel]): cost model to schedule parallel
+              tasks with, where None represents a cost model without recorded
+              durations.
+          makefile_am_cache (Optional[MakefileAmCache]): cache of read
+              Makefile.am files, where None represents no cache.
+        """
+        super().__init__()
+        self._batch_converters = {}
+        self._cost_model = cost_model or scheduler.CostModel()
+        self._executor = None
+        self._jobs = jobs
+        self._makefile_am_cache = makefile_am_cache
+        self._project_memo = libyal.ProjectMemo()
+        self._shutdown_requested = False
+        self._socket_path = socket_path
+
+    def _Convert(self, request):
+        """Handles a convert request.
+
+        Args:
+          request (dict[str, object]): request.
+
+        Returns:
+          dict[str, object]: response.
+
+        Raises:
+          ValueError: if the request is invalid.
+        """
+        input_paths = request.get("input_paths", None)
+        output_versions = request.get("output_versions", None)
+        options = request.get("options", None) or {}
+        working_directory = request.get("working_directory", None)
+
+        if not isinstance(input_paths, list) or not all(
+            isinstance(input_path, str) and os.path.isabs(input_path)
+            for input_path in input_paths
+        ):
+            raise ValueError("Invalid input paths.")
+
+        if not isinstance(output_versions, list) or not output_versions:
+            raise ValueError("Invalid output versions.")
+
+        if working_directory is not None and not os.path.isabs(working_directory):
+            raise ValueError("Invalid working directory.")
+
+        batch_converter = self._GetBatchConverter(output_versions, options)
+
+        number_of_hits = self._project_memo.number_of_hits
+        number_of_lookups = self._project_memo.number_of_lookups
+
+        batch_results = list(
+            batch_converter.ConvertInputs(
+                input_paths, working_directory=working_directory
+            )
+        )
+
+        if self._jobs > 1:
+            self._cost_model.Write()
+
+        return {
+            "number_of_memo_hits": self._project_memo.number_of_hits - number_of_hits,
+            "number_of_memo_lookups": (
+                self._project_memo.number_of_lookups - number_of_lookups
+            ),
+            "results": [
+                {
+                    "duration": batch_result.duration,
+                    "error": batch_result.error,
+                    "input_path": batch_result.input_path,
+                    "result": batch_result.result,
+                }
+                for batch_result in batch_results
+            ],
+        }
+
+    def _GetBatchConverter(self, output_versions, options):
+        """Retrieves a batch converter for specific options.
+
+        Args:
+          output_versions (list[str]): output Visual Studio versions.
+          options (dict[str, object]): conversion options.
+
+        Returns:
+          BatchConverter: batch converter.
+
+        Raises:
+          ValueError: if the options are invalid.
+        """
+        guid_namespace = options.get("guid_namespace", None)
+        if guid_namespace:
+            guid_namespace = uuid.UUID(guid_namespace)
+
+        key = (
+            tuple(output_versions),
+            bool(options.get("extend_with_x64", True)),
+            bool(options.get("generate_python_dll", True)),
+            str(options.get("python_path", "C:\\Python314")),
+            bool(options.get("with_dokany", False)),
+            guid_namespace,
+        )
+
+        batch_converter = self._batch_converters.pop(key, None)
+        if not batch_converter:
+            conversion_options = batch.ConversionOptions()
+            conversion_options.extend_with_x64 = key[1]
+            conversion_options.generate_python_dll = key[2]
+            conversion_options.guid_namespace = guid_namespace
+            conversion_options.python_path = key[3]
+            conversion_options.with_dokany = key[4]
+
+            batch_converter = batch.BatchConverter(
+                list(output_versions),
+                conversion_options=conversion_options,
+                jobs=self._jobs,
+                cost_model=self._cost_model,
+                executor=self._executor,
+                makefile_am_cache=self._makefile_am_cache,
+                project_memo=self._project_memo,
+            )
+            batch_converter.Open()
+
+        # Re-add the batch converter to mark it as most recently used.
+        self._batch_converters[key] = batch_converter
+
+        while len(self._batch_converters) > self._MAXIMUM_NUMBER_OF_BATCH_CONVERTERS:
+            least_recently_used_key = next(iter(self._batch_converters))
+            self._batch_converters.pop(least_recently_used_key).Close()
+
+        return batch_converter
+
+    def HandleRequest(self, request_data):
+        """Handles a request.
+
+        Log messages emitted while handling the request are returned to the
+        client instead of being logged by the server.
+
+        Args:
+          request_data (bytes): request, which is a line of JSON.
+
+        Returns:
+          bytes: response, which is a line of JSON.
+        """
+        log_handler = solutions.LogMessagesCollector()
+
+        root_logger = logging.getLogger()
+        original_handlers = list(root_logger.handlers)
+        original_level = root_logger.level
+
+        root_logger.handlers = [log_handler]
+
+        try:
+            request = json.loads(request_data)
+            if not isinstance(request, dict):
+                raise ValueError("Invalid request.")
+
+            log_level = request.get("log_level", logging.INFO)
+            if isinstance(log_level, int):
+                root_logger.setLevel(log_level)
+
+            command = request.get("command", None)
+            if command == "convert":
+                response = self._Convert(request)
+
+            elif command == "shutdown":
+                self._shutdown_requested = True
+                response = {}
+
+            else:
+                raise ValueError("Unsupported command.")
+
+        # A failing request should not stop the server.
+        except Exception as exception:  # pylint: disable=broad-except
+            response = {"error": f"{exception!s}"}
+
+        finally:
+            root_logger.handlers = original_handlers
+            root_logger.setLevel(original_level)
+
+        response["log_messages"] = log_handler.messages
+
+        return json.dumps(response).encode("utf8") + b"\n"
+
+    def Serve(self):
+        """Serves requests until a shutdown is requested.
+
+        Raises:
+          RuntimeError: if another server is using the Unix socket.
+        """
+        if os.path.exists(self._socket_path):
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client_socket:
+                try:
+                    client_socket.connect(self._socket_path)
+                except OSError:
+                    # Remove the Unix socket of a server that did not shut down.
+                    os.remove(self._socket_path)
+                else:
+                    raise RuntimeError(
+                        f"Server already running on: {self._socket_path:s}"
+                    )
+
+        if self._jobs > 1:
+            self._executor = concurrent.futures.ProcessPoolExecutor(
+                max_workers=self._jobs
+            )
+
+        self._shutdown_requested = False
+
+        # Only allow the owner to connect to the Unix socket.
+        original_umask = os.umask(0o177)
+        try:
+            unix_stream_server = socketserver.UnixStreamServer(
+                self._socket_path, _ConversionRequestHandler
+            )
+        finally:
+            os.umask(original_umask)
+
+        unix_stream_server.conversion_server = self
+
+        logging.info(f"Serving on: {self._socket_path:s}")
+
+        try:
+            while not self._shutdown_requested:
+                unix_stream_server.handle_request()
+
+        finally:
+            unix_stream_server.server_close()
+            os.remove(self._socket_path)
+
+            for batch_converter in self._batch_converters.values():
+                batch_converter.Close()
+
+            self._batch_converters = {}
+
+            if self._executor:
+                self._executor.shutdown()
+                self._executor = None
+
+            if self._jobs > 1:
+                self._cost_model.Write()
+
+
+class ConversionClient:
+    """Conversion client."""
+
+    def __init__(self, socket_path):
+        """Initializes a conversion client.
+
+        Args:
+          socket_path (str): path of the Unix socket of the server.
+        """
+        super().__init__()
+        self._socket_path = socket_path
+
+    def _SendRequest(self, request):
+        """Sends a request to the server.
+
+        Args:
+          request (dict[str, object]): request.
+
+        Returns:
+          dict[str, object]: response.
+
+        Raises:
+          OSError: if the server cannot be reached.
+          RuntimeError: if the server was unable to handle the request.
+        """
+        request_data = json.dumps(request).encode("utf8") + b"\n"
+
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client_socket:
+            client_socket.connect(self._socket_path)
+            client_socket.sendall(request_data)
+
+            with client_socket.makefile("rb") as file_object:
+                response_data = file_object.readline()
+
+        try:
+            response = json.loads(response_data)
+        except ValueError as exception:
+            raise RuntimeError("Invalid response.") from exception
+
+        for level, message in response.get("log_messages", []):
+            logging.log(level, message)
+
+        error = response.get("error", None)
+        if error:
+            raise RuntimeError(error)
+
+        return response
+
+    def Convert(
+        self,
+        input_paths,
+        output_versions,
+        extend_with_x64=True,
+        generate_python_dll=True,
+        python_path="C:\\Python314",
+        with_dokany=False,
+        guid_namespace=None,
+        working_directory=None,
+    ):
+        """Converts source directories and solution files on the server.
+
+        Log messages emitted by the server while converting are logged by the
+        client.
+
+        Args:
+          input_paths (list[str]): paths of the source directories or solution
+              files.
+          output_versions (list[str]): output Visual Studio versions.
+          extend_with_x64 (Optional[bool]): True if the solution should be
+              extended with configuration for the x64 platform.
+          generate_python_dll (Optional[bool]): True if a Python module DLL
+              should be generated.
+          python_path (Optional[str]): path to the Python installation.
+          with_dokany (Optional[bool]): True if DokanY should be used instead
+              of Dokan.
+          guid_namespace (Optional[uuid.UUID]): namespace to derive the GUIDs
+              of new projects from, where None represents random GUIDs.
+          working_directory (Optional[str]): directory to write the output in,
+              where None represents the directory derived from each input path.
+
+        Returns:
+          tuple[list[BatchConversionResult], ProjectMemo]: result per input
+              and project memo with the number of lookups of the conversions.
+
+        Raises:
+          OSError: if the server cannot be reached.
+          RuntimeError: if the server was unable to handle the request.
+        """
+        if working_directory:
+            working_directory = os.path.abspath(working_directory)
+
+        request = {
+            "command": "convert",
+            "input_paths": [os.path.abspath(input_path) for input_path in input_paths],
+            "log_level": logging.getLogger().getEffectiveLevel(),
+            "options": {
+                "extend_with_x64": extend_with_x64,
+                "generate_python_dll": generate_python_dll,
+                "guid_namespace": str(guid_namespace) if guid_namespace else None,
+                "python_path": python_path,
+                "with_dokany": with_dokany,
+            },
+            "output_versions": output_versions,
+            "working_directory": working_directory,
+        }
+        response = self._SendRequest(request)
+
+        batch_results = []
+        for result in response.get("results", []):
+            batch_result = batch.BatchConversionResult(result["input_path"])
+            batch_result.duration = result["duration"]
+            batch_result.error = result["error"]
+            batch_result.result = result["result"]
+            batch_results.append(batch_result)
+
+        project_memo = libyal.ProjectMemo()
+        project_memo.number_of_hits = response.get("number_of_memo_hits", 0)
+        project_memo.number_of_lookups = response.get("number_of_memo_lookups", 0)
+
+        return batch_results, project_memo
+
+    def Shutdown(self):
+        """Requests the server to shut down.
+
+        Raises:
+          OSError: if the server cannot be reached.
+          RuntimeError: if the server was unable to handle the request.
+        """
+        self._SendRequest({"command": "shutdown"})
@@ -1,61 +1,126 @@
 """Solution classes."""
 
+import asyncio
+import concurrent.futures
+import contextlib
+import copy
+import hashlib
+import io
 import logging
 import os
+import re
+import time
 
+from vstools import filesystem
+from vstools import pipeline
 from vstools import readers
+from vstools import scheduler
 from vstools import writers
 
 
+class LogMessagesCollector(logging.Handler):
+    """Log handler that collects log messages.
+
+    Attributes:
+      messages (list[tuple[int, str]]): log level and message of the collected
+          log messages.
+    """
+
+    def __init__(self):
+        """Initializes a log handler that collects log messages."""
+        super().__init__()
+        self.messages = []
+
+    def emit(self, record):
+        """Collects a log record.
+
+        Args:
+          record (logging.LogRecord): log record.
+        """
+        self.messages.append((record.levelno, record.getMessage()))
+
+
 class VSSolution:
     """Visual Studio solution."""
 
-    _PROJECT_FILE_READERS = {
-        "2008": readers.VS2008ProjectFileReader(),
-        "2010": readers.VS2010ProjectFileReader(),
-        "2012": readers.VS2012ProjectFileReader(),
-        "2013": readers.VS2013ProjectFileReader(),
-        "2015": readers.VS2015ProjectFileReader(),
-        "2017": readers.VS2017ProjectFileReader(),
-        "2019": readers.VS2019ProjectFileReader(),
-        "2022": readers.VS2022ProjectFileReader(),
-        "2026": readers.VS2026ProjectFileReader(),
+    # Readers and writers maintain the state of the file they are reading or
+    # writing, hence they are instantiated per use so that conversions can be
+    # run concurrently.
+    _PROJECT_FILE_READER_CLASSES = {
+        "2008": readers.VS2008ProjectFileReader,
+        "2010": readers.VS2010ProjectFileReader,
+        "2012": readers.VS2012ProjectFileReader,
+        "2013": readers.VS2013ProjectFileReader,
+        "2015": readers.VS2015ProjectFileReader,
+        "2017": readers.VS2017ProjectFileReader,
+        "2019": readers.VS2019ProjectFileReader,
+        "2022": readers.VS2022ProjectFileReader,
+        "2026": readers.VS2026ProjectFileReader,
     }
 
-    _PROJECT_FILE_WRITERS = {
-        "2008": writers.VS2008ProjectFileWriter(),
-        "2010": writers.VS2010ProjectFileWriter(),
-        "2012": writers.VS2012ProjectFileWriter(),
-        "2013": writers.VS2013ProjectFileWriter(),
-        "2015": writers.VS2015ProjectFileWriter(),
-        "2017": writers.VS2017ProjectFileWriter(),
-        "2019": writers.VS2019ProjectFileWriter(),
-        "2022": writers.VS2022ProjectFileWriter(),
-        "2026": writers.VS2026ProjectFileWriter(),
+    _PROJECT_FILE_WRITER_CLASSES = {
+        "2008": writers.VS2008ProjectFileWriter,
+        "2010": writers.VS2010ProjectFileWriter,
+        "2012": writers.VS2012ProjectFileWriter,
+        "2013": writers.VS2013ProjectFileWriter,
+        "2015": writers.VS2015ProjectFileWriter,
+        "2017": writers.VS2017ProjectFileWriter,
+        "2019": writers.VS2019ProjectFileWriter,
+        "2022": writers.VS2022ProjectFileWriter,
+        "2026": writers.VS2026ProjectFileWriter,
     }
 
-    _SOLUTION_FILE_READERS = {
-        "2008": readers.VS2008SolutionFileReader(),
-        "2010": readers.VS2010SolutionFileReader(),
-        "2012": readers.VS2012SolutionFileReader(),
-        "2013": readers.VS2013SolutionFileReader(),
-        "2015": readers.VS2015SolutionFileReader(),
-        "2017": readers.VS2017SolutionFileReader(),
-        "2019": readers.VS2019SolutionFileReader(),
-        "2022": readers.VS2022SolutionFileReader(),
-        "2026": readers.VS2026SolutionFileReader(),
+    _SOLUTION_FILE_READER_CLASSES = {
+        "2008": readers.VS2008SolutionFileReader,
+        "2010": readers.VS2010SolutionFileReader,
+        "2012": readers.VS2012SolutionFileReader,
+        "2013": readers.VS2013SolutionFileReader,
+        "2015": readers.VS2015SolutionFileReader,
+        "2017": readers.VS2017SolutionFileReader,
+        "2019": readers.VS2019SolutionFileReader,
+        "2022": readers.VS2022SolutionFileReader,
+        "2026": readers.VS2026SolutionFileReader,
+    }
+
+    _SOLUTION_FILE_WRITER_CLASSES = {
+        "2008": writers.VS2008SolutionFileWriter,
+        "2010": writers.VS2010SolutionFileWriter,
+        "2012": writers.VS2012SolutionFileWriter,
+        "2013": writers.VS2013SolutionFileWriter,
+        "2015": writers.VS2015SolutionFileWriter,
+        "2017": writers.VS2017SolutionFileWriter,
+        "2019": writers.VS2019SolutionFileWriter,
+        "2022": writers.VS2022SolutionFileWriter,
+        "2026": writers.VS2026SolutionFileWriter,
+    }
+
+    # Number of bytes at the start of a file used to detect its version.
+    _FILE_HEADER_SIZE = 512
+
+    # Maximum number of parsed solution and project files kept in memory.
+    _MAXIMUM_NUMBER_OF_PARSED_FILES = 1024
+
+    _FORMAT_VERSION_RE = re.compile(rb"Format Version ([0-9]+[.][0-9]+)")
+
+    _TOOLS_VERSION_RE = re.compile(rb'<Project [^>]*ToolsVersion="([^"]*)"')
+
+    _VISUAL_STUDIO_VERSION_RE = re.compile(rb"\nVisualStudioVersion = ([0-9]+)[.]")
+
+    # Visual Studio versions per solution file (.sln) format version.
+    _VERSIONS_PER_FORMAT_VERSION = {
+        b"10.00": "2008",
+        b"11.00": "2010",
+        b"12.00": "2012",
     }
 
-    _SOLUTION_FILE_WRITERS = {
-        "2008": writers.VS2008SolutionFileWriter(),
-        "2010": writers.VS2010SolutionFileWriter(),
-        "2012": writers.VS2012SolutionFileWriter(),
-        "2013": writers.VS2013SolutionFileWriter(),
-        "2015": writers.VS2015SolutionFileWriter(),
-        "2017": writers.VS2017SolutionFileWriter(),
-        "2019": writers.VS2019SolutionFileWriter(),
-        "2022": writers.VS2022SolutionFileWriter(),
-        "2026": writers.VS2026SolutionFileWriter(),
+    # Visual Studio versions per major VisualStudioVersion of a solution file
+    # (.sln) with format version 12.00.
+    _VERSIONS_PER_VISUAL_STUDIO_VERSION = {
+        b"12": "2013",
+        b"14": "2015",
+        b"15": "2017",
+        b"16": "2019",
+        b"17": "2022",
     }
 
     # Visual Studio versions that use .vcproj extension for a project file.
@@ -72,6 +137,8 @@ class VSSolution:
         generate_python_dll=True,
         python_path="C:\\Python314",
         with_dokany=False,
+        cost_model=None,
+        executor=None,
     ):
         """Initializes a Visual Studio solution.
 
@@ -83,59 +150,164 @@ class VSSolution:
           python_path (Optional[str]): path to the Python installation.
           with_dokany (Optional[bool]): True if DokanY should be used instead
               of Dokan.
+          cost_model (Optional[CostModel]): cost model to schedule parallel
+              tasks with, where None represents a cost model without recorded
+              durations.
+          executor (Optional[concurrent.futures.ProcessPoolExecutor]): process
+              pool shared between conversions, where None represents that a
+              process pool is created per conversion, or once for the
+              asynchronous conversions until the solution is closed.
         """
         super().__init__()
+        # Process pool created for asynchronous conversions when no process
+        # pool is shared.
+        self._asynchronous_executor = None
+        self._cost_model = cost_model or scheduler.CostModel()
+        self._executor = executor
         self._extend_with_x64 = extend_with_x64
+        self._file_system_snapshot = filesystem.FileSystemSnapshot()
+        self._file_updater = filesystem.FileUpdater()
         self._generate_python_dll = generate_python_dll
+        # Previously parsed solution and project files, per type of file, input
+        # version of a project file and SHA-256 of the file data.
+        self._parsed_files = {}
         self._python_path = python_path
         self._with_dokany = with_dokany
+        self._write_behind_file_writer = None
+
+    def __getstate__(self):
+        """Retrieves the state of the solution for pickling.
+
+        Returns:
+          dict[str, object]: state of the solution without the process pools,
+              cost model, parsed files and write-behind file writer.
+        """
+        state = dict(self.__dict__)
+        state["_asynchronous_executor"] = None
+        state["_cost_model"] = None
+        state["_executor"] = None
+        state["_parsed_files"] = {}
+        state["_write_behind_file_writer"] = None
+        return state
+
+    async def __aenter__(self):
+        """Enters an asynchronous context.
+
+        Returns:
+          VSSolution: solution.
+        """
+        return self
+
+    async def __aexit__(self, exception_type, value, traceback):
+        """Exits an asynchronous context and closes the solution.
+
+        Args:
+          exception_type (type): exception type or None.
+          value (Exception): exception or None.
+          traceback (traceback): traceback or None.
+        """
+        # Closing waits for running worker processes, which should not block
+        # the event loop.
+        await asyncio.to_thread(self.Close)
+
+    def _AddParsedFile(self, key, parsed_file):
+        """Adds a parsed file as the most recently used parsed file.
+
+        Args:
+          key (tuple[str]): type of file, input version of a project file and
+              SHA-256 of the file data.
+          parsed_file (object): parsed file.
+        """
+        self._parsed_files[key] = parsed_file
+
+        while len(self._parsed_files) > self._MAXIMUM_NUMBER_OF_PARSED_FILES:
+            del self._parsed_files[next(iter(self._parsed_files))]
 
     def _ConvertProject(
         self,
         input_version,
         input_directory,
-        output_version,
+        output_versions,
         solution_project,
         solution_projects_by_guid,
+        project_file_data=None,
     ):
         """Converts a Visual Studio project.
 
+        The project is read once and written for every output version.
+
         Args:
           input_version (str): input version of the Visual Studio solution.
           input_directory (str): path of the input directory.
-          output_version (str): output Visual Studio version.
+          output_versions (list[str]): output Visual Studio versions.
           solution_project (VSSolutionProject): project.
           solution_projects_by_guid (dict[str, VSSolutionProject]): projects
               per lower case GUID.
+          project_file_data (Optional[bytes]): previously read data of the
+              project file, where None represents that the project file is read.
 
         Returns:
-          bool: True if the conversion successful or False if not.
+          tuple[bool, list[str]]: True if the conversion successful or False if
+              not and the lower case GUIDs of the projects the project depends on,
+              which are returned since a worker process converts a copy of the
+              project.
         """
         if not solution_project:
-            return False
+            return False, []
 
-        input_project_filename = input_directory
-        for path_segment in solution_project.filename.split("\\"):
-            input_project_filename = os.path.join(input_project_filename, path_segment)
+        input_project_filename = self._GetInputProjectFilename(
+            input_version, input_directory, solution_project
+        )
+        if not self._file_system_snapshot.Exists(input_project_filename):
+            return False, []
 
-        # TODO: move logic into the reader?
-        input_project_filename = self._GetProjectFilename(
-            input_version, input_project_filename
+        logging.info(f"Reading: {input_project_filename:s}")
+
+        if project_file_data is None:
+            with open(input_project_filename, "rb") as file_object:
+                project_file_data = file_object.read()
+
+        parsed_file_key = (
+            "project",
+            input_version,
+            hashlib.sha256(project_file_data).hexdigest(),
         )
-        if not os.path.exists(input_project_filename):
-            return False
+        project_information = self._GetParsedFile(parsed_file_key)
+        if not project_information:
+            file_object = io.BufferedReader(io.BytesIO(project_file_data))
 
-        project_reader = self._GetProjectFileReader(input_version)
+            project_version = self._DetectProjectVersion(file_object, input_version)
+            project_reader = self._GetProjectFileReader(project_version)
+            if not project_reader:
+                file_object.close()
+                return False, []
 
-        logging.info(f"Reading: {input_project_filename:s}")
+            project_reader.OpenFileObject(file_object)
 
-        project_reader.Open(input_project_filename)
+            if not project_reader.ReadHeader():
+                project_reader.Close()
+                logging.error(
+                    f"Unable to read project file: {input_project_filename:s} header."
+                )
+                return False, []
 
-        if not project_reader.ReadHeader():
-            return False
+            project_information = project_reader.ReadProject()
+            project_reader.Close()
 
-        project_information = project_reader.ReadProject()
-        project_reader.Close()
+            if not project_information:
+                return False, []
+
+            self._AddParsedFile(parsed_file_key, project_information)
+
+        # The project information is changed by the conversion.
+        project_information = copy.deepcopy(project_information)
+
+        # Only Visual Studio 2008 solution files define the project dependencies,
+        # otherwise these are defined by the project files.
+        if not solution_project.dependencies:
+            for dependency_guid in project_information.dependencies:
+                if dependency_guid in solution_projects_by_guid:
+                    solution_project.AddDependency(dependency_guid)
 
         if solution_project.name.endswith("mount"):
             include_path = "..\\..\\..\\dokan\\dokan"
@@ -197,18 +369,189 @@ class VSSolution:
                             f"{self._python_path:s}\\libs"
                         )
 
+        for output_version in output_versions:
+            output_project_information = copy.copy(project_information)
+            output_project_information.configurations = self._GetOutputConfigurations(
+                project_information.configurations, output_version
+            )
+            self._WriteProject(
+                output_version,
+                solution_project,
+                output_project_information,
+                solution_projects_by_guid,
+            )
+
+        return True, solution_project.dependencies
+
+    def _DetectProjectVersion(self, file_object, input_version):
+        """Detects the version of a project file.
+
+        Args:
+          file_object (io.BufferedReader): project file-like object.
+          input_version (str): input version of the Visual Studio solution.
+
+        Returns:
+          str: input version of the Visual Studio project or None if not
+              detected.
+        """
+        file_header = self._ReadFileHeader(file_object)
+
+        if b"<VisualStudioProject" in file_header:
+            if b'Version="9,00"' in file_header:
+                return "2008"
+
+            logging.error("Unsupported Visual Studio project file (.vcproj) version.")
+            return None
+
+        match = self._TOOLS_VERSION_RE.search(file_header)
+        if not match:
+            logging.error("Unable to detect Visual Studio project file version.")
+            return None
+
+        # Multiple Visual Studio versions use the same tools version, hence
+        # the input version of the solution is preferred.
+        tools_version = match.group(1).decode("ascii", errors="replace")
+        project_versions = [
+            version
+            for version in self._VERSIONS_THAT_USE_VCXPROJ
+            if self._PROJECT_FILE_READER_CLASSES[version].TOOLS_VERSION == tools_version
+        ]
+        if input_version in project_versions:
+            return input_version
+
+        if not project_versions:
+            logging.error(
+                f"Unsupported Visual Studio project file tools version: "
+                f"{tools_version:s}"
+            )
+            return None
+
+        return min(project_versions)
+
+    def _DetectSolutionVersion(self, file_object):
+        """Detects the version of a solution file.
+
+        Args:
+          file_object (io.BufferedReader): solution file-like object.
+
+        Returns:
+          str: input version of the Visual Studio solution or None if not
+              detected.
+        """
+        file_header = self._ReadFileHeader(file_object)
+
+        if b"<Solution" in file_header:
+            return "2026"
+
+        match = self._FORMAT_VERSION_RE.search(file_header)
+        if not match:
+            logging.error("Unable to detect Visual Studio solution file version.")
+            return None
+
+        format_version = match.group(1).decode("ascii", errors="replace")
+
+        input_version = self._VERSIONS_PER_FORMAT_VERSION.get(match.group(1), None)
+        if not input_version:
+            logging.error(
+                f"Unsupported Visual Studio solution file format version: "
+                f"{format_version:s}"
+            )
+            return None
+
+        if input_version == "2012":
+            match = self._VISUAL_STUDIO_VERSION_RE.search(file_header)
+            if match:
+                input_version = self._VERSIONS_PER_VISUAL_STUDIO_VERSION.get(
+                    match.group(1), None
+                )
+                if not input_version:
+                    # The solution file format did not change with later
+                    # Visual Studio versions, hence the file is read by the
+                    # format version 12.00 solution file reader.
+                    input_version = "2012"
+                    visual_studio_version = match.group(1).decode(
+                        "ascii", errors="replace"
+                    )
+                    logging.warning(
+                        f"Unsupported VisualStudioVersion: "
+                        f"{visual_studio_version:s} reading solution file as "
+                        f"format version 12.00."
+                    )
+
+        return input_version
+
+    def _GetFileSize(self, path):
+        """Retrieves the size of a file.
+
+        Args:
+          path (str): path of the file or None if not available.
+
+        Returns:
+          int: size of the file in bytes or 0 if not available.
+        """
+        if not path:
+            return 0
+
+        try:
+            return os.stat(path).st_size
+        except OSError:
+            return 0
+
+    def _GetInputProjectFilename(
+        self, input_version, input_directory, solution_project
+    ):
+        """Retrieves the path of an input project file.
+
+        Args:
+          input_version (str): input version of the Visual Studio solution.
+          input_directory (str): path of the input directory.
+          solution_project (VSSolutionProject): project.
+
+        Returns:
+          str: path of the project file or None if the input version is not
+              supported.
+        """
+        input_project_filename = input_directory
+        for path_segment in solution_project.filename.split("\\"):
+            input_project_filename = os.path.join(input_project_filename, path_segment)
+
+        # TODO: move logic into the reader?
+        return self._GetProjectFilename(input_version, input_project_filename)
+
+    def _GetOutputConfigurations(self, configurations, output_version):
+        """Retrieves the configurations of a specific output version.
+
+        Args:
+          configurations (VSConfigurations): configurations read from the input.
+          output_version (str): output Visual Studio version.
+
+        Returns:
+          VSConfigurations: configurations of the output version, which share
+              the configurations read from the input.
+        """
+        output_configurations = configurations.Copy()
+
         if self._extend_with_x64:
             # Add x64 as a platform.
-            project_information.configurations.ExtendWithX64(output_version)
+            output_configurations.ExtendWithX64(output_version)
 
-        self._WriteProject(
-            output_version,
-            solution_project,
-            project_information,
-            solution_projects_by_guid,
-        )
+        return output_configurations
 
-        return True
+    def _GetParsedFile(self, key):
+        """Retrieves a parsed file and marks it as the most recently used.
+
+        Args:
+          key (tuple[str]): type of file, input version of a project file and
+              SHA-256 of the file data.
+
+        Returns:
+          object: parsed file or None if not available.
+        """
+        parsed_file = self._parsed_files.pop(key, None)
+        if parsed_file:
+            self._parsed_files[key] = parsed_file
+
+        return parsed_file
 
     def _GetProjectFilename(self, version, project_filename):
         """Retrieves a Visual Studio version specific project filename.
@@ -229,7 +572,7 @@ class VSSolution:
         return None
 
     def _GetProjectFileReader(self, input_version):
-        """Retrieves a Visual Studio project file reader.
+        """Retrieves a new Visual Studio project file reader.
 
         Args:
           input_version (str): input version of the Visual Studio solution.
@@ -238,10 +581,14 @@ class VSSolution:
           VSProjectFileReader: Visual Studio project file reader or None if version
               is not supported.
         """
-        return self._PROJECT_FILE_READERS.get(input_version)
+        project_reader_class = self._PROJECT_FILE_READER_CLASSES.get(input_version)
+        if not project_reader_class:
+            return None
+
+        return project_reader_class()
 
     def _GetProjectFileWriter(self, output_version):
-        """Retrieves a Visual Studio project file writer.
+        """Retrieves a new Visual Studio project file writer.
 
         Args:
           output_version (str): output version of the Visual Studio solution.
@@ -250,7 +597,11 @@ class VSSolution:
           VSProjectFileWriter: Visual Studio project file writer or None if version
               is not supported.
         """
-        return self._PROJECT_FILE_WRITERS.get(output_version)
+        project_writer_class = self._PROJECT_FILE_WRITER_CLASSES.get(output_version)
+        if not project_writer_class:
+            return None
+
+        return project_writer_class()
 
     def _GetSolutionFilename(self, solution_name, output_version):
         """Determines the solution filename.
@@ -268,7 +619,7 @@ class VSSolution:
         return f"{solution_name:s}.sln"
 
     def _GetSolutionFileReader(self, input_version):
-        """Retrieves a Visual Studio solution file reader.
+        """Retrieves a new Visual Studio solution file reader.
 
         Args:
           input_version (str): input version of the Visual Studio solution.
@@ -277,10 +628,14 @@ class VSSolution:
           VSSolutionFileReader: Visual Studio solution file reader or None if
               version is not supported.
         """
-        return self._SOLUTION_FILE_READERS.get(input_version)
+        solution_reader_class = self._SOLUTION_FILE_READER_CLASSES.get(input_version)
+        if not solution_reader_class:
+            return None
+
+        return solution_reader_class()
 
     def _GetSolutionFileWriter(self, output_version):
-        """Retrieves a Visual Studio solution file writer.
+        """Retrieves a new Visual Studio solution file writer.
 
         Args:
           output_version (str): output version of the Visual Studio solution.
@@ -289,7 +644,200 @@ class VSSolution:
           VSSolutionFileWriter: Visual Studio solution file writer or None if
               version is not supported.
         """
-        return self._SOLUTION_FILE_WRITERS.get(output_version)
+        solution_writer_class = self._SOLUTION_FILE_WRITER_CLASSES.get(output_version)
+        if not solution_writer_class:
+            return None
+
+        return solution_writer_class()
+
+    def _LogFileSystemSnapshotCounters(self):
+        """Logs the counters of the file system snapshot.
+
+        Projects converted by worker processes use their own copy of the file
+        system snapshot, which are not included in the counters.
+        """
+        logging.debug(
+            f"File system snapshot: "
+            f"{self._file_system_snapshot.number_of_scandir_calls:d} scandir "
+            f"calls, {self._file_system_snapshot.number_of_avoided_calls:d} "
+            f"file system calls avoided."
+        )
+
+    def _MergeProjectDependencies(self, solution_projects, results):
+        """Merges the dependencies of converted projects into the solution.
+
+        Args:
+          solution_projects (list[VSSolutionProject]): projects.
+          results (iterator[tuple[bool, list[str]]]): result of the conversion
+              and GUIDs of the dependencies per project, in project order.
+
+        Returns:
+          bool: True if the conversion of every project was successful or False
+              if not, where the conversion stops at the first project that
+              failed.
+        """
+        for solution_project, (result, dependencies) in zip(solution_projects, results):
+            if not result:
+                return False
+
+            if not solution_project.dependencies:
+                for dependency_guid in dependencies:
+                    solution_project.AddDependency(dependency_guid)
+
+        return True
+
+    def _RunInParallel(self, jobs, method_name, tasks, task_costs=None):
+        """Runs a method for multiple tasks on a process pool.
+
+        Log messages emitted by a task are collected in the worker process and
+        logged by the calling process in task order, so that the log output
+        is ordered per task as if the tasks were run sequentially.
+
+        Args:
+          jobs (int): maximum number of worker processes, used when no shared
+              process pool was provided.
+          method_name (str): name of the method to run.
+          tasks (list[tuple[object]]): arguments of the method per task.
+          task_costs (Optional[list[tuple[str, float]]]): key and heuristic
+              cost per task, used to dispatch the tasks with the highest
+              estimated cost first and to record their duration in the cost
+              model, where None represents that the tasks are dispatched in
+              task order.
+
+        Yields:
+          object: result of the method per task, in task order.
+        """
+        log_level = logging.getLogger().getEffectiveLevel()
+        working_directory = os.getcwd()
+
+        dispatch_order = range(len(tasks))
+        if task_costs:
+            estimated_costs = [
+                self._cost_model.EstimateCost(key, heuristic_cost)
+                for key, heuristic_cost in task_costs
+            ]
+            dispatch_order = self._cost_model.GetDispatchOrder(estimated_costs)
+
+        executor = self._executor
+        if not executor:
+            executor = concurrent.futures.ProcessPoolExecutor(max_workers=jobs)
+
+        futures = [None] * len(tasks)
+        for task_index in dispatch_order:
+            futures[task_index] = executor.submit(
+                self._RunTask,
+                method_name,
+                log_level,
+                working_directory,
+                tasks[task_index],
+            )
+
+        try:
+            for task_index, future in enumerate(futures):
+                result, log_messages, duration = future.result()
+                for level, message in log_messages:
+                    logging.log(level, message)
+
+                if task_costs:
+                    key, heuristic_cost = task_costs[task_index]
+                    self._cost_model.AddDuration(key, heuristic_cost, duration)
+
+                yield result
+
+        finally:
+            for future in futures:
+                future.cancel()
+
+            if executor is not self._executor:
+                executor.shutdown()
+
+    def _RunTask(self, method_name, log_level, working_directory, task):
+        """Runs a method for a single task in a worker process.
+
+        Args:
+          method_name (str): name of the method to run.
+          log_level (int): log level of the calling process.
+          working_directory (str): working directory of the calling process,
+              since a worker process of a shared process pool can outlive a
+              change of the working directory.
+          task (tuple[object]): arguments of the method.
+
+        Returns:
+          tuple[object, list[tuple[int, str]], float]: result of the method,
+              the log level and message of the log messages emitted by the
+              method and the duration of the method in seconds.
+        """
+        if os.getcwd() != working_directory:
+            os.chdir(working_directory)
+
+        log_handler = LogMessagesCollector()
+
+        root_logger = logging.getLogger()
+        original_handlers = list(root_logger.handlers)
+        original_level = root_logger.level
+
+        root_logger.handlers = [log_handler]
+        root_logger.setLevel(log_level)
+
+        start_time = time.perf_counter()
+        try:
+            result = getattr(self, method_name)(*task)
+        finally:
+            root_logger.handlers = original_handlers
+            root_logger.setLevel(original_level)
+
+        duration = time.perf_counter() - start_time
+
+        return result, log_handler.messages, duration
+
+    async def _RunTaskAsync(self, method_name, working_directory, task):
+        """Runs a method for a single task in a worker process asynchronously.
+
+        The task runs on the shared process pool or on a process pool that is
+        created on first use and reused until the solution is closed, such
+        that it does not block the event loop. Cancelling a task that has not
+        started prevents it from running, a task that has started runs to
+        completion and its result is discarded.
+
+        Args:
+          method_name (str): name of the method to run.
+          working_directory (str): working directory to run the method in.
+          task (tuple[object]): arguments of the method.
+
+        Returns:
+          object: result of the method.
+        """
+        log_level = logging.getLogger().getEffectiveLevel()
+
+        executor = self._executor
+        if not executor:
+            if not self._asynchronous_executor:
+                self._asynchronous_executor = concurrent.futures.ProcessPoolExecutor()
+            executor = self._asynchronous_executor
+
+        future = executor.submit(
+            self._RunTask, method_name, log_level, working_directory, task
+        )
+        result, log_messages, _ = await asyncio.wrap_future(future)
+
+        for level, message in log_messages:
+            logging.log(level, message)
+
+        return result
+
+    def _ReadFileHeader(self, file_object):
+        """Reads the start of a file without consuming it.
+
+        The data is peeked at so that the file-like object can be passed to
+        a file reader without reopening the file.
+
+        Args:
+          file_object (io.BufferedReader): file-like object.
+
+        Returns:
+          bytes: data at the start of the file.
+        """
+        return file_object.peek(self._FILE_HEADER_SIZE)[: self._FILE_HEADER_SIZE]
 
     def _WriteProject(
         self,
@@ -297,6 +845,8 @@ class VSSolution:
         solution_project,
         project_information,
         solution_projects_by_guid,
+        project_data=None,
+        return_project_data=False,
     ):
         """Writes a Visual Studio project file.
 
@@ -306,6 +856,14 @@ class VSSolution:
           project_information (VSProjectInformation): project information.
           solution_projects_by_guid (dict[str, VSSolutionProject]): projects
               per lower case GUID.
+          project_data (Optional[bytes]): previously rendered data of the project
+              file, where None represents that the project file is rendered.
+          return_project_data (Optional[bool]): True if the data of the project
+              file should be returned.
+
+        Returns:
+          bytes: data of the project file if return_project_data is True or None
+              otherwise.
         """
         output_project_filename = f"vs{output_version:s}"
         for path_segment in solution_project.filename.split("\\"):
@@ -318,13 +876,53 @@ class VSSolution:
             output_version, output_project_filename
         )
         output_directory = os.path.dirname(output_project_filename)
-        os.mkdir(output_directory)
-
-        project_writer = self._GetProjectFileWriter(output_version)
+        os.makedirs(output_directory, exist_ok=True)
 
         logging.info(f"Writing: {output_project_filename:s}")
 
-        project_writer.Open(output_project_filename)
+        if project_data is None:
+            project_writer = self._GetProjectFileWriter(output_version)
+
+            # Render the project file in memory so that it is only written when
+            # changed and its data can be returned or written behind.
+            file_object = io.BytesIO()
+            project_writer.OpenFileObject(file_object)
+            self._WriteProjectFile(
+                project_writer,
+                solution_project,
+                project_information,
+                solution_projects_by_guid,
+            )
+            project_data = file_object.getvalue()
+
+        if self._write_behind_file_writer:
+            self._write_behind_file_writer.WriteFile(
+                output_project_filename, project_data
+            )
+        else:
+            self._file_updater.UpdateFile(output_project_filename, project_data)
+
+        if not return_project_data:
+            return None
+
+        return project_data
+
+    def _WriteProjectFile(
+        self,
+        project_writer,
+        solution_project,
+        project_information,
+        solution_projects_by_guid,
+    ):
+        """Writes a Visual Studio project file and closes the writer.
+
+        Args:
+          project_writer (VSProjectFileWriter): opened project file writer.
+          solution_project (VSSolutionProject): project.
+          project_information (VSProjectInformation): project information.
+          solution_projects_by_guid (dict[str, VSSolutionProject]): projects
+              per lower case GUID.
+        """
         project_writer.WriteHeader()
         project_writer.WriteProjectConfigurations(project_information.configurations)
         project_writer.WriteProjectInformation(project_information)
@@ -356,14 +954,18 @@ class VSSolution:
           solution_configurations (VSConfigurations): configurations.
         """
         output_directory = f"vs{output_version:s}"
-        os.mkdir(output_directory)
+        os.makedirs(output_directory, exist_ok=True)
 
         output_sln_filename = os.path.join(output_directory, solution_filename)
 
         logging.info(f"Writing: {output_sln_filename:s}")
 
+        # Render the solution file in memory so that it is only written when
+        # changed.
+        file_object = io.BytesIO()
+
         solution_writer = self._GetSolutionFileWriter(output_version)
-        solution_writer.Open(output_sln_filename)
+        solution_writer.OpenFileObject(file_object)
         solution_writer.WriteHeader()
 
         if output_version == "2026":
@@ -380,34 +982,117 @@ class VSSolution:
         solution_writer.WriteFooter()
         solution_writer.Close()
 
-    def Convert(self, input_sln_path, output_version):
+        self._file_updater.UpdateFile(output_sln_filename, file_object.getvalue())
+
+    def Close(self):
+        """Closes the solution.
+
+        Shuts down the process pool created for asynchronous conversions, if
+        any. Tasks that have not started are cancelled and tasks that have
+        started are waited for. A shared process pool is not shut down.
+        """
+        if self._asynchronous_executor:
+            self._asynchronous_executor.shutdown(cancel_futures=True)
+            self._asynchronous_executor = None
+
+    def Convert(self, input_sln_path, output_version, jobs=1):
         """Converts a Visual Studio solution.
 
         Args:
           input_sln_path (str): path of the Visual Studio solution file.
           output_version (str): output Visual Studio version.
+          jobs (Optional[int]): maximum number of projects to convert at the same
+              time.
+
+        Returns:
+          bool: True if the conversion successful or False if not.
+        """
+        return self.ConvertToVersions(input_sln_path, [output_version], jobs=jobs)
+
+    async def ConvertAsync(
+        self, input_sln_path, output_version, semaphore=None, working_directory=None
+    ):
+        """Converts a Visual Studio solution asynchronously.
+
+        Args:
+          input_sln_path (str): path of the Visual Studio solution file.
+          output_version (str): output Visual Studio version.
+          semaphore (Optional[asyncio.Semaphore]): semaphore to limit the number
+              of conversions that run at the same time, where None represents
+              no limit.
+          working_directory (Optional[str]): directory to write the output in,
+              where None represents the current working directory.
 
         Returns:
           bool: True if the conversion successful or False if not.
         """
-        if not os.path.exists(input_sln_path):
+        return await self.ConvertToVersionsAsync(
+            input_sln_path,
+            [output_version],
+            semaphore=semaphore,
+            working_directory=working_directory,
+        )
+
+    def ConvertToVersions(self, input_sln_path, output_versions, jobs=1):
+        """Converts a Visual Studio solution to multiple versions.
+
+        The solution and its projects are read once and written for every
+        output version.
+
+        Args:
+          input_sln_path (str): path of the Visual Studio solution file.
+          output_versions (list[str]): output Visual Studio versions.
+          jobs (Optional[int]): maximum number of projects to convert at the same
+              time.
+
+        Returns:
+          bool: True if the conversion successful or False if not.
+        """
+        self._file_system_snapshot = filesystem.FileSystemSnapshot()
+
+        if not self._file_system_snapshot.Exists(input_sln_path):
             return False
 
         logging.info(f"Reading: {input_sln_path:s}")
 
-        # TODO: detect input version based on solution file reader?
-        input_version = "2008"
+        with open(input_sln_path, "rb") as file_object:
+            solution_file_data = file_object.read()
 
-        solution_reader = self._GetSolutionFileReader(input_version)
+        parsed_file_key = ("solution", hashlib.sha256(solution_file_data).hexdigest())
+        parsed_solution = self._GetParsedFile(parsed_file_key)
+        if not parsed_solution:
+            file_object = io.BufferedReader(io.BytesIO(solution_file_data))
 
-        solution_reader.Open(input_sln_path)
+            input_version = self._DetectSolutionVersion(file_object)
+            solution_reader = self._GetSolutionFileReader(input_version)
+            if not solution_reader:
+                file_object.close()
+                return False
 
-        if not solution_reader.ReadHeader():
-            return False
+            solution_reader.OpenFileObject(file_object)
 
-        solution_projects = solution_reader.ReadProjects()
-        solution_configurations = solution_reader.ReadConfigurations()
-        solution_reader.Close()
+            if not solution_reader.ReadHeader():
+                solution_reader.Close()
+                logging.error(
+                    f"Unable to read solution file: {input_sln_path:s} header."
+                )
+                return False
+
+            solution_projects = solution_reader.ReadProjects()
+            solution_configurations = solution_reader.ReadConfigurations()
+            solution_reader.Close()
+
+            parsed_solution = (
+                input_version,
+                solution_projects,
+                solution_configurations,
+            )
+            self._AddParsedFile(parsed_file_key, parsed_solution)
+
+        # The solution projects are changed by the conversion.
+        input_version, solution_projects, solution_configurations = copy.deepcopy(
+            parsed_solution
+        )
 
         if not self._generate_python_dll:
             python_module_project = None
@@ -418,35 +1103,134 @@ class VSSolution:
             if python_module_project:
                 solution_projects.remove(python_module_project)
 
-        if self._extend_with_x64:
-            # Add x64 as a platform.
-            solution_configurations.ExtendWithX64(output_version)
-
-        solution_name, _, _ = os.path.basename(input_sln_path).rpartition(".")
-        solution_filename = self._GetSolutionFilename(solution_name, output_version)
-
-        self._WriteSolution(
-            solution_filename,
-            output_version,
-            solution_projects,
-            solution_configurations,
-        )
         input_directory = os.path.dirname(input_sln_path)
 
         solution_projects_by_guid = {}
         for solution_project in solution_projects:
             solution_projects_by_guid[solution_project.guid] = solution_project
 
-        result = True
-        for solution_project in solution_projects:
-            result = self._ConvertProject(
+        tasks = [
+            (
                 input_version,
                 input_directory,
-                output_version,
+                output_versions,
                 solution_project,
                 solution_projects_by_guid,
             )
-            if not result:
-                break
+            for solution_project in solution_projects
+        ]
+
+        if jobs > 1:
+            task_costs = []
+            for solution_project in solution_projects:
+                input_project_filename = self._GetInputProjectFilename(
+                    input_version, input_directory, solution_project
+                )
+                key = ":".join(
+                    [
+                        "_ConvertProject",
+                        os.path.abspath(input_project_filename or ""),
+                        *output_versions,
+                    ]
+                )
+                heuristic_cost = self._cost_model.GetHeuristicCost(
+                    input_size=self._GetFileSize(input_project_filename),
+                    number_of_configurations=(
+                        solution_configurations.number_of_configurations
+                    ),
+                    number_of_outputs=len(output_versions),
+                )
+                task_costs.append((key, heuristic_cost))
+
+            results = self._RunInParallel(
+                jobs, "_ConvertProject", tasks, task_costs=task_costs
+            )
+            result = self._MergeProjectDependencies(solution_projects, results)
+
+        else:
+            # Overlap reading the upcoming project files and writing the output
+            # project files with converting the current project.
+            input_project_filenames = [
+                self._GetInputProjectFilename(
+                    input_version, input_directory, solution_project
+                )
+                for solution_project in solution_projects
+            ]
+            read_ahead_file_reader = pipeline.ReadAheadFileReader()
+            read_ahead_files = read_ahead_file_reader.ReadFiles(input_project_filenames)
+
+            self._write_behind_file_writer = pipeline.WriteBehindFileWriter()
+            self._write_behind_file_writer.Open()
+
+            try:
+                # A project file that could not be read ahead is read again
+                # by _ConvertProject, such that it handles the error.
+                results = (
+                    self._ConvertProject(*task, project_file_data=project_file_data)
+                    for task, (project_file_data, _) in zip(tasks, read_ahead_files)
+                )
+                result = self._MergeProjectDependencies(solution_projects, results)
+
+            finally:
+                read_ahead_files.close()
+
+                write_behind_file_writer = self._write_behind_file_writer
+                self._write_behind_file_writer = None
+                write_behind_file_writer.Close()
+
+        # The solution is written after the projects have been converted, since
+        # the dependencies of a Visual Studio 2008 solution are only known after
+        # reading the project files of a Visual Studio 2010 or later solution.
+        solution_name, _, _ = os.path.basename(input_sln_path).rpartition(".")
+
+        for output_version in output_versions:
+            output_configurations = self._GetOutputConfigurations(
+                solution_configurations, output_version
+            )
+            solution_filename = self._GetSolutionFilename(solution_name, output_version)
+
+            self._WriteSolution(
+                solution_filename,
+                output_version,
+                solution_projects,
+                output_configurations,
+            )
+
+        self._LogFileSystemSnapshotCounters()
 
         return result
+
+    async def ConvertToVersionsAsync(
+        self, input_sln_path, output_versions, semaphore=None, working_directory=None
+    ):
+        """Converts a Visual Studio solution to multiple versions asynchronously.
+
+        The conversion, including reading and writing the files, runs in a
+        worker process such that it does not block the event loop. Since the
+        output is written relative to the working directory of the worker
+        process, multiple conversions can run at the same time from the same
+        event loop. The solution should be closed afterwards, for example by
+        using it as an asynchronous context manager.
+
+        Args:
+          input_sln_path (str): path of the Visual Studio solution file,
+              relative to the working directory.
+          output_versions (list[str]): output Visual Studio versions.
+          semaphore (Optional[asyncio.Semaphore]): semaphore to limit the number
+              of conversions that run at the same time, where None represents
+              no limit.
+          working_directory (Optional[str]): directory to write the output in,
+              where None represents the current working directory.
+
+        Returns:
+          bool: True if the conversion successful or False if not.
+        """
+        if working_directory is None:
+            working_directory = os.getcwd()
+
+        async with semaphore or contextlib.nullcontext():
+            return await self._RunTaskAsync(
+                "ConvertToVersions",
+                working_directory,
+                (input_sln_path, output_versions),
+            )
@@ -7,23 +7,56 @@ from vstools import definitions
 
 
 class FileWriter:
-    """File writer."""
+    """File writer.
 
-    def __init__(self, encoding="utf-8", end_of_line="\r\n"):
+    By default the data written to a file is buffered in memory and written
+    to the file with a single write on close, instead of a write per line.
+    """
+
+    def __init__(self, encoding="utf-8", end_of_line="\r\n", buffered=True):
         """Initializes a file writer.
 
         Args:
           encoding (str): encoding.
           end_of_line (str): end of line.
+          buffered (Optional[bool]): True if the data written should be buffered
+              in memory until the file is closed.
         """
         super().__init__()
+        self._buffer = bytearray()
+        self._buffered = buffered
         self._encoding = encoding
         self._end_of_line = end_of_line
         self._file = None
+        self._owns_file_object = False
+        self._is_buffering = False
+        self._number_of_write_calls = 0
+
+    @property
+    def number_of_write_calls(self):
+        """int: number of write calls to the file since it was opened."""
+        return self._number_of_write_calls
+
+    def _FlushBuffer(self):
+        """Writes the buffered data to the file."""
+        if self._buffer:
+            self._file.write(self._buffer)
+            self._number_of_write_calls += 1
+
+            # Clear the buffer in place so that it can be reused.
+            del self._buffer[:]
 
     def Close(self):
         """Closes the project file."""
-        self._file.close()
+        if self._is_buffering:
+            self._FlushBuffer()
+            self._is_buffering = False
+
+        if self._owns_file_object:
+            self._file.close()
+
+        self._file = None
+        self._owns_file_object = False
 
     def Open(self, filename):
         """Opens the project file.
@@ -32,7 +65,23 @@ class FileWriter:
           filename (str): path of the file.
         """
         # Using binary mode to make sure to write Windows/DOS end of lines.
-        self._file = open(filename, "wb")  # pylint: disable=consider-using-with
+        file_object = open(filename, "wb")  # pylint: disable=consider-using-with
+
+        self.OpenFileObject(file_object)
+        self._owns_file_object = True
+
+    def OpenFileObject(self, file_object):
+        """Opens the project file using a file-like object.
+
+        The file-like object is not closed by the writer.
+
+        Args:
+          file_object (file): file-like object opened in binary mode.
+        """
+        self._file = file_object
+        self._owns_file_object = False
+        self._is_buffering = self._buffered
+        self._number_of_write_calls = 0
 
     def WriteBinaryData(self, data):
         """Writes binary data.
@@ -40,7 +89,11 @@ class FileWriter:
         Args:
           data (bytes): binary data.
         """
-        self._file.write(data)
+        if self._is_buffering:
+            self._buffer.extend(data)
+        else:
+            self._file.write(data)
+            self._number_of_write_calls += 1
 
     def WriteLine(self, line):
         """Writes a line."""
@@ -50,21 +103,24 @@ class FileWriter:
 
     def WriteLines(self, lines):
         """Writes lines."""
-        for line in lines:
-            self.WriteLine(line)
+        lines = "".join([f"{line:s}{self._end_of_line:s}" for line in lines])
+        lines = lines.encode(self._encoding)
+        self.WriteBinaryData(lines)
 
 
 class VSProjectFileWriter(FileWriter):
     """Visual Studio project file writer."""
 
-    def __init__(self, encoding="utf-8", end_of_line="\r\n"):
+    def __init__(self, encoding="utf-8", end_of_line="\r\n", buffered=True):
         """Initializes a Visual Studio project file writer.
 
         Args:
           encoding (str): encoding.
           end_of_line (str): end of line.
+          buffered (Optional[bool]): True if the data written should be buffered
+              in memory until the file is closed.
         """
-        super().__init__(encoding=encoding, end_of_line=end_of_line)
+        super().__init__(encoding=encoding, end_of_line=end_of_line, buffered=buffered)
 
     @abc.abstractmethod
     def WriteFooter(self):
@@ -121,7 +177,6 @@ class VS2008ProjectFileWriter(VSProjectFileWriter):
         ("RandomizedBaseAddress", "randomized_base_address", True),
         ("DataExecutionPrevention", "data_execution_prevention", True),
         ("TargetMachine", "target_machine", True),
-        ("ImportLibrary", "import_library", True),
     ]
 
     def __init__(self):
@@ -218,8 +273,13 @@ class VS2008ProjectFileWriter(VSProjectFileWriter):
                 project_configuration, definition, name, is_optional, 4
             )
 
+        # The output directory is always added, hence it is removed from the
+        # library directories to prevent it from being written twice.
         library_directories = ["&quot;$(OutDir)&quot;"]
-        library_directories.extend(project_configuration.library_directories)
+        for library_directory in project_configuration.library_directories:
+            if library_directory.replace("&quot;", "").rstrip("\\") != "$(OutDir)":
+                library_directories.append(library_directory)
+
         library_directories = ";".join(library_directories)
 
         self.WriteLine(
@@ -230,6 +290,20 @@ class VS2008ProjectFileWriter(VSProjectFileWriter):
                 project_configuration, definition, name, is_optional, 4
             )
 
+        import_library = project_configuration.import_library
+        if (
+            not import_library
+            and project_configuration.output_type
+            == definitions.OUTPUT_TYPE_DYNAMIC_LIBRARY
+        ):
+            # Note that the Visual Studio 2008 project file reader does not read
+            # the import library and the Visual Studio 2010 and later project
+            # file readers do not read the import library the writers add.
+            import_library = "$(OutDir)\\$(ProjectName).lib"
+
+        if import_library:
+            self.WriteLine(f'\t\t\t\tImportLibrary="{import_library:s}"')
+
         self._WriteConfigurationToolFooter()
 
     def _WriteConfigurationOption(
@@ -1197,11 +1271,11 @@ class VS2010ProjectFileWriter(VSProjectFileWriter):
         self.WriteLines(lines)
 
         # The last line has no \r\n.
-        self._file.write(b"</Project>")
+        self.WriteBinaryData(b"</Project>")
 
     def WriteHeader(self):
         """Writes a file header."""
-        self._file.write(b"\xef\xbb\xbf")
+        self.WriteBinaryData(b"\xef\xbb\xbf")
 
         lines = [
             '<?xml version="1.0" encoding="utf-8"?>',